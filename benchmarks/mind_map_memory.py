@@ -0,0 +1,82 @@
+"""Benchmark: resident bytes per node for a large EpistemicMindMap.
+
+Usage::
+
+    python benchmarks/mind_map_memory.py [num_nodes]
+
+Builds a map shaped like a large research run (a few perspectives and
+questions, many EVIDENCE nodes hanging off them) and reports the memory
+traced by ``tracemalloc`` per node, with and without the text payload.
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from kresearch.core import (  # noqa: E402
+    ConfidenceLevel,
+    EpistemicMindMap,
+    MindMapNode,
+    NodeType,
+)
+
+_PERSPECTIVES = ["Economic", "Technical", "Regulatory", "Historical", "Ethical"]
+
+
+def build_map(num_nodes: int) -> EpistemicMindMap:
+    """Return a mind map with *num_nodes* nodes in total."""
+    mind_map = EpistemicMindMap()
+    questions = []
+    for i in range(max(num_nodes // 100, 1)):
+        perspective = _PERSPECTIVES[i % len(_PERSPECTIVES)]
+        node = MindMapNode(
+            node_type=NodeType.QUESTION,
+            content=f"Question {i}",
+            perspectives=[f"{perspective}"],
+        )
+        mind_map.add_node(node)
+        questions.append(node.id)
+    for i in range(num_nodes - len(questions)):
+        parent = questions[i % len(questions)]
+        node = MindMapNode(
+            node_type=NodeType.EVIDENCE,
+            content=f"Snippet {i}",
+            confidence=ConfidenceLevel.UNVERIFIED,
+            sources=[f"https://example.org/doc/{i}"],
+            perspectives=[f"{_PERSPECTIVES[i % len(_PERSPECTIVES)]}"],
+            metadata={"task": parent},
+        )
+        mind_map.add_node(node)
+        mind_map.add_edge(parent, node.id, "".join(["supported", "_by"]))
+    return mind_map
+
+
+def payload_bytes(mind_map: EpistemicMindMap) -> int:
+    """Size of the per-node strings that any representation must hold."""
+    total = 0
+    for node in mind_map._nodes.values():
+        total += sys.getsizeof(node.id) + sys.getsizeof(node.content)
+        total += sum(sys.getsizeof(s) for s in node.sources)
+    return total
+
+
+def main(num_nodes: int = 100_000) -> None:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    mind_map = build_map(num_nodes)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    payload = payload_bytes(mind_map)
+    print(f"nodes:                    {num_nodes:,}")
+    print(f"total traced:             {used / 1e6:,.1f} MB")
+    print(f"bytes per node:           {used / num_nodes:,.0f}")
+    print(f"bytes per node (no text): {(used - payload) / num_nodes:,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
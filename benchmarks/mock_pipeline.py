@@ -0,0 +1,80 @@
+"""Benchmark: wall-clock time of a full pipeline against mock providers.
+
+Usage::
+
+    python benchmarks/mock_pipeline.py [QUERY] [--latency S] [--distribution D]
+        [--failure-rate P] [--token-latency S] [--tokens N] [--seed N] [--repeat N]
+
+Runs ``PhaseRunner`` end to end with the ``mock`` LLM and search
+providers, so no API keys or network are needed.  Responses are
+deterministic per request and latencies and failures are seeded, and
+retry backoff runs without jitter, so runs with the same arguments are
+comparable: use it to measure scheduler, caching and concurrency
+changes on air-gapped machines.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from kresearch.config import load_config  # noqa: E402
+from kresearch.core import EventBus  # noqa: E402
+from kresearch.llm.mock_provider import MockLLMProvider  # noqa: E402
+from kresearch.phases.runner import PhaseRunner  # noqa: E402
+from kresearch.search.mock_provider import MockSearchProvider  # noqa: E402
+
+_QUERY = "How has grid-scale battery storage changed electricity markets?"
+
+
+async def run_once(query: str, args: argparse.Namespace) -> tuple[float, dict]:
+    """Run the pipeline once; return elapsed seconds and mock-call stats."""
+    config = load_config()
+    config.checkpoint.enabled = False
+    config.trace.record = False
+    config.resilience.jitter = False
+    timing = dict(latency=args.latency, distribution=args.distribution,
+                  failure_rate=args.failure_rate, seed=args.seed)
+    llm = MockLLMProvider(token_latency=args.token_latency,
+                          output_tokens=args.tokens, **timing)
+    search = MockSearchProvider(**timing)
+    ctx = {"config": config, "event_bus": EventBus(), "session": None,
+           "llm_factory": lambda name, **kw: llm,
+           "search_factory": lambda name, **kw: search}
+    start = time.perf_counter()
+    await PhaseRunner(ctx).run(query)
+    elapsed = time.perf_counter() - start
+    return elapsed, {"llm": llm.timing.stats, "search": search.timing.stats}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("query", nargs="?", default=_QUERY)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--distribution", default="lognormal")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--token-latency", type=float, default=0.0)
+    parser.add_argument("--tokens", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    runs = [asyncio.run(run_once(args.query, args)) for _ in range(args.repeat)]
+    timings = [elapsed for elapsed, _ in runs]
+    stats = runs[-1][1]
+    print(f"runs:    {len(timings)}")
+    print(f"median:  {statistics.median(timings):.3f} s")
+    print(f"min/max: {min(timings):.3f} / {max(timings):.3f} s")
+    for kind, s in stats.items():
+        print(f"{kind + ':':<8} {s['calls']} calls, {s['failures']} failures, "
+              f"{s['latency']:.1f} s simulated")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark: wall-clock time of a full pipeline replayed from a trace.
+
+Usage::
+
+    python benchmarks/replay_trace.py TRACE [--realtime] [--speed N] [--repeat N]
+
+Replays a trace recorded with ``trace.record`` (or ``/trace on``)
+through ``PhaseRunner.replay`` with no network access.  Without
+``--realtime`` only local work (scheduling, mind-map updates,
+serialisation) is measured; with it, recorded provider latencies are
+reproduced, so scheduler and caching changes can be compared against
+the original run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from kresearch.config import load_config  # noqa: E402
+from kresearch.core import EventBus  # noqa: E402
+from kresearch.phases.runner import PhaseRunner  # noqa: E402
+
+
+async def replay_once(trace: str, realtime: bool, speed: float) -> float:
+    """Replay *trace* once and return the elapsed seconds."""
+    config = load_config()
+    config.checkpoint.enabled = False
+    config.trace.record = False
+    ctx = {"config": config, "event_bus": EventBus(), "session": None}
+    start = time.perf_counter()
+    await PhaseRunner(ctx).replay(trace, realtime=realtime, speed=speed)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trace")
+    parser.add_argument("--realtime", action="store_true")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    timings = [
+        asyncio.run(replay_once(args.trace, args.realtime, args.speed))
+        for _ in range(args.repeat)
+    ]
+    print(f"runs:    {len(timings)}")
+    print(f"median:  {statistics.median(timings):.3f} s")
+    print(f"min/max: {min(timings):.3f} / {max(timings):.3f} s")
+
+
+if __name__ == "__main__":
+    main()
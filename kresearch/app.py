@@ -57,13 +57,19 @@ async def _async_main() -> None:
     """Main async REPL loop."""
     from kresearch.config import load_config
     from kresearch.core.event_bus import EventBus
+    from kresearch.phases.provider_pool import ProviderPool
 
     config = load_config()
-    event_bus = EventBus()
+    event_bus = EventBus(
+        async_dispatch=config.events.async_dispatch,
+        queue_size=config.events.queue_size,
+        policies=config.events.policies,
+    )
     ctx: dict = {
         "config": config,
         "event_bus": event_bus,
         "session": None,
+        "providers": ProviderPool(),
     }
 
     _print_banner()
@@ -99,6 +105,11 @@ async def _async_main() -> None:
         else:
             await _run_research(line, ctx)
 
+    await ctx["providers"].aclose()
+    if ctx.get("llm_cache") is not None:
+        ctx["llm_cache"].close()
+    await event_bus.aclose()
+
 
 def main() -> None:
     """Synchronous entry point — runs the async REPL."""
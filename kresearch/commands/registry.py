@@ -61,4 +61,5 @@ def _ensure_commands_loaded() -> None:
         help_cmd,
         rag_cmd,
         session_cmd,
+        trace_cmd,
     )
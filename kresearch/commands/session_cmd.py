@@ -16,13 +16,15 @@ _USAGE = (
     "[bold]Usage:[/bold]\n"
     "  /session info    Show current session details\n"
     "  /session export  Export session state to JSON\n"
-    "  /session reset   Clear the current session"
+    "  /session reset   Clear the current session\n"
+    "  /session list    List checkpointed sessions\n"
+    "  /session resume <id>  Resume a checkpointed session"
 )
 
 
 @command("session", "Session management")
 async def handle_session(args: str, ctx: dict) -> None:
-    """Handle ``/session <info|export|reset>``."""
+    """Handle ``/session <info|export|reset|list|resume>``."""
     parts = args.strip().split()
     sub = parts[0].lower() if parts else ""
 
@@ -32,6 +34,10 @@ async def handle_session(args: str, ctx: dict) -> None:
         await _export(ctx)
     elif sub == "reset":
         _reset(ctx)
+    elif sub == "list":
+        _list(ctx)
+    elif sub == "resume" and len(parts) > 1:
+        await _resume(parts[1], ctx)
     else:
         console.print(_USAGE)
 
@@ -88,6 +94,7 @@ async def _export(ctx: dict) -> None:
         "perspectives": session.perspectives,
         "task_graph": session.task_graph.to_dict(),
         "mind_map": session.mind_map.to_dict(),
+        "usage": session.usage.to_dict(),
         "final_report": session.final_report,
     }
 
@@ -103,3 +110,33 @@ def _reset(ctx: dict) -> None:
 
     ctx["session"] = None
     console.print("[green]Session cleared.[/green]")
+
+
+def _list(ctx: dict) -> None:
+    """List sessions that have a checkpoint on disk."""
+    from kresearch.core.checkpoint import default_store
+
+    store = default_store(ctx["config"])
+    entries = store.list_sessions() if store else []
+    if not entries:
+        console.print("[yellow]No checkpointed sessions.[/yellow]")
+        return
+
+    table = Table(title="Checkpointed Sessions")
+    table.add_column("ID", style="bold cyan")
+    table.add_column("Phases", justify="right")
+    table.add_column("Query")
+    for entry in entries:
+        table.add_row(entry["id"][:8], f"{entry['phase_index']}/5",
+                      entry["query"][:60])
+    console.print(table)
+
+
+async def _resume(session_id: str, ctx: dict) -> None:
+    """Resume a checkpointed session at its first incomplete phase."""
+    from kresearch.phases.runner import PhaseRunner
+
+    try:
+        await PhaseRunner(ctx).resume(session_id)
+    except FileNotFoundError as exc:
+        console.print(f"[red]{exc}[/red]")
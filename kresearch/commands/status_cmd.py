@@ -8,6 +8,7 @@ from rich.table import Table
 from rich.text import Text
 
 from kresearch.commands.registry import command
+from kresearch.commands.status_runtime import print_runtime_panels
 
 console = Console()
 
@@ -82,3 +83,5 @@ async def handle_status(args: str, ctx: dict) -> None:
         f"Final report: {'Yes' if session.final_report else 'No'}"
     )
     console.print(Panel(extras, title="Artifacts", border_style="green"))
+
+    print_runtime_panels(ctx, console)
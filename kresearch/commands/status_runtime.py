@@ -0,0 +1,144 @@
+"""Runtime panels for /status (event queues and other live metrics)."""
+
+from __future__ import annotations
+
+from rich.console import Console
+from rich.table import Table
+
+_TOP_SITES = 8
+
+
+def print_runtime_panels(ctx: dict, console: Console) -> None:
+    """Print every runtime metrics panel that has data to show."""
+    _print_usage(ctx, console)
+    _print_llm_cache(ctx, console)
+    _print_limiters(ctx, console)
+    _print_routing(ctx, console)
+    _print_resilience(ctx, console)
+    _print_event_queues(ctx, console)
+
+
+def _print_usage(ctx: dict, console: Console) -> None:
+    """Token, latency and cost breakdown by phase and by top call sites."""
+    session = ctx.get("session")
+    usage = getattr(session, "usage", None)
+    if usage is None or not usage.totals["calls"]:
+        return
+    table = Table(title="LLM Usage", header_style="bold cyan")
+    table.add_column("Scope", style="bold")
+    for column in ("Calls", "Cached", "In tok", "Prefix-cached", "Out tok",
+                   "Latency", "Cost"):
+        table.add_column(column, justify="right")
+    sites = sorted(usage.breakdown["site"].items(),
+                   key=lambda kv: kv[1]["input_tokens"] + kv[1]["output_tokens"],
+                   reverse=True)[:_TOP_SITES]
+    rows = [*sorted(usage.breakdown["phase"].items()), *sites,
+            ("total", usage.totals)]
+    for name, b in rows:
+        table.add_row(
+            name, str(b["calls"]), str(b["cached"]), f"{b['input_tokens']:,}",
+            f"{b['cached_input_tokens']:,}", f"{b['output_tokens']:,}",
+            f"{b['latency']:.1f}s", f"${b['cost']:.4f}",
+        )
+    console.print(table)
+    budget = ctx.get("budget")
+    if budget is not None and (budget.max_tokens or budget.max_cost):
+        console.print(f"Budget remaining: {budget.remaining():.0%}")
+
+
+def _print_llm_cache(ctx: dict, console: Console) -> None:
+    """Hit/miss counters of the on-disk LLM response cache."""
+    store = ctx.get("llm_cache")
+    if store is None:
+        return
+    m = store.metrics()
+    table = Table(title="LLM Cache", header_style="bold cyan")
+    table.add_column("Metric", style="bold")
+    table.add_column("Value", justify="right")
+    table.add_row("Entries", str(m["entries"]))
+    table.add_row("Hits", f"[green]{m['hits']}[/green]")
+    table.add_row("Misses", str(m["misses"]))
+    table.add_row("Hit rate", f"{m['hit_rate']:.0%}")
+    table.add_row("Bypassed (temperature > 0)", str(m["skipped"]))
+    table.add_row("Expired / evicted", f"{m['expired']} / {m['evicted']}")
+    console.print(table)
+
+
+def _print_limiters(ctx: dict, console: Console) -> None:
+    """Live limits, in-flight and queued calls per global/provider/model level."""
+    tree = ctx.get("limiters")
+    if tree is None:
+        return
+    table = Table(title="Concurrency", header_style="bold cyan")
+    table.add_column("Level", style="bold")
+    table.add_column("Name")
+    for column in ("Limit", "In flight", "Queued", "Latency", "Cuts"):
+        table.add_column(column, justify="right")
+    for m in tree.metrics():
+        adaptive = m["adaptive"]
+        table.add_row(
+            m["level"], m["name"], str(m["limit"]), str(m["in_flight"]),
+            f"[yellow]{m['queued']}[/yellow]" if m["queued"] else "0",
+            f"{m['latency']:.2f}s" if adaptive else "-",
+            f"[red]{m['decreases']}[/red]" if adaptive else "-",
+        )
+    console.print(table)
+    for name, m in tree.rate_metrics().items():
+        limits = ", ".join(f"{m[key]:,}/{cap:,} {label}" for key, label, cap in (
+            ("requests", "rpm", m["rpm"]), ("tokens", "tpm", m["tpm"])) if cap)
+        console.print(f"Rate {name}: {limits} this minute; "
+                      f"waited {m['waited']:.1f}s over {m['waits']} calls")
+    flight = ctx.get("single_flight")
+    if flight is not None and flight.stats["shared"]:
+        m = flight.metrics()
+        console.print(f"Coalesced requests: {m['shared']} joined "
+                      f"{m['calls']} calls ({m['in_flight']} in flight)")
+
+
+def _print_routing(ctx: dict, console: Console) -> None:
+    """Observed latency per LLM route plus hedge and failover counters."""
+    tracker = ctx.get("llm_latency")
+    if tracker is None or not tracker.stats["calls"]:
+        return
+    table = Table(title="LLM Routing", header_style="bold cyan")
+    table.add_column("Route", style="bold")
+    for column in ("Samples", "p50", "p95"):
+        table.add_column(column, justify="right")
+    for name, m in tracker.metrics().items():
+        table.add_row(name, str(m["samples"]), f"{m['p50']:.2f}s",
+                      f"{m['p95']:.2f}s")
+    console.print(table)
+    s = tracker.stats
+    console.print(f"Hedged: {s['hedged']} (won {s['hedge_wins']}), "
+                  f"failovers: {s['failovers']}")
+
+
+def _print_resilience(ctx: dict, console: Console) -> None:
+    """Retry count and the state of every circuit that has tripped."""
+    guard = ctx.get("resilience")
+    if guard is None:
+        return
+    tripped = {n: m for n, m in guard.metrics().items() if m["opened"]}
+    if not guard.retries and not tripped:
+        return
+    states = ", ".join(f"{n} {m['state']} (opened {m['opened']}x)"
+                       for n, m in tripped.items())
+    console.print(f"Retries: {guard.retries}; circuits: {states or 'all closed'}")
+
+
+def _print_event_queues(ctx: dict, console: Console) -> None:
+    """Per-subscriber queue depth when the EventBus dispatches async."""
+    bus = ctx.get("event_bus")
+    metrics = bus.queue_metrics() if bus is not None else {}
+    if not metrics:
+        return
+    table = Table(title="Event Queues", header_style="bold cyan")
+    table.add_column("Subscriber", style="bold")
+    for column in ("Depth", "Max", "Delivered", "Coalesced", "Dropped"):
+        table.add_column(column, justify="right")
+    for name, m in metrics.items():
+        table.add_row(
+            name, str(m["depth"]), str(m["max_depth"]), str(m["delivered"]),
+            str(m["coalesced"]), f"[red]{m['dropped']}[/red]",
+        )
+    console.print(table)
@@ -0,0 +1,83 @@
+"""Handler for the /trace slash command (recording and replay)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from kresearch.commands.registry import command
+
+console = Console()
+
+_USAGE = (
+    "[bold]Usage:[/bold]\n"
+    "  /trace on|off    Record events and provider calls of each run\n"
+    "  /trace list      List recorded traces\n"
+    "  /trace replay <file> [--realtime] [--speed N]\n"
+    "                   Re-run a recorded trace without network access"
+)
+
+
+@command("trace", "Record and replay research runs")
+async def handle_trace(args: str, ctx: dict) -> None:
+    """Handle ``/trace <on|off|list|replay>``."""
+    parts = args.strip().split()
+    sub = parts[0].lower() if parts else ""
+
+    if sub in ("on", "off"):
+        ctx["config"].trace.record = sub == "on"
+        console.print(f"[green]Trace recording {sub}.[/green]")
+    elif sub == "list":
+        _list(ctx)
+    elif sub == "replay" and len(parts) > 1:
+        await _replay(parts[1:], ctx)
+    else:
+        console.print(_USAGE)
+
+
+def _trace_dir(ctx: dict) -> Path:
+    config = ctx["config"]
+    return Path(config.trace.directory or Path(config.output_dir) / "traces")
+
+
+def _list(ctx: dict) -> None:
+    """List trace files, newest first."""
+    root = _trace_dir(ctx)
+    paths = sorted(root.glob("*.jsonl*"), key=lambda p: p.stat().st_mtime,
+                   reverse=True) if root.is_dir() else []
+    if not paths:
+        console.print("[yellow]No recorded traces.[/yellow]")
+        return
+    table = Table(title="Recorded Traces")
+    table.add_column("File", style="bold cyan")
+    table.add_column("Size", justify="right")
+    for path in paths:
+        table.add_row(path.name, f"{path.stat().st_size / 1024:.1f} KB")
+    console.print(table)
+
+
+async def _replay(parts: list[str], ctx: dict) -> None:
+    """Replay a trace given by path or by a file name in the trace dir."""
+    from kresearch.phases.runner import PhaseRunner
+
+    path = Path(parts[0])
+    if not path.is_file():
+        path = _trace_dir(ctx) / parts[0]
+    if not path.is_file():
+        console.print(f"[red]Trace not found:[/red] {parts[0]}")
+        return
+    speed = 1.0
+    if "--speed" in parts[1:-1]:
+        try:
+            speed = float(parts[parts.index("--speed") + 1])
+        except ValueError:
+            console.print("[red]--speed expects a number[/red]")
+            return
+    try:
+        await PhaseRunner(ctx).replay(
+            str(path), realtime="--realtime" in parts, speed=speed,
+        )
+    except (OSError, ValueError) as exc:
+        console.print(f"[red]Could not read trace:[/red] {exc}")
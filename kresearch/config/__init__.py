@@ -12,9 +12,25 @@ from kresearch.config.schema import (
     RAGConfig,
     SandboxConfig,
     TelegramConfig,
-    ConcurrencyConfig,
     EvalConfig,
 )
+from kresearch.config.provider_schema import (
+    AdaptiveConfig,
+    CoalesceConfig,
+    ConcurrencyConfig,
+    RateLimitConfig,
+    ResilienceConfig,
+    RouterConfig,
+    SiteRouteConfig,
+)
+from kresearch.config.runtime_schema import (
+    BudgetConfig,
+    CacheConfig,
+    CheckpointConfig,
+    EventsConfig,
+    PlanningConfig,
+    TraceConfig,
+)
 
 __all__ = [
     "load_config",
@@ -26,5 +42,17 @@ __all__ = [
     "SandboxConfig",
     "TelegramConfig",
     "ConcurrencyConfig",
+    "RateLimitConfig",
     "EvalConfig",
+    "CheckpointConfig",
+    "EventsConfig",
+    "PlanningConfig",
+    "TraceConfig",
+    "CacheConfig",
+    "AdaptiveConfig",
+    "CoalesceConfig",
+    "RouterConfig",
+    "ResilienceConfig",
+    "SiteRouteConfig",
+    "BudgetConfig",
 ]
@@ -42,10 +42,77 @@ DEFAULT_CONFIG: dict = {
     "concurrency": {
         "global_limit": 15,
         "per_provider_limits": dict(DEFAULT_PER_PROVIDER_LIMITS),
+        "rate_limits": {},
     },
     "eval": {
         "min_score": 7.0,
         "max_iterations": 5,
     },
+    "checkpoint": {
+        "enabled": True,
+        "directory": None,
+    },
+    "planning": {
+        "stop_words": False,
+        "stem": False,
+    },
+    "events": {
+        "async_dispatch": False,
+        "queue_size": 256,
+        "policies": {
+            "phase.progress": "coalesce",
+            "draft.delta": "coalesce",
+            "retrieval.*": "drop",
+        },
+    },
+    "trace": {
+        "record": False,
+        "directory": None,
+    },
+    "cache": {
+        "enabled": False,
+        "path": None,
+        "ttl_seconds": 7 * 24 * 3600,
+        "max_entries": 10_000,
+        "cache_sampled": True,
+    },
+    "adaptive": {
+        "enabled": False,
+        "initial": 4,
+        "min_limit": 1,
+        "max_limit": 32,
+        "backoff": 0.5,
+        "tolerance": 2.0,
+    },
+    "coalesce": {
+        "enabled": True,
+        "sampled": False,
+    },
+    "router": {
+        "enabled": False,
+        "fallbacks": [],
+        "hedge": True,
+        "quantile": 0.95,
+        "min_samples": 20,
+        "hedge_after": 30.0,
+        "attempt_timeout": None,
+    },
+    "resilience": {
+        "enabled": True,
+        "max_retries": 3,
+        "base_delay": 1.0,
+        "max_delay": 30.0,
+        "jitter": True,
+        "failure_threshold": 5,
+        "reset_timeout": 30.0,
+    },
+    "routing": {},
+    "budget": {
+        "max_tokens": None,
+        "max_cost": None,
+        "phase_tokens": {},
+        "degrade_at": 0.25,
+        "prices": {},
+    },
     "output_dir": "output",
 }
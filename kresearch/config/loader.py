@@ -46,6 +46,21 @@ _ENV_OVERRIDES: dict[str, tuple[str, str]] = {
     f"{_ENV_PREFIX}CONCURRENCY_LIMIT": ("concurrency", "global_limit"),
     f"{_ENV_PREFIX}EVAL_MIN_SCORE": ("eval", "min_score"),
     f"{_ENV_PREFIX}EVAL_MAX_ITERATIONS": ("eval", "max_iterations"),
+    f"{_ENV_PREFIX}CHECKPOINT_ENABLED": ("checkpoint", "enabled"),
+    f"{_ENV_PREFIX}CHECKPOINT_DIR": ("checkpoint", "directory"),
+    f"{_ENV_PREFIX}EVENTS_ASYNC": ("events", "async_dispatch"),
+    f"{_ENV_PREFIX}TRACE_RECORD": ("trace", "record"),
+    f"{_ENV_PREFIX}TRACE_DIR": ("trace", "directory"),
+    f"{_ENV_PREFIX}CACHE_ENABLED": ("cache", "enabled"),
+    f"{_ENV_PREFIX}CACHE_PATH": ("cache", "path"),
+    f"{_ENV_PREFIX}CACHE_TTL": ("cache", "ttl_seconds"),
+    f"{_ENV_PREFIX}BUDGET_TOKENS": ("budget", "max_tokens"),
+    f"{_ENV_PREFIX}BUDGET_COST": ("budget", "max_cost"),
+    f"{_ENV_PREFIX}ADAPTIVE_ENABLED": ("adaptive", "enabled"),
+    f"{_ENV_PREFIX}ADAPTIVE_MAX": ("adaptive", "max_limit"),
+    f"{_ENV_PREFIX}COALESCE_ENABLED": ("coalesce", "enabled"),
+    f"{_ENV_PREFIX}ROUTER_ENABLED": ("router", "enabled"),
+    f"{_ENV_PREFIX}ROUTER_TIMEOUT": ("router", "attempt_timeout"),
     f"{_ENV_PREFIX}OUTPUT_DIR": ("output_dir", ""),
 }
 
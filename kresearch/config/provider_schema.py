@@ -0,0 +1,124 @@
+"""Pydantic models for provider calls (limits, coalescing, routing)."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class RateLimitConfig(BaseModel):
+    """Requests and tokens per minute allowed for one provider or model."""
+
+    rpm: Optional[int] = Field(
+        default=None, gt=0, description="Requests per minute"
+    )
+    tpm: Optional[int] = Field(
+        default=None, gt=0, description="Prompt plus completion tokens per minute"
+    )
+
+
+class ConcurrencyConfig(BaseModel):
+    """Configuration for concurrency limits."""
+
+    global_limit: int = Field(
+        default=15, gt=0, description="Global concurrency limit"
+    )
+    per_provider_limits: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Per-provider concurrency limits",
+    )
+    rate_limits: Dict[str, RateLimitConfig] = Field(
+        default_factory=dict,
+        description="RPM/TPM per 'provider' or 'provider:model'",
+    )
+
+
+class AdaptiveConfig(BaseModel):
+    """AIMD concurrency control per provider and model."""
+
+    enabled: bool = Field(
+        default=False, description="Adapt provider concurrency to load"
+    )
+    initial: int = Field(default=4, gt=0, description="Starting limit")
+    min_limit: int = Field(default=1, gt=0, description="Lowest limit")
+    max_limit: int = Field(default=32, gt=0, description="Highest limit")
+    backoff: float = Field(
+        default=0.5, gt=0.0, lt=1.0,
+        description="Multiplier applied on 429s, timeouts or latency spikes",
+    )
+    tolerance: float = Field(
+        default=2.0, gt=1.0,
+        description="Latency over this multiple of the site's baseline is a spike",
+    )
+
+
+class CoalesceConfig(BaseModel):
+    """Sharing of identical in-flight LLM and search requests within a run."""
+
+    enabled: bool = Field(
+        default=True, description="Join identical concurrent requests"
+    )
+    sampled: bool = Field(
+        default=False, description="Also join LLM calls with temperature > 0"
+    )
+
+
+class RouterConfig(BaseModel):
+    """Hedged requests and failover across LLM providers."""
+
+    enabled: bool = Field(default=False, description="Route LLM calls")
+    fallbacks: List[str] = Field(
+        default_factory=list,
+        description="Fallback routes in order: 'provider' or 'provider:model'",
+    )
+    hedge: bool = Field(
+        default=True, description="Send a duplicate to the next route when slow"
+    )
+    quantile: float = Field(
+        default=0.95, gt=0.0, le=1.0,
+        description="Primary latency quantile after which to hedge",
+    )
+    min_samples: int = Field(
+        default=20, ge=1, description="Calls observed before the quantile is used"
+    )
+    hedge_after: float = Field(
+        default=30.0, gt=0.0, description="Hedge delay until min_samples is reached"
+    )
+    attempt_timeout: Optional[float] = Field(
+        default=None, gt=0.0, description="Seconds before an attempt fails over"
+    )
+
+
+class ResilienceConfig(BaseModel):
+    """Retries and circuit breakers around LLM and search providers."""
+
+    enabled: bool = Field(default=True, description="Retry transient errors")
+    max_retries: int = Field(default=3, ge=0, description="Retries per call")
+    base_delay: float = Field(
+        default=1.0, gt=0.0, description="Backoff base delay in seconds"
+    )
+    max_delay: float = Field(
+        default=30.0, gt=0.0, description="Longest wait before a retry"
+    )
+    jitter: bool = Field(
+        default=True, description="Randomise backoff so callers spread out"
+    )
+    failure_threshold: int = Field(
+        default=5, ge=1,
+        description="Consecutive non-rate-limit failures that open a breaker",
+    )
+    reset_timeout: float = Field(
+        default=30.0, gt=0.0, description="Seconds a breaker stays open"
+    )
+
+
+class SiteRouteConfig(BaseModel):
+    """Provider and model for one LLM call site (e.g. ``phase3.extract``)."""
+
+    provider: Optional[str] = Field(
+        default=None, description="Provider for the site (default: llm.provider)"
+    )
+    model: Optional[str] = Field(
+        default=None, description="Model for the site (default: llm.model)"
+    )
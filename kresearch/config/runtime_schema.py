@@ -0,0 +1,108 @@
+"""Pydantic models for runtime behaviour (checkpointing, performance)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class CheckpointConfig(BaseModel):
+    """Configuration for per-phase session checkpoints."""
+
+    enabled: bool = Field(
+        default=True, description="Write a checkpoint after each phase"
+    )
+    directory: Optional[Path] = Field(
+        default=None,
+        description="Checkpoint directory (defaults to <output_dir>/checkpoints)",
+    )
+
+
+class PlanningConfig(BaseModel):
+    """Configuration for Phase 1 task-graph construction."""
+
+    stop_words: bool = Field(
+        default=False,
+        description="Ignore function words when matching sub-questions",
+    )
+    stem: bool = Field(
+        default=False,
+        description="Match sub-questions on light word stems",
+    )
+
+
+class EventsConfig(BaseModel):
+    """Configuration for EventBus dispatch."""
+
+    async_dispatch: bool = Field(
+        default=False,
+        description="Deliver events through per-subscriber queues",
+    )
+    queue_size: int = Field(
+        default=256, gt=0, description="Per-subscriber queue bound"
+    )
+    policies: Dict[str, str] = Field(
+        default_factory=lambda: {
+            "phase.progress": "coalesce",
+            "draft.delta": "coalesce",
+            "retrieval.*": "drop",
+        },
+        description="Overflow policy (coalesce/drop) per event type",
+    )
+
+
+class TraceConfig(BaseModel):
+    """Configuration for recording run traces (events + provider calls)."""
+
+    record: bool = Field(
+        default=False, description="Record every run to a replayable trace"
+    )
+    directory: Optional[Path] = Field(
+        default=None,
+        description="Trace directory (defaults to <output_dir>/traces)",
+    )
+
+
+class CacheConfig(BaseModel):
+    """Configuration for the on-disk LLM response cache."""
+
+    enabled: bool = Field(default=False, description="Cache LLM completions")
+    path: Optional[Path] = Field(
+        default=None,
+        description="SQLite file (defaults to <output_dir>/llm_cache.sqlite3)",
+    )
+    ttl_seconds: int = Field(
+        default=7 * 24 * 3600, ge=0,
+        description="Entry lifetime in seconds (0 = never expire)",
+    )
+    max_entries: int = Field(
+        default=10_000, gt=0, description="LRU bound on stored responses"
+    )
+    cache_sampled: bool = Field(
+        default=True, description="Also cache calls with temperature > 0"
+    )
+
+
+class BudgetConfig(BaseModel):
+    """Spend limits for a research run (unset limits are unlimited)."""
+
+    max_tokens: Optional[int] = Field(
+        default=None, gt=0, description="Billed tokens allowed per run"
+    )
+    max_cost: Optional[float] = Field(
+        default=None, gt=0, description="Estimated USD allowed per run"
+    )
+    phase_tokens: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Token limit per phase label, e.g. {phase2: 200000}",
+    )
+    degrade_at: float = Field(
+        default=0.25, ge=0.0, le=1.0,
+        description="Remaining fraction below which phases cut optional work",
+    )
+    prices: Dict[str, List[float]] = Field(
+        default_factory=dict,
+        description="USD per 1M tokens [input, output] per model (overrides)",
+    )
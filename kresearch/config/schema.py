@@ -7,6 +7,23 @@ from typing import Dict, Optional
 
 from pydantic import BaseModel, Field
 
+from kresearch.config.provider_schema import (
+    AdaptiveConfig,
+    CoalesceConfig,
+    ConcurrencyConfig,
+    ResilienceConfig,
+    RouterConfig,
+    SiteRouteConfig,
+)
+from kresearch.config.runtime_schema import (
+    BudgetConfig,
+    CacheConfig,
+    CheckpointConfig,
+    EventsConfig,
+    PlanningConfig,
+    TraceConfig,
+)
+
 
 class LLMConfig(BaseModel):
     """Configuration for the language model provider."""
@@ -81,18 +98,6 @@ class TelegramConfig(BaseModel):
     )
 
 
-class ConcurrencyConfig(BaseModel):
-    """Configuration for concurrency limits."""
-
-    global_limit: int = Field(
-        default=15, gt=0, description="Global concurrency limit"
-    )
-    per_provider_limits: Dict[str, int] = Field(
-        default_factory=dict,
-        description="Per-provider concurrency limits",
-    )
-
-
 class EvalConfig(BaseModel):
     """Configuration for evaluation thresholds."""
 
@@ -116,6 +121,20 @@ class AppConfig(BaseModel):
         default_factory=ConcurrencyConfig
     )
     eval: EvalConfig = Field(default_factory=EvalConfig)
+    checkpoint: CheckpointConfig = Field(default_factory=CheckpointConfig)
+    planning: PlanningConfig = Field(default_factory=PlanningConfig)
+    events: EventsConfig = Field(default_factory=EventsConfig)
+    trace: TraceConfig = Field(default_factory=TraceConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    adaptive: AdaptiveConfig = Field(default_factory=AdaptiveConfig)
+    coalesce: CoalesceConfig = Field(default_factory=CoalesceConfig)
+    router: RouterConfig = Field(default_factory=RouterConfig)
+    resilience: ResilienceConfig = Field(default_factory=ResilienceConfig)
+    routing: Dict[str, SiteRouteConfig] = Field(
+        default_factory=dict,
+        description="LLM provider/model per call site or 'phaseN.*' pattern",
+    )
+    budget: BudgetConfig = Field(default_factory=BudgetConfig)
     output_dir: Path = Field(
         default=Path("output"), description="Directory for output artifacts"
     )
@@ -7,7 +7,10 @@ from .mind_map import EpistemicMindMap
 from .task_node import TaskNode, TaskType, TaskStatus
 from .task_graph import TaskGraph
 from .session import ResearchSession
+from .checkpoint import CheckpointError, CheckpointStore
 from .event_bus import Event, EventBus
+from .usage import UsageLedger, call_site, usage_scope
+from .budget import Budget
 
 __all__ = [
     "Source",
@@ -24,6 +27,12 @@ __all__ = [
     "TaskStatus",
     "TaskGraph",
     "ResearchSession",
+    "CheckpointError",
+    "CheckpointStore",
     "Event",
     "EventBus",
+    "UsageLedger",
+    "call_site",
+    "usage_scope",
+    "Budget",
 ]
@@ -0,0 +1,59 @@
+"""Budget: per-run and per-phase spend limits over a UsageLedger."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from .usage import UsageLedger
+
+
+class Budget:
+    """Answers "how much is left?" so phases can degrade gracefully.
+
+    Limits are optional: ``max_tokens`` and ``max_cost`` for the whole
+    run and ``phase_tokens`` per phase label (``"phase2"`` ...).  Phases
+    consult :meth:`tight` to pick a cheaper plan (fewer discourse turns)
+    and :meth:`exhausted` to stop optional work (further refinement
+    iterations); nothing is ever aborted mid-call.
+    """
+
+    def __init__(
+        self,
+        ledger: UsageLedger,
+        max_tokens: Optional[int] = None,
+        max_cost: Optional[float] = None,
+        phase_tokens: Optional[dict[str, int]] = None,
+        degrade_at: float = 0.25,
+    ) -> None:
+        self.ledger = ledger
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+        self.phase_tokens = dict(phase_tokens or {})
+        self.degrade_at = degrade_at
+
+    def remaining(self, phase: Optional[str] = None) -> float:
+        """Fraction (0..1) of the tightest applicable limit still unspent."""
+        fractions = [1.0]
+        if self.max_tokens:
+            fractions.append(1 - self.ledger.tokens() / self.max_tokens)
+        if self.max_cost:
+            fractions.append(1 - self.ledger.cost() / self.max_cost)
+        limit = self.phase_tokens.get(phase) if phase else None
+        if limit:
+            fractions.append(1 - self.ledger.tokens(phase) / limit)
+        return max(min(fractions), 0.0)
+
+    def tight(self, phase: Optional[str] = None) -> bool:
+        """True once less than ``degrade_at`` of a limit is left."""
+        return self.remaining(phase) < self.degrade_at
+
+    def exhausted(self, phase: Optional[str] = None) -> bool:
+        return self.remaining(phase) <= 0.0
+
+    @classmethod
+    def from_config(cls, ledger: UsageLedger, settings) -> Budget:
+        """Build a budget from a ``BudgetConfig`` (or ``None``)."""
+        if settings is None:
+            return cls(ledger)
+        return cls(ledger, settings.max_tokens, settings.max_cost,
+                   settings.phase_tokens, settings.degrade_at)
@@ -0,0 +1,124 @@
+"""CheckpointStore: durable per-phase snapshots of research sessions."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from .session import ResearchSession
+
+
+class CheckpointError(ValueError):
+    """A session holds state that cannot be written as JSON."""
+
+
+def _encode(state: dict) -> str:
+    """Serialise *state* exactly, naming the field that cannot be."""
+    try:
+        return json.dumps(state)
+    except (TypeError, ValueError) as exc:  # ValueError: circular reference
+        for key, value in state.items():
+            try:
+                json.dumps(value)
+            except (TypeError, ValueError):
+                raise CheckpointError(
+                    f"Session field '{key}' cannot be checkpointed: {exc}"
+                ) from exc
+        raise CheckpointError(f"Session cannot be checkpointed: {exc}") from exc
+
+
+class CheckpointStore:
+    """Persists :class:`ResearchSession` snapshots as JSON files.
+
+    One file per session (``<session_id>.json``) is rewritten after
+    every completed phase.  Writes go to a temporary file first and are
+    moved into place atomically, so a crash mid-write never corrupts
+    the previous checkpoint.  State that is not plain JSON is never
+    coerced: :meth:`save` raises :class:`CheckpointError` instead, so a
+    resumed session sees exactly what was saved.
+    """
+
+    def __init__(self, root: Path | str) -> None:
+        self.root = Path(root)
+
+    def path_for(self, session_id: str) -> Path:
+        """Return the checkpoint file path for *session_id*."""
+        return self.root / f"{session_id}.json"
+
+    def save(self, session: ResearchSession) -> Path:
+        """Write a checkpoint for *session* and return its path.
+
+        Raises :class:`CheckpointError` if the session holds values that
+        are not JSON; the previous checkpoint is then left in place.
+        """
+        payload = _encode(session.to_dict())
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(session.id)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(payload)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return path
+
+    def load(self, session_id: str) -> ResearchSession:
+        """Load the checkpoint for *session_id*.
+
+        *session_id* may be a unique prefix of the full id.  Raises
+        ``FileNotFoundError`` if no (or more than one) checkpoint matches.
+        """
+        path = self._resolve(session_id)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return ResearchSession.from_dict(data)
+
+    def list_sessions(self) -> list[dict]:
+        """Return brief metadata for every stored checkpoint, newest first."""
+        if not self.root.is_dir():
+            return []
+        entries = []
+        paths = sorted(self.root.glob("*.json"),
+                       key=lambda p: p.stat().st_mtime, reverse=True)
+        for path in paths:
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            entries.append({
+                "id": data.get("id", path.stem),
+                "query": data.get("original_query", ""),
+                "phase_index": data.get("current_phase", 0),
+                "status": data.get("status", ""),
+            })
+        return entries
+
+    def delete(self, session_id: str) -> None:
+        """Remove the checkpoint for *session_id* if it exists."""
+        self.path_for(session_id).unlink(missing_ok=True)
+
+    def _resolve(self, session_id: str) -> Path:
+        exact = self.path_for(session_id)
+        if exact.is_file():
+            return exact
+        matches: list[Path] = []
+        if self.root.is_dir():
+            matches = list(self.root.glob(f"{session_id}*.json"))
+        if len(matches) != 1:
+            raise FileNotFoundError(
+                f"No unique checkpoint for session '{session_id}'"
+            )
+        return matches[0]
+
+
+def default_store(config) -> Optional[CheckpointStore]:
+    """Build the store configured on *config*, or ``None`` when disabled."""
+    settings = getattr(config, "checkpoint", None)
+    if settings is not None and not settings.enabled:
+        return None
+    root = settings.directory if settings and settings.directory else None
+    return CheckpointStore(root or Path(config.output_dir) / "checkpoints")
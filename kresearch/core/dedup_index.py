@@ -0,0 +1,147 @@
+"""DedupIndex: canonical-URL and MinHash/LSH near-duplicate detection."""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from array import array
+from typing import Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src"}
+
+
+def canonical_url(url: str) -> str:
+    """Normalise *url* so trivially different links compare equal.
+
+    Drops the scheme, ``www.``, default ports, fragments, trailing
+    slashes and tracking parameters (``utm_*``, ``gclid`` ...), and sorts
+    the remaining query parameters.
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url if "//" in url else f"//{url}")
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/")
+    return f"{host}{path}" + (f"?{urlencode(query)}" if query else "")
+
+
+def _shingles(text: str, size: int) -> set[str]:
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big",
+    )
+
+
+class DedupIndex:
+    """Finds earlier entries with the same canonical URL or similar text.
+
+    Text similarity is estimated with MinHash over word shingles; LSH
+    banding narrows the candidates and the full signatures confirm a
+    match at ``threshold`` estimated Jaccard similarity.
+
+    Parameters
+    ----------
+    num_perm:
+        MinHash signature length (must be divisible by *bands*).
+    bands:
+        Number of LSH bands.
+    threshold:
+        Minimum estimated Jaccard similarity for a near-duplicate.
+    shingle_size:
+        Words per shingle.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 16,
+        threshold: float = 0.8,
+        shingle_size: int = 3,
+        seed: int = 1,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        rng = random.Random(seed)
+        # XOR with a random mask is a cheap permutation of the 64-bit
+        # hash space; it keeps the arithmetic in small ints.
+        self._masks = [rng.getrandbits(64) for _ in range(num_perm)]
+        self._rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self._urls: dict[str, str] = {}
+        # band key -> (entry id, signature); an entry may own several
+        # signatures once merged duplicates have been added under it.
+        self._buckets: dict[tuple[int, int], list[tuple[str, array]]] = {}
+        # find() is usually followed by add() for the same text.
+        self._last: tuple[str, Optional[array]] = ("", None)
+
+    def find(self, urls: Iterable[str], text: str) -> Optional[str]:
+        """Return the id of an indexed duplicate, or ``None``."""
+        for url in urls:
+            key = canonical_url(url)
+            if key and key in self._urls:
+                return self._urls[key]
+        signature = self._signature(text)
+        if signature is None:
+            return None
+        for band_key in self._band_keys(signature):
+            for entry_id, other in self._buckets.get(band_key, ()):
+                if self._similarity(signature, other) >= self.threshold:
+                    return entry_id
+        return None
+
+    def add(self, entry_id: str, urls: Iterable[str], text: str) -> None:
+        """Index *entry_id* under its URLs and text signature.
+
+        Adding more URLs and text under an indexed id extends its entry.
+        """
+        for url in urls:
+            key = canonical_url(url)
+            if key:
+                self._urls.setdefault(key, entry_id)
+        signature = self._signature(text)
+        if signature is None:
+            return
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, []).append((entry_id, signature))
+
+    # ------------------------------------------------------------------
+    # MinHash / LSH internals
+    # ------------------------------------------------------------------
+
+    def _signature(self, text: str) -> Optional[array]:
+        if text and self._last[0] == text:
+            return self._last[1]
+        hashes = [_hash64(s) for s in _shingles(text, self.shingle_size)]
+        signature = None
+        if hashes:
+            signature = array("Q", (min(h ^ m for h in hashes) for m in self._masks))
+        self._last = (text, signature)
+        return signature
+
+    def _band_keys(self, signature: array) -> list[tuple[int, int]]:
+        rows = self._rows
+        return [
+            (band, hash(tuple(signature[band * rows:(band + 1) * rows])))
+            for band in range(len(signature) // rows)
+        ]
+
+    @staticmethod
+    def _similarity(left: array, right: array) -> float:
+        return sum(a == b for a, b in zip(left, right)) / len(left)
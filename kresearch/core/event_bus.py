@@ -5,7 +5,9 @@ from __future__ import annotations
 import asyncio
 import time
 from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Optional
+
+from .event_queue import SubscriberQueue, subscriber_name
 
 
 @dataclass
@@ -21,11 +23,36 @@ class Event:
 Subscriber = Callable[[Event], Awaitable[None]]
 
 
-class EventBus:
-    """Simple async publish/subscribe event bus."""
+# Default overflow policies for high-frequency events (async mode only).
+DEFAULT_POLICIES: dict[str, str] = {
+    "phase.progress": "coalesce",
+    "retrieval.*": "drop",
+}
+
 
-    def __init__(self) -> None:
+class EventBus:
+    """Simple async publish/subscribe event bus.
+
+    By default :meth:`publish` awaits every subscriber inline.  With
+    ``async_dispatch=True`` each subscriber instead gets its own bounded
+    :class:`SubscriberQueue` and worker task, so publishers never wait
+    on subscribers; ``policies`` maps event types (or ``prefix.*``) to
+    ``"coalesce"`` or ``"drop"`` for when a subscriber falls behind.
+    Wildcard (``"*"``) subscribers -- trace recorders, loggers -- get
+    lossless queues that apply no policy.
+    """
+
+    def __init__(
+        self,
+        async_dispatch: bool = False,
+        queue_size: int = 256,
+        policies: Optional[dict[str, str]] = None,
+    ) -> None:
         self._subscribers: dict[str, list[Subscriber]] = {}
+        self.async_dispatch = async_dispatch
+        self.queue_size = queue_size
+        self.policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self._queues: dict[Subscriber, SubscriberQueue] = {}
 
     # --- Subscription management ---
 
@@ -34,6 +61,8 @@ class EventBus:
         self._subscribers.setdefault(event_type, [])
         if callback not in self._subscribers[event_type]:
             self._subscribers[event_type].append(callback)
+        if event_type == "*" and callback in self._queues:
+            self._queues[callback].policies = {}
 
     def unsubscribe(self, event_type: str, callback: Subscriber) -> None:
         """Remove a callback for an event type."""
@@ -51,6 +80,11 @@ class EventBus:
         subscribers.extend(self._subscribers.get("*", []))
         if not subscribers:
             return
+        if self.async_dispatch:
+            wildcard = self._subscribers.get("*", [])
+            for sub in subscribers:
+                self._queue_for(sub, lossless=sub in wildcard).put(event)
+            return
         await asyncio.gather(
             *(sub(event) for sub in subscribers),
             return_exceptions=True,
@@ -75,6 +109,36 @@ class EventBus:
         """Return the number of subscribers for an event type."""
         return len(self._subscribers.get(event_type, []))
 
+    def queue_metrics(self) -> dict[str, dict]:
+        """Return per-subscriber queue depth and delivery counters."""
+        return {subscriber_name(sub): q.metrics() for sub, q in self._queues.items()}
+
     def clear(self) -> None:
         """Remove all subscribers."""
         self._subscribers.clear()
+        for queue in self._queues.values():
+            queue.close()
+        self._queues.clear()
+
+    # --- Async dispatch ---
+
+    async def drain(self) -> None:
+        """Wait until all queued events have been delivered."""
+        for queue in list(self._queues.values()):
+            await queue.join()
+
+    async def aclose(self) -> None:
+        """Deliver what is queued, then stop all subscriber workers."""
+        await self.drain()
+        for queue in self._queues.values():
+            queue.close()
+
+    def _queue_for(
+        self, subscriber: Subscriber, lossless: bool = False,
+    ) -> SubscriberQueue:
+        queue = self._queues.get(subscriber)
+        if queue is None:
+            policies = {} if lossless else self.policies
+            queue = SubscriberQueue(subscriber, self.queue_size, policies)
+            self._queues[subscriber] = queue
+        return queue
@@ -0,0 +1,126 @@
+"""SubscriberQueue: bounded, coalescing per-subscriber event delivery."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional
+
+from kresearch.utils.patterns import match_policy
+
+logger = logging.getLogger(__name__)
+
+COALESCE = "coalesce"
+DROP = "drop"
+
+
+class SubscriberQueue:
+    """Queue plus worker task delivering events to one subscriber.
+
+    ``put`` never blocks.  When the queue holds ``maxsize`` events:
+
+    * ``coalesce`` events replace a queued event of the same type (the
+      subscriber sees only the latest), or are dropped;
+    * ``drop`` events are discarded;
+    * events without a policy are lossless: they evict the oldest
+      droppable event, or overflow the bound if there is none.
+
+    Coalesce events also replace a queued event of the same type when
+    the queue is not full, since only the newest state matters.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[Any], Awaitable[None]],
+        maxsize: int,
+        policies: dict[str, str],
+    ) -> None:
+        self.callback = callback
+        self.maxsize = maxsize
+        self.policies = policies
+        self._queue: deque[list] = deque()  # entries are [event, policy]
+        self._pending: dict[str, list] = {}  # type -> queued coalesce entry
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._worker: Optional[asyncio.Task] = None
+        self.stats = {"delivered": 0, "dropped": 0, "coalesced": 0,
+                      "overflow": 0, "errors": 0, "max_depth": 0}
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def put(self, event: Any) -> None:
+        """Enqueue *event* without waiting."""
+        policy = match_policy(self.policies, event.type)
+        if policy == COALESCE and event.type in self._pending:
+            self._pending[event.type][0] = event
+            self.stats["coalesced"] += 1
+            return
+        if len(self._queue) >= self.maxsize:
+            if policy in (COALESCE, DROP):
+                self.stats["dropped"] += 1
+                return
+            if not self._evict_droppable():
+                self.stats["overflow"] += 1
+        entry = [event, policy]
+        self._queue.append(entry)
+        if policy == COALESCE:
+            self._pending[event.type] = entry
+        self.stats["max_depth"] = max(self.stats["max_depth"], len(self._queue))
+        self._idle.clear()
+        self._wakeup.set()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def join(self) -> None:
+        """Wait until every queued event has been delivered."""
+        await self._idle.wait()
+
+    def close(self) -> None:
+        """Cancel the worker; undelivered events are discarded."""
+        if self._worker is not None:
+            self._worker.cancel()
+        self._queue.clear()
+        self._pending.clear()
+        self._idle.set()
+
+    def metrics(self) -> dict:
+        return {"depth": self.depth, **self.stats}
+
+    # ------------------------------------------------------------------
+
+    def _evict_droppable(self) -> bool:
+        for entry in self._queue:
+            if entry[1] in (COALESCE, DROP):
+                self._queue.remove(entry)
+                if self._pending.get(entry[0].type) is entry:
+                    del self._pending[entry[0].type]
+                self.stats["dropped"] += 1
+                return True
+        return False
+
+    async def _run(self) -> None:
+        while True:
+            if not self._queue:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            entry = self._queue.popleft()
+            event = entry[0]
+            if self._pending.get(event.type) is entry:
+                del self._pending[event.type]
+            try:
+                await self.callback(event)
+                self.stats["delivered"] += 1
+            except Exception as exc:  # subscribers must not kill the worker
+                self.stats["errors"] += 1
+                logger.warning("Subscriber %s failed on %s: %s",
+                               subscriber_name(self.callback), event.type, exc)
+
+
+def subscriber_name(callback: Callable) -> str:
+    return getattr(callback, "__qualname__", repr(callback))
@@ -2,22 +2,59 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import sys
+from typing import Any, Optional
 
-from .mind_map_node import ConfidenceLevel, MindMapNode, NodeType
+from .mind_map_index import MindMapIndex
+from .mind_map_node import ConfidenceLevel, MindMapNode
+from .mind_map_queries import MindMapQueryMixin
+from .mind_map_views import MindMapViewMixin
 
 
-class EpistemicMindMap:
-    """Directed graph of claims, evidence, and perspectives."""
+class EpistemicMindMap(MindMapQueryMixin, MindMapViewMixin):
+    """Directed graph of claims, evidence, and perspectives.
+
+    Type, confidence and reverse-edge lookups are served from a
+    :class:`MindMapIndex` kept in sync on every insertion and every
+    ``MindMapNode.update_confidence`` call.
+
+    Every mutation bumps :attr:`version`; :meth:`to_dict` and any view
+    registered through :meth:`cached_view` are rebuilt only when the
+    version has moved.  Code that edits a node in place (e.g. its
+    ``metadata``) must call :meth:`touch` afterwards.
+    """
 
     def __init__(self) -> None:
         self._nodes: dict[str, MindMapNode] = {}
-        self._edges: list[tuple[str, str, str]] = []  # (from, to, relation)
+        self._index = MindMapIndex()
+        # (from, to, relation) in insertion order, shared with the index
+        self._edges = self._index.edges
+        self._version = 0
+        self._views: dict[str, tuple[int, Any]] = {}
 
     # --- Node operations ---
 
     def add_node(self, node: MindMapNode) -> None:
+        previous = self._nodes.get(node.id)
+        if previous is not None:
+            previous._observer = None
+            self._index.remove(previous)
         self._nodes[node.id] = node
+        self._index.add(node)
+        node._observer = self._on_confidence
+        self.touch()
+
+    def add_or_merge(self, node: MindMapNode) -> MindMapNode:
+        """Add *node*, or fold it into an existing duplicate EVIDENCE node.
+
+        Duplicates share a canonical source URL or a near-identical
+        snippet; the surviving node is returned.
+        """
+        match = self._index.find_duplicate(node, self._nodes.values())
+        if match is not None and match in self._nodes:
+            return self.merge_node(match, node)
+        self.add_node(node)
+        return node
 
     def get_node(self, node_id: str) -> Optional[MindMapNode]:
         return self._nodes.get(node_id)
@@ -37,36 +74,16 @@ class EpistemicMindMap:
     def add_edge(self, from_id: str, to_id: str, relation: str) -> None:
         if from_id not in self._nodes or to_id not in self._nodes:
             raise KeyError("Both nodes must exist before adding an edge.")
-        self._edges.append((from_id, to_id, relation))
+        relation = sys.intern(relation)
+        if not self._index.add_edge(from_id, to_id, relation):
+            return
+        self.touch()
         from_node = self._nodes[from_id]
-        if to_id not in from_node.children:
-            from_node.children.append(to_id)
+        from_node.add_child(to_id)
         to_node = self._nodes[to_id]
         if to_node.parent is None:
             to_node.parent = from_id
 
-    # --- Query helpers ---
-
-    def get_contested_nodes(self) -> list[MindMapNode]:
-        return [
-            n for n in self._nodes.values()
-            if n.confidence == ConfidenceLevel.CONTESTED
-        ]
-
-    def get_unverified_claims(self) -> list[MindMapNode]:
-        return [
-            n for n in self._nodes.values()
-            if n.node_type == NodeType.CLAIM
-            and n.confidence == ConfidenceLevel.UNVERIFIED
-        ]
-
-    def get_by_confidence(self, level: ConfidenceLevel) -> list[MindMapNode]:
-        if isinstance(level, str):
-            level = ConfidenceLevel(level)
-        return [
-            n for n in self._nodes.values() if n.confidence == level
-        ]
-
     # --- Merge ---
 
     def merge_node(
@@ -80,32 +97,23 @@ class EpistemicMindMap:
         for eid in new_node.evidence_ids:
             existing.add_evidence(eid)
         for p in new_node.perspectives:
-            if p not in existing.perspectives:
-                existing.perspectives.append(p)
+            existing.add_perspective(p)
         existing.metadata.update(new_node.metadata)
+        self._index.merged(existing, new_node)
+        self.touch()
         return existing
 
-    # --- Statistics ---
-
-    def get_statistics(self) -> dict:
-        by_type = {}
-        for n in self._nodes.values():
-            key = n.node_type.value
-            by_type[key] = by_type.get(key, 0) + 1
-        by_conf = {}
-        for n in self._nodes.values():
-            key = n.confidence.value
-            by_conf[key] = by_conf.get(key, 0) + 1
-        return {
-            "total_nodes": len(self._nodes),
-            "total_edges": len(self._edges),
-            "by_type": by_type,
-            "by_confidence": by_conf,
-        }
+    def _on_confidence(self, node: MindMapNode, previous: ConfidenceLevel) -> None:
+        self._index.reconfidence(node, previous)
+        self.touch()
 
     # --- Serialisation ---
 
     def to_dict(self) -> dict:
+        """Serialise the map (cached per version; treat as read-only)."""
+        return self.cached_view("dict", EpistemicMindMap._build_dict)
+
+    def _build_dict(self) -> dict:
         return {
             "nodes": {nid: n.to_dict() for nid, n in self._nodes.items()},
             "edges": [
@@ -117,10 +125,9 @@ class EpistemicMindMap:
     @classmethod
     def from_dict(cls, data: dict) -> EpistemicMindMap:
         mm = cls()
-        for nid, ndata in data.get("nodes", {}).items():
-            mm._nodes[nid] = MindMapNode.from_dict(ndata)
+        for ndata in data.get("nodes", {}).values():
+            mm.add_node(MindMapNode.from_dict(ndata))
         for edge in data.get("edges", []):
-            mm._edges.append(
-                (edge["from"], edge["to"], edge["relation"])
-            )
+            triple = (edge["from"], edge["to"], sys.intern(edge["relation"]))
+            mm._index.add_edge(*triple)
         return mm
@@ -0,0 +1,116 @@
+"""MindMapIndex: secondary indexes maintained alongside an EpistemicMindMap."""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from .dedup_index import DedupIndex
+from .mind_map_node import ConfidenceLevel, MindMapNode, NodeType
+
+
+class MindMapIndex:
+    """By-type, by-confidence, reverse-edge, edge-set and dedup indexes.
+
+    Buckets are insertion-ordered sets (``dict[str, None]``) so queries
+    return nodes in a stable order without rescanning the map.  The
+    EVIDENCE dedup index is built on first use.
+    """
+
+    def __init__(self) -> None:
+        self.by_type: dict[NodeType, dict[str, None]] = {}
+        self.by_confidence: dict[ConfidenceLevel, dict[str, None]] = {}
+        # child -> parent id, or an ordered set of ids once it has several
+        self.parents: dict[str, str | dict[str, None]] = {}
+        # (from, to, relation) -> None; also the map's ordered edge list
+        self.edges: dict[tuple[str, str, str], None] = {}
+        self.dedup: Optional[DedupIndex] = None
+
+    # --- Nodes ---
+
+    def add(self, node: MindMapNode) -> None:
+        """Index *node* under its type and confidence."""
+        self.by_type.setdefault(node.node_type, {})[node.id] = None
+        self.by_confidence.setdefault(node.confidence, {})[node.id] = None
+        if self.dedup is not None and node.node_type == NodeType.EVIDENCE:
+            self.dedup.add(node.id, node.sources, node.content)
+
+    def merged(self, existing: MindMapNode, node: MindMapNode) -> None:
+        """Match future duplicates of *node*, folded into *existing*, too."""
+        if self.dedup is not None and existing.node_type == NodeType.EVIDENCE:
+            self.dedup.add(existing.id, node.sources, node.content)
+
+    def remove(self, node: MindMapNode) -> None:
+        """Drop *node* from the type and confidence indexes."""
+        self.by_type.get(node.node_type, {}).pop(node.id, None)
+        self.by_confidence.get(node.confidence, {}).pop(node.id, None)
+
+    def reconfidence(
+        self, node: MindMapNode, previous: ConfidenceLevel,
+    ) -> None:
+        """Move *node* from the *previous* confidence bucket to its current one."""
+        self.by_confidence.get(previous, {}).pop(node.id, None)
+        self.by_confidence.setdefault(node.confidence, {})[node.id] = None
+
+    # --- Edges ---
+
+    def add_edge(self, from_id: str, to_id: str, relation: str) -> bool:
+        """Record an edge; return ``False`` if it was already present."""
+        edge = (from_id, to_id, relation)
+        if edge in self.edges:
+            return False
+        self.edges[edge] = None
+        known = self.parents.get(to_id)
+        if known is None:
+            self.parents[to_id] = from_id
+        elif isinstance(known, str):
+            if known != from_id:
+                self.parents[to_id] = {known: None, from_id: None}
+        else:
+            known[from_id] = None
+        return True
+
+    # --- Queries ---
+
+    def find_duplicate(
+        self, node: MindMapNode, existing: Iterable[MindMapNode],
+    ) -> Optional[str]:
+        """Return the id of an EVIDENCE node duplicating *node*, if any.
+
+        *existing* seeds the dedup index the first time it is needed.
+        """
+        if node.node_type != NodeType.EVIDENCE:
+            return None
+        if self.dedup is None:
+            self.dedup = DedupIndex()
+            for other in existing:
+                if other.node_type == NodeType.EVIDENCE:
+                    self.dedup.add(other.id, other.sources, other.content)
+        return self.dedup.find(node.sources, node.content)
+
+    def ids_by_type(self, node_type: NodeType) -> list[str]:
+        return list(self.by_type.get(node_type, ()))
+
+    def ids_by_confidence(self, level: ConfidenceLevel) -> list[str]:
+        return list(self.by_confidence.get(level, ()))
+
+    def ids_with(
+        self, node_type: NodeType, level: ConfidenceLevel,
+    ) -> list[str]:
+        """Return ids of nodes matching both *node_type* and *level*."""
+        typed = self.by_type.get(node_type, {})
+        leveled = self.by_confidence.get(level, {})
+        small, large = (typed, leveled) if len(typed) <= len(leveled) \
+            else (leveled, typed)
+        return [nid for nid in small if nid in large]
+
+    def parent_ids(self, node_id: str) -> list[str]:
+        known = self.parents.get(node_id, ())
+        return [known] if isinstance(known, str) else list(known)
+
+    def counts(self) -> tuple[dict[str, int], dict[str, int]]:
+        """Return non-empty ``(by_type, by_confidence)`` size maps."""
+        by_type = {t.value: len(ids) for t, ids in self.by_type.items() if ids}
+        by_conf = {
+            c.value: len(ids) for c, ids in self.by_confidence.items() if ids
+        }
+        return by_type, by_conf
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import sys
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
+
+from .ordered_set import OrderedSet, compact, grow
 
 
 class NodeType(str, Enum):
@@ -25,36 +28,66 @@ class ConfidenceLevel(str, Enum):
     UNVERIFIED = "UNVERIFIED"
 
 
-@dataclass
+@dataclass(slots=True)
 class MindMapNode:
-    """A single node in the epistemic mind map."""
+    """A single node in the epistemic mind map.
+
+    Slotted, with :class:`OrderedSet` reference collections: lists passed
+    to the constructor are converted, duplicates dropped, and perspective
+    names interned so thousands of nodes share one string.  Small
+    collections are stored as tuples until first modified, so mutate
+    them through the ``add_*`` helpers rather than ``.append``.
+    """
 
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     node_type: NodeType = NodeType.CONCEPT
     content: str = ""
     confidence: ConfidenceLevel = ConfidenceLevel.UNVERIFIED
-    sources: list[str] = field(default_factory=list)
-    evidence_ids: list[str] = field(default_factory=list)
-    perspectives: list[str] = field(default_factory=list)
-    children: list[str] = field(default_factory=list)
+    sources: OrderedSet | tuple = ()
+    evidence_ids: OrderedSet | tuple = ()
+    perspectives: OrderedSet | tuple = ()
+    children: OrderedSet | tuple = ()
     parent: Optional[str] = None
     metadata: dict = field(default_factory=dict)
+    # Set by the owning mind map; called as observer(node, previous_level)
+    _observer: Optional[Callable[[MindMapNode, ConfidenceLevel], None]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        self.sources = compact(self.sources)
+        self.evidence_ids = compact(self.evidence_ids)
+        self.children = compact(self.children)
+        self.perspectives = compact(sys.intern(p) for p in self.perspectives)
 
     def update_confidence(self, level: ConfidenceLevel) -> None:
         """Update the confidence level of this node."""
         if isinstance(level, str):
             level = ConfidenceLevel(level)
+        previous = self.confidence
         self.confidence = level
+        if self._observer is not None and previous != level:
+            self._observer(self, previous)
 
     def add_evidence(self, evidence_id: str) -> None:
         """Link an evidence ID to this node."""
-        if evidence_id not in self.evidence_ids:
-            self.evidence_ids.append(evidence_id)
+        self.evidence_ids = grow(self.evidence_ids)
+        self.evidence_ids.add(evidence_id)
 
     def add_source(self, source_ref: str) -> None:
         """Add a source reference to this node."""
-        if source_ref not in self.sources:
-            self.sources.append(source_ref)
+        self.sources = grow(self.sources)
+        self.sources.add(source_ref)
+
+    def add_perspective(self, name: str) -> None:
+        """Tag this node with an (interned) perspective name."""
+        self.perspectives = grow(self.perspectives)
+        self.perspectives.add(sys.intern(name))
+
+    def add_child(self, child_id: str) -> None:
+        """Record *child_id* as a child of this node."""
+        self.children = grow(self.children)
+        self.children.add(child_id)
 
     def to_dict(self) -> dict:
         return {
@@ -0,0 +1,55 @@
+"""MindMapQueryMixin: index-backed read queries for EpistemicMindMap."""
+
+from __future__ import annotations
+
+from .mind_map_index import MindMapIndex
+from .mind_map_node import ConfidenceLevel, MindMapNode, NodeType
+
+
+class MindMapQueryMixin:
+    """Lookups served from the map's :class:`MindMapIndex`."""
+
+    _nodes: dict[str, MindMapNode]
+    _edges: dict[tuple[str, str, str], None]
+    _index: MindMapIndex
+
+    def get_parents(self, node_id: str) -> list[MindMapNode]:
+        """Return every node with an edge pointing at *node_id*."""
+        return self._lookup(self._index.parent_ids(node_id))
+
+    def get_by_type(self, node_type: NodeType) -> list[MindMapNode]:
+        if isinstance(node_type, str):
+            node_type = NodeType(node_type)
+        return self._lookup(self._index.ids_by_type(node_type))
+
+    def has_edge(self, from_id: str, to_id: str, relation: str) -> bool:
+        return (from_id, to_id, relation) in self._index.edges
+
+    # --- Query helpers ---
+
+    def get_contested_nodes(self) -> list[MindMapNode]:
+        return self.get_by_confidence(ConfidenceLevel.CONTESTED)
+
+    def get_unverified_claims(self) -> list[MindMapNode]:
+        return self._lookup(self._index.ids_with(
+            NodeType.CLAIM, ConfidenceLevel.UNVERIFIED,
+        ))
+
+    def get_by_confidence(self, level: ConfidenceLevel) -> list[MindMapNode]:
+        if isinstance(level, str):
+            level = ConfidenceLevel(level)
+        return self._lookup(self._index.ids_by_confidence(level))
+
+    def _lookup(self, node_ids: list[str]) -> list[MindMapNode]:
+        return [self._nodes[nid] for nid in node_ids if nid in self._nodes]
+
+    # --- Statistics ---
+
+    def get_statistics(self) -> dict:
+        by_type, by_conf = self._index.counts()
+        return {
+            "total_nodes": len(self._nodes),
+            "total_edges": len(self._edges),
+            "by_type": by_type,
+            "by_confidence": by_conf,
+        }
@@ -0,0 +1,34 @@
+"""MindMapViewMixin: mutation versioning and cached serialised views."""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+
+class MindMapViewMixin:
+    """Version counter plus per-version memoisation of derived views."""
+
+    _version: int
+    _views: dict[str, tuple[int, Any]]
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter incremented on every mutation."""
+        return self._version
+
+    def touch(self) -> None:
+        """Record an in-place edit so cached views are rebuilt."""
+        self._version += 1
+
+    def cached_view(self, key: str, build: Callable[[Any], Any]) -> Any:
+        """Return ``build(self)``, recomputed only after the map changes.
+
+        Results are shared between callers and must be treated as
+        read-only.
+        """
+        hit = self._views.get(key)
+        if hit is not None and hit[0] == self._version:
+            return hit[1]
+        value = build(self)
+        self._views[key] = (self._version, value)
+        return value
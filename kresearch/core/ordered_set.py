@@ -0,0 +1,111 @@
+"""OrderedSet: a compact, insertion-ordered set for node reference lists."""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator
+
+# Below this size a linear scan beats building a hash set.
+_INDEX_THRESHOLD = 8
+
+
+class OrderedSet:
+    """Insertion-ordered set with a list-like surface.
+
+    Small sets (the common case: one source, one perspective) are stored
+    as a bare list; once a set grows past a handful of items a hash
+    index is added so membership tests and :meth:`add` stay O(1).
+    ``append`` is kept as an alias of :meth:`add` for code written
+    against the old list fields.
+
+    Node classes store collections built at construction time as a
+    de-duplicated tuple while they are small (empty ones share ``()``)
+    and only allocate an OrderedSet on first insert (see
+    :func:`compact` and :func:`grow`).
+    """
+
+    __slots__ = ("_items", "_index")
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        self._items: list | tuple = ()
+        self._index: set | None = None
+        for item in items:
+            self.add(item)
+
+    def add(self, item: Any) -> bool:
+        """Add *item*; return ``False`` if it was already present."""
+        if item in self:
+            return False
+        if not self._items:
+            self._items = [item]
+            return True
+        self._items.append(item)
+        if self._index is not None:
+            self._index.add(item)
+        elif len(self._items) > _INDEX_THRESHOLD:
+            self._index = set(self._items)
+        return True
+
+    append = add
+
+    def extend(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.add(item)
+
+    def discard(self, item: Any) -> None:
+        if item not in self:
+            return
+        self._items.remove(item)
+        if self._index is not None:
+            self._index.discard(item)
+        if not self._items:
+            self._items, self._index = (), None
+
+    def remove(self, item: Any) -> None:
+        if item not in self:
+            raise KeyError(item)
+        self.discard(item)
+
+    def __contains__(self, item: Any) -> bool:
+        if self._index is not None:
+            return item in self._index
+        return item in self._items
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, position: int) -> Any:
+        return self._items[position]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OrderedSet):
+            return list(self._items) == list(other._items)
+        if isinstance(other, (list, tuple)):
+            return list(self._items) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"OrderedSet({list(self._items)!r})"
+
+
+def compact(items: Iterable[Any]) -> OrderedSet | tuple:
+    """Return *items* de-duplicated in the cheapest read-only form.
+
+    Small collections become a tuple (``()`` when empty); larger ones
+    an :class:`OrderedSet`.
+    """
+    if isinstance(items, OrderedSet) and len(items) > _INDEX_THRESHOLD:
+        return items
+    unique = tuple(dict.fromkeys(items))
+    if len(unique) <= _INDEX_THRESHOLD:
+        return unique
+    return OrderedSet(unique)
+
+
+def grow(items: OrderedSet | tuple) -> OrderedSet:
+    """Return *items* as a mutable OrderedSet (allocating if needed)."""
+    return items if isinstance(items, OrderedSet) else OrderedSet(items)
@@ -9,6 +9,7 @@ from typing import Any, Optional
 
 from .mind_map import EpistemicMindMap
 from .task_graph import TaskGraph
+from .usage import UsageLedger
 
 _PHASES = [
     "INIT",
@@ -46,6 +47,9 @@ class ResearchSession:
     draft_iterations: list[Any] = field(default_factory=list)
     final_report: Optional[str] = None
 
+    # Token / latency / cost accounting
+    usage: UsageLedger = field(default_factory=UsageLedger)
+
     # Progress tracking
     current_phase: int = 0
     status: str = "initialized"
@@ -80,3 +84,36 @@ class ResearchSession:
             "drafts": len(self.draft_iterations),
             "has_final_report": self.final_report is not None,
         }
+
+    # ---- Serialisation ----
+
+    def to_dict(self) -> dict:
+        """Serialise the full session state (used for checkpoints)."""
+        return {
+            "id": self.id,
+            "original_query": self.original_query,
+            "created_at": self.created_at.isoformat(),
+            "parsed_intent": self.parsed_intent,
+            "perspectives": self.perspectives,
+            "task_graph": self.task_graph.to_dict(),
+            "mind_map": self.mind_map.to_dict(),
+            "retrieved_documents": self.retrieved_documents,
+            "verification_results": self.verification_results,
+            "conflicts": self.conflicts,
+            "draft_iterations": self.draft_iterations,
+            "final_report": self.final_report,
+            "usage": self.usage.to_dict(),
+            "current_phase": self.current_phase,
+            "status": self.status,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ResearchSession:
+        """Restore a session previously produced by :meth:`to_dict`."""
+        data = dict(data)
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        data["task_graph"] = TaskGraph.from_dict(data.get("task_graph", {}))
+        data["mind_map"] = EpistemicMindMap.from_dict(data.get("mind_map", {}))
+        data["usage"] = UsageLedger.from_dict(data.get("usage", {}))
+        known = cls.__dataclass_fields__
+        return cls(**{k: v for k, v in data.items() if k in known})
@@ -5,26 +5,55 @@ from __future__ import annotations
 from collections import deque
 from typing import Optional
 
+from .task_index import TaskIndex
 from .task_node import TaskNode, TaskStatus
 
 
 class TaskGraph:
-    """Directed acyclic graph of TaskNodes."""
+    """Directed acyclic graph of TaskNodes.
+
+    Readiness and progress are maintained incrementally: every task's
+    ``mark_*`` transition is reported back to the graph, so
+    :meth:`get_ready_tasks` and :meth:`get_progress` never rescan it.
+    """
 
     def __init__(self) -> None:
         self._nodes: dict[str, TaskNode] = {}
         self._adjacency: dict[str, list[str]] = {}  # task_id -> dependents
+        self._position: dict[str, int] = {}  # task_id -> insertion order
+        self._index = TaskIndex()
 
     # --- Mutation ---
 
     def add_task(self, node: TaskNode) -> None:
         """Add a task node to the graph."""
+        previous = self._nodes.get(node.id)
+        if previous is not None:
+            previous._observer = None
+            self._index.untrack(previous)
+            # The replaced node's dependency edges must not reach the new one.
+            for dep_id in previous.dependencies:
+                dependents = self._adjacency.get(dep_id)
+                if dependents is not None and node.id in dependents:
+                    dependents.remove(node.id)
         self._nodes[node.id] = node
+        self._position.setdefault(node.id, len(self._position))
         self._adjacency.setdefault(node.id, [])
         for dep_id in node.dependencies:
             self._adjacency.setdefault(dep_id, [])
             if node.id not in self._adjacency[dep_id]:
                 self._adjacency[dep_id].append(node.id)
+        unmet = sum(1 for dep_id in node.dependencies
+                    if not self._is_done(dep_id))
+        self._index.track(node, unmet)
+        node._observer = self._on_transition
+        # Dependents added before this node (or before it was replaced)
+        # must see its completion state change.
+        was_done = previous is not None and previous.status == TaskStatus.COMPLETED
+        self._index.propagate(
+            was_done, node.status == TaskStatus.COMPLETED,
+            [t for t in self.get_dependents(node.id) if t is not node],
+        )
 
     def add_dependency(self, task_id: str, depends_on_id: str) -> None:
         """Declare that task_id depends on depends_on_id."""
@@ -33,8 +62,9 @@ class TaskGraph:
             raise KeyError(f"Task {task_id} not found.")
         if depends_on_id not in self._nodes:
             raise KeyError(f"Dependency {depends_on_id} not found.")
-        if depends_on_id not in task.dependencies:
-            task.dependencies.append(depends_on_id)
+        if task.add_dependency(depends_on_id):
+            if not self._is_done(depends_on_id):
+                self._index.block(task)
         self._adjacency.setdefault(depends_on_id, [])
         if task_id not in self._adjacency[depends_on_id]:
             self._adjacency[depends_on_id].append(task_id)
@@ -48,41 +78,26 @@ class TaskGraph:
     def get_task(self, task_id: str) -> Optional[TaskNode]:
         return self._nodes.get(task_id)
 
-    def get_ready_tasks(self) -> list[TaskNode]:
-        """Return PENDING tasks whose dependencies are all COMPLETED."""
-        completed_ids = {
-            tid
-            for tid, t in self._nodes.items()
-            if t.status == TaskStatus.COMPLETED
-        }
+    def get_tasks(self) -> list[TaskNode]:
+        """Return every task in insertion order."""
+        return list(self._nodes.values())
+
+    def get_dependents(self, task_id: str) -> list[TaskNode]:
+        """Return the tasks that directly depend on *task_id*."""
         return [
-            t
-            for t in self._nodes.values()
-            if t.status == TaskStatus.PENDING and t.is_ready(completed_ids)
+            self._nodes[tid]
+            for tid in self._adjacency.get(task_id, [])
+            if tid in self._nodes
         ]
 
+    def get_ready_tasks(self) -> list[TaskNode]:
+        """Return PENDING tasks with all dependencies COMPLETED, in insertion order."""
+        ready = sorted(self._index.ready, key=self._position.__getitem__)
+        return [self._nodes[tid] for tid in ready]
+
     def get_progress(self) -> dict:
         """Return counts of tasks by status."""
-        total = len(self._nodes)
-        completed = sum(
-            1 for t in self._nodes.values()
-            if t.status == TaskStatus.COMPLETED
-        )
-        failed = sum(
-            1 for t in self._nodes.values()
-            if t.status == TaskStatus.FAILED
-        )
-        running = sum(
-            1 for t in self._nodes.values()
-            if t.status == TaskStatus.RUNNING
-        )
-        return {
-            "total": total,
-            "completed": completed,
-            "failed": failed,
-            "running": running,
-            "pending": total - completed - failed - running,
-        }
+        return self._index.progress()
 
     def get_topological_layers(self) -> list[list[TaskNode]]:
         """Return tasks grouped into dependency layers (Kahn's algo)."""
@@ -92,9 +107,7 @@ class TaskGraph:
                 if dep in self._nodes:
                     in_degree[t.id] = in_degree.get(t.id, 0) + 1
 
-        queue = deque(
-            tid for tid, deg in in_degree.items() if deg == 0
-        )
+        queue = deque(tid for tid, deg in in_degree.items() if deg == 0)
         layers: list[list[TaskNode]] = []
         while queue:
             layer_ids = list(queue)
@@ -118,9 +131,18 @@ class TaskGraph:
     @classmethod
     def from_dict(cls, data: dict) -> TaskGraph:
         tg = cls()
-        for tid, tdata in data.get("nodes", {}).items():
-            tg._nodes[tid] = TaskNode.from_dict(tdata)
-        tg._adjacency = {
-            k: list(v) for k, v in data.get("adjacency", {}).items()
-        }
+        for tdata in data.get("nodes", {}).values():
+            tg.add_task(TaskNode.from_dict(tdata))
+        for dep_id, dependents in data.get("adjacency", {}).items():
+            known = tg._adjacency.setdefault(dep_id, [])
+            known.extend(t for t in dependents if t not in known)
         return tg
+
+    # --- Internals ---
+
+    def _is_done(self, task_id: str) -> bool:
+        task = self._nodes.get(task_id)
+        return task is not None and task.status == TaskStatus.COMPLETED
+
+    def _on_transition(self, node: TaskNode, previous: TaskStatus) -> None:
+        self._index.transition(node, previous, self.get_dependents(node.id))
@@ -0,0 +1,93 @@
+"""TaskIndex: incremental readiness and status counters for a TaskGraph."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from .task_node import TaskNode, TaskStatus
+
+
+class TaskIndex:
+    """Keeps per-task unmet-dependency counts, a ready set and status totals.
+
+    ``TaskGraph`` feeds it every insertion and status transition, so
+    readiness and progress queries never rescan the graph.  A task is
+    *ready* when it is PENDING and none of its dependencies is still
+    short of COMPLETED (a dependency that is not in the graph yet counts
+    as unmet).
+    """
+
+    def __init__(self) -> None:
+        self.unmet: dict[str, int] = {}
+        self.ready: dict[str, None] = {}  # insertion-ordered set
+        self.counts: dict[TaskStatus, int] = {s: 0 for s in TaskStatus}
+
+    def track(self, node: TaskNode, unmet: int) -> None:
+        """Start tracking *node* with *unmet* outstanding dependencies."""
+        self.counts[node.status] += 1
+        self.unmet[node.id] = unmet
+        self._refresh(node)
+
+    def untrack(self, node: TaskNode) -> None:
+        """Stop tracking *node* (used when a task id is replaced)."""
+        self.counts[node.status] -= 1
+        self.unmet.pop(node.id, None)
+        self.ready.pop(node.id, None)
+
+    def block(self, node: TaskNode) -> None:
+        """Record one more unmet dependency on *node*."""
+        self.unmet[node.id] = self.unmet.get(node.id, 0) + 1
+        self.ready.pop(node.id, None)
+
+    def unblock(self, node: TaskNode) -> None:
+        """Record that one of *node*'s dependencies has completed."""
+        self.unmet[node.id] = max(self.unmet.get(node.id, 0) - 1, 0)
+        self._refresh(node)
+
+    def transition(
+        self,
+        node: TaskNode,
+        previous: TaskStatus,
+        dependents: Iterable[TaskNode],
+    ) -> None:
+        """Apply a status change of *node* from *previous*."""
+        self.counts[previous] -= 1
+        self.counts[node.status] += 1
+        self._refresh(node)
+        self.propagate(
+            previous == TaskStatus.COMPLETED,
+            node.status == TaskStatus.COMPLETED,
+            dependents,
+        )
+
+    def propagate(
+        self, was_done: bool, is_done: bool, dependents: Iterable[TaskNode],
+    ) -> None:
+        """Block or unblock *dependents* when a dependency's completion flips."""
+        if was_done == is_done:
+            return
+        for dependent in dependents:
+            if is_done:
+                self.unblock(dependent)
+            else:
+                self.block(dependent)
+
+    def progress(self) -> dict:
+        """Return task counts by status."""
+        total = sum(self.counts.values())
+        completed = self.counts[TaskStatus.COMPLETED]
+        failed = self.counts[TaskStatus.FAILED]
+        running = self.counts[TaskStatus.RUNNING]
+        return {
+            "total": total,
+            "completed": completed,
+            "failed": failed,
+            "running": running,
+            "pending": total - completed - failed - running,
+        }
+
+    def _refresh(self, node: TaskNode) -> None:
+        if node.status == TaskStatus.PENDING and self.unmet.get(node.id, 0) == 0:
+            self.ready[node.id] = None
+        else:
+            self.ready.pop(node.id, None)
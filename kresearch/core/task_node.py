@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import sys
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+
+from .ordered_set import OrderedSet, compact, grow
 
 
 class TaskType(str, Enum):
@@ -21,38 +24,64 @@ class TaskStatus(str, Enum):
     FAILED = "FAILED"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskNode:
-    """A single task in the research task graph."""
+    """A single task in the research task graph.
+
+    Slotted; ``dependencies`` has ordered-set semantics (a tuple until
+    modified through :meth:`add_dependency`) and the perspective name is
+    interned.
+    """
 
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     task_type: TaskType = TaskType.SEARCH
     query: str = ""
     priority: int = 0
     status: TaskStatus = TaskStatus.PENDING
-    dependencies: list[str] = field(default_factory=list)
+    dependencies: OrderedSet | tuple = ()
     results: list[Any] = field(default_factory=list)
     metadata: dict = field(default_factory=dict)
     perspective: Optional[str] = None
+    # Set by the owning TaskGraph; called as observer(node, previous_status)
+    _observer: Optional[Callable[[TaskNode, TaskStatus], None]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        self.dependencies = compact(self.dependencies)
+        if self.perspective is not None:
+            self.perspective = sys.intern(self.perspective)
 
     def is_ready(self, completed_ids: set[str] | list[str]) -> bool:
         """Return True if all dependencies are in completed_ids."""
         completed = set(completed_ids)
         return all(dep in completed for dep in self.dependencies)
 
+    def add_dependency(self, task_id: str) -> bool:
+        """Depend on *task_id*; return ``False`` if already present."""
+        self.dependencies = grow(self.dependencies)
+        return self.dependencies.add(task_id)
+
     def mark_running(self) -> None:
         """Transition this task to RUNNING status."""
-        self.status = TaskStatus.RUNNING
+        self._set_status(TaskStatus.RUNNING)
 
     def mark_completed(self, results: list[Any]) -> None:
         """Transition to COMPLETED and store results."""
-        self.status = TaskStatus.COMPLETED
         self.results = results
+        self._set_status(TaskStatus.COMPLETED)
 
     def mark_failed(self, error: str) -> None:
         """Transition to FAILED and store error in metadata."""
-        self.status = TaskStatus.FAILED
         self.metadata["error"] = error
+        self._set_status(TaskStatus.FAILED)
+
+    def _set_status(self, status: TaskStatus) -> None:
+        """Change status and notify the owning graph, if any."""
+        previous = self.status
+        self.status = status
+        if self._observer is not None and previous != status:
+            self._observer(self, previous)
 
     def to_dict(self) -> dict:
         return {
@@ -0,0 +1,113 @@
+"""UsageLedger: token, latency and cost accounting for a research run."""
+
+from __future__ import annotations
+
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional
+
+# Labels (phase, task, site) of the code currently issuing provider calls.
+# asyncio tasks copy the context, so labels follow work into subtasks.
+_SCOPE: ContextVar[dict[str, str]] = ContextVar("kresearch_usage_scope",
+                                                 default={})
+
+_DIMENSIONS = ("phase", "task", "site", "model")
+
+
+@contextmanager
+def usage_scope(**labels: str) -> Iterator[None]:
+    """Attribute provider calls made inside the block to *labels*."""
+    token = _SCOPE.set({**_SCOPE.get(), **labels})
+    try:
+        yield
+    finally:
+        _SCOPE.reset(token)
+
+
+def current_scope() -> dict[str, str]:
+    """Return the labels of the innermost :func:`usage_scope`."""
+    return _SCOPE.get()
+
+
+def call_site(name: str) -> Callable:
+    """Decorator: label every provider call of an async function *name*
+    (e.g. ``"phase3.extract"``)."""
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with usage_scope(site=name):
+                return await fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _bucket() -> dict[str, Any]:
+    return {"calls": 0, "cached": 0, "input_tokens": 0, "output_tokens": 0,
+            "cached_input_tokens": 0, "latency": 0.0, "cost": 0.0}
+
+
+class UsageLedger:
+    """Aggregates usage per phase, task, call site and model.
+
+    Cached responses count as calls but add no tokens or cost, since
+    the provider was never billed for them.  ``cached_input_tokens`` is
+    the part of ``input_tokens`` the provider served from its prompt
+    cache.
+    """
+
+    def __init__(self) -> None:
+        self.totals = _bucket()
+        self.breakdown: dict[str, dict[str, dict[str, Any]]] = {
+            dim: {} for dim in _DIMENSIONS
+        }
+
+    def record(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        latency: float,
+        cost: float = 0.0,
+        cached: bool = False,
+        labels: Optional[dict[str, str]] = None,
+        cached_input_tokens: int = 0,
+    ) -> None:
+        """Add one provider call, attributed to *labels* (default: the
+        current :func:`usage_scope`)."""
+        labels = current_scope() if labels is None else labels
+        buckets = [self.totals] + [
+            self.breakdown[dim].setdefault(labels[dim], _bucket())
+            for dim in _DIMENSIONS if labels.get(dim)
+        ]
+        for bucket in buckets:
+            bucket["calls"] += 1
+            bucket["latency"] += latency
+            if cached:
+                bucket["cached"] += 1
+                continue
+            bucket["input_tokens"] += input_tokens
+            bucket["output_tokens"] += output_tokens
+            bucket["cached_input_tokens"] += cached_input_tokens
+            bucket["cost"] += cost
+
+    def tokens(self, phase: Optional[str] = None) -> int:
+        """Billed tokens for the whole run, or for one *phase*."""
+        bucket = self.totals if phase is None else \
+            self.breakdown["phase"].get(phase, _bucket())
+        return bucket["input_tokens"] + bucket["output_tokens"]
+
+    def cost(self) -> float:
+        return self.totals["cost"]
+
+    def to_dict(self) -> dict:
+        return {"totals": dict(self.totals),
+                **{dim: dict(rows) for dim, rows in self.breakdown.items()}}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> UsageLedger:
+        ledger = cls()
+        ledger.totals.update(data.get("totals", {}))
+        for dim in _DIMENSIONS:
+            ledger.breakdown[dim] = {k: {**_bucket(), **v}
+                                     for k, v in data.get(dim, {}).items()}
+        return ledger
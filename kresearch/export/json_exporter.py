@@ -60,6 +60,7 @@ def _build_payload(content: str, session: ResearchSession) -> dict:
         "perspectives": session.perspectives,
         "task_graph": session.task_graph.to_dict(),
         "mind_map": session.mind_map.to_dict(),
+        "usage": session.usage.to_dict(),
         "artifacts": {
             "documents_retrieved": len(session.retrieved_documents),
             "verifications": len(session.verification_results),
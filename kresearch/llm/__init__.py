@@ -1,6 +1,7 @@
 """LLM provider module -- unified interface for multiple LLM backends."""
 
 from .base import LLMProvider
+from .cache_store import LLMCacheStore
 from .factory import create_provider, get_llm_provider
 from .models import ALL_MODELS, DEFAULT_MODELS, fetch_available_models
 from .registry import get_provider_class, list_providers, register
@@ -13,6 +14,14 @@ from . import grok_provider as _grok  # noqa: F401
 from . import perplexity_provider as _perplexity  # noqa: F401
 from . import deepseek_provider as _deepseek  # noqa: F401
 from . import ollama_provider as _ollama  # noqa: F401
+from . import mock_provider as _mock  # noqa: F401
+from . import cached_provider as _cached  # noqa: F401
+from . import metered_provider as _metered  # noqa: F401
+from . import throttled_provider as _throttled  # noqa: F401
+from . import coalesced_provider as _coalesced  # noqa: F401
+from . import router_provider as _router  # noqa: F401
+from . import site_routed_provider as _site_routed  # noqa: F401
+from . import resilient_provider as _resilient  # noqa: F401
 
 # Re-export the factory function under the legacy alias.
 LLMFactory = create_provider
@@ -20,6 +29,7 @@ LLMFactory = create_provider
 __all__ = [
     "LLMProvider",
     "LLMFactory",
+    "LLMCacheStore",
     "create_provider",
     "get_llm_provider",
     "get_provider_class",
@@ -7,6 +7,7 @@ from typing import AsyncIterator
 
 from .base import LLMProvider
 from .models import ANTHROPIC_MODELS
+from .prompt_cache import anthropic_messages
 from .registry import register
 
 
@@ -54,7 +55,8 @@ class AnthropicProvider(LLMProvider):
         client = self._get_client()
 
         # Anthropic requires separating system from user/assistant messages.
-        filtered = [m for m in messages if m.get("role") != "system"]
+        filtered = anthropic_messages(
+            [m for m in messages if m.get("role") != "system"])
         system_parts: list[str] = []
         if system_prompt:
             system_parts.append(system_prompt)
@@ -78,12 +80,17 @@ class AnthropicProvider(LLMProvider):
             if hasattr(block, "text"):
                 content += block.text
 
+        # input_tokens excludes the prompt-cache reads and writes.
+        usage = response.usage
+        cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
         return {
             "content": content,
             "model": response.model,
             "usage": {
-                "input_tokens": response.usage.input_tokens,
-                "output_tokens": response.usage.output_tokens,
+                "input_tokens": usage.input_tokens + cache_read + cache_write,
+                "output_tokens": usage.output_tokens,
+                "cached_input_tokens": cache_read,
             },
         }
 
@@ -97,7 +104,8 @@ class AnthropicProvider(LLMProvider):
     ) -> AsyncIterator[str]:
         client = self._get_client()
 
-        filtered = [m for m in messages if m.get("role") != "system"]
+        filtered = anthropic_messages(
+            [m for m in messages if m.get("role") != "system"])
         system_parts: list[str] = []
         if system_prompt:
             system_parts.append(system_prompt)
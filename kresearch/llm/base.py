@@ -23,6 +23,11 @@ class LLMProvider(ABC):
         """Return the list of models this provider supports."""
         ...
 
+    @property
+    def default_model(self) -> str:
+        """Return the model used when the caller has no preference."""
+        return self.available_models[0]
+
     @abstractmethod
     async def complete(
         self,
@@ -39,7 +44,9 @@ class LLMProvider(ABC):
         Returns a dict with keys:
             - content (str): The generated text.
             - model (str): The model that was used.
-            - usage (dict): Token usage with keys input_tokens, output_tokens.
+            - usage (dict): Token usage with keys input_tokens, output_tokens
+              and, where the provider reports it, cached_input_tokens (the
+              part of input_tokens served from its prompt cache).
         """
         ...
 
@@ -66,3 +73,11 @@ class LLMProvider(ABC):
     def supports_grounding(self) -> bool:
         """Whether the provider supports grounding / search augmentation."""
         return False
+
+    async def aclose(self) -> None:
+        """Release the SDK / HTTP clients this provider holds open."""
+        from kresearch.utils.http import close_quietly
+
+        await close_quietly(getattr(self, "_client", None),
+                            getattr(self, "_http", None))
+        self._client = self._http = None
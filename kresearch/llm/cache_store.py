@@ -0,0 +1,118 @@
+"""LLMCacheStore: content-addressed SQLite storage for LLM responses."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+def cache_key(provider: str, request: dict[str, Any]) -> str:
+    """Return the SHA-256 content address of a completion request."""
+    payload = json.dumps([provider, request], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCacheStore:
+    """Size-bounded, TTL-aware response cache in a single SQLite file.
+
+    Entries expire ``ttl_seconds`` after they were written (``0`` keeps
+    them forever).  Once more than ``max_entries`` are stored, the least
+    recently read entries are evicted.  ``stats`` counts hits, misses,
+    writes and evictions for ``/status``.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        ttl_seconds: int = 7 * 24 * 3600,
+        max_entries: int = 10_000,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0, "skipped": 0, "writes": 0,
+                      "expired": 0, "evicted": 0}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._count = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached response for *key*, or ``None``."""
+        row = self._db.execute(
+            "SELECT value, created FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        now = time.time()
+        if row is not None and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+            self._delete(key)
+            self.stats["expired"] += 1
+            row = None
+        if row is None:
+            self.stats["misses"] += 1
+            return None
+        self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?",
+                         (now, key))
+        self.stats["hits"] += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, value: dict) -> None:
+        """Store *value* under *key*, evicting LRU entries past the bound."""
+        now = time.time()
+        existed = self._db.execute(
+            "SELECT 1 FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value, default=str), now, now),
+        )
+        self.stats["writes"] += 1
+        if not existed:
+            self._count += 1
+        if self._count > self.max_entries:
+            self._evict(self._count - self.max_entries)
+
+    def clear(self) -> None:
+        self._db.execute("DELETE FROM responses")
+        self._count = 0
+
+    def close(self) -> None:
+        self._db.close()
+
+    def metrics(self) -> dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        hit_rate = self.stats["hits"] / lookups if lookups else 0.0
+        return {"entries": self._count, "hit_rate": hit_rate, **self.stats}
+
+    # ------------------------------------------------------------------
+
+    def _delete(self, key: str) -> None:
+        cursor = self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+        self._count -= cursor.rowcount
+
+    def _evict(self, excess: int) -> None:
+        cursor = self._db.execute(
+            "DELETE FROM responses WHERE key IN ("
+            "SELECT key FROM responses ORDER BY accessed LIMIT ?)",
+            (excess,),
+        )
+        self._count -= cursor.rowcount
+        self.stats["evicted"] += cursor.rowcount
@@ -0,0 +1,102 @@
+"""Caching wrapper that serves repeated completions from an LLMCacheStore."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import AsyncIterator
+
+from .base import LLMProvider
+from .cache_store import LLMCacheStore, cache_key
+from .delegating_provider import DelegatingLLMProvider
+from .registry import register
+
+
+class CachedChunk(str):
+    """A streamed chunk replayed from the cache (not billed by metering)."""
+
+
+class CachedLLMProvider(DelegatingLLMProvider):
+    """Wraps another provider and caches ``complete`` results on disk.
+
+    Usage::
+
+        create_provider("cached", inner=create_provider("openai"),
+                        store=LLMCacheStore("cache.sqlite3"))
+
+    *inner* may also be a provider name and *store* a path.  With
+    ``cache_sampled=False`` calls with ``temperature > 0`` bypass the
+    cache.  Cache hits are returned with ``"cached": True`` so callers
+    can tell them apart; a streamed hit arrives as one :class:`CachedChunk`
+    and shares its entry with the equivalent non-JSON ``complete`` call.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        inner: LLMProvider | str | None = None,
+        store: LLMCacheStore | Path | str | None = None,
+        cache_sampled: bool = True,
+        **kwargs,
+    ):
+        if isinstance(inner, str):
+            from .factory import create_provider
+            inner = create_provider(inner, api_key=api_key, **kwargs)
+        super().__init__(api_key=api_key, inner=inner, store=store)
+        self.store = store if isinstance(store, LLMCacheStore) else LLMCacheStore(store)
+        self.cache_sampled = cache_sampled
+
+    async def complete(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        json_mode: bool = False,
+        system_prompt: str | None = None,
+    ) -> dict:
+        request = {
+            "model": model, "messages": messages, "system_prompt": system_prompt,
+            "temperature": temperature, "max_tokens": max_tokens,
+            "json_mode": json_mode,
+        }
+        if temperature > 0 and not self.cache_sampled:
+            self.store.stats["skipped"] += 1
+            return await self.inner.complete(**request)
+        key = cache_key(self.inner.name, request)
+        cached = self.store.get(key)
+        if cached is not None:
+            return {**cached, "cached": True}
+        response = await self.inner.complete(**request)
+        self.store.put(key, response)
+        return response
+
+    async def stream(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[str]:
+        request = {
+            "model": model, "messages": messages, "system_prompt": system_prompt,
+            "temperature": temperature, "max_tokens": max_tokens,
+        }
+        key = None
+        if temperature > 0 and not self.cache_sampled:
+            self.store.stats["skipped"] += 1
+        else:
+            key = cache_key(self.inner.name, {**request, "json_mode": False})
+            cached = self.store.get(key)
+            if cached is not None:
+                yield CachedChunk(cached.get("content", ""))
+                return
+        parts: list[str] = []
+        async for chunk in self.inner.stream(**request):
+            parts.append(chunk)
+            yield chunk
+        if key is not None:
+            self.store.put(key, {"content": "".join(parts), "model": model})
+
+
+register("cached", CachedLLMProvider)
@@ -0,0 +1,64 @@
+"""Coalescing wrapper that shares identical in-flight completions."""
+
+from __future__ import annotations
+
+import copy
+
+from kresearch.utils.single_flight import SingleFlight
+
+from .base import LLMProvider
+from .cache_store import cache_key
+from .delegating_provider import DelegatingLLMProvider
+from .registry import register
+
+
+def _shared(response: dict) -> dict:
+    return {**copy.deepcopy(response), "shared": True}
+
+
+class CoalescedLLMProvider(DelegatingLLMProvider):
+    """Wraps another provider so identical concurrent ``complete`` calls
+    make one request.
+
+    Calls are keyed like the response cache.  Joined callers get a copy
+    of the response marked ``"shared": True``, which the usage meter
+    treats as free.  With ``coalesce_sampled=False`` calls with
+    ``temperature > 0`` are never joined, since each caller expects its
+    own sample.  Streaming calls pass straight through.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        inner: LLMProvider | None = None,
+        flight: SingleFlight | None = None,
+        coalesce_sampled: bool = False,
+        **kwargs,
+    ):
+        super().__init__(api_key=api_key, inner=inner)
+        self.flight = flight or SingleFlight()
+        self.coalesce_sampled = coalesce_sampled
+
+    async def complete(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        json_mode: bool = False,
+        system_prompt: str | None = None,
+    ) -> dict:
+        request = {
+            "model": model, "messages": messages, "system_prompt": system_prompt,
+            "temperature": temperature, "max_tokens": max_tokens,
+            "json_mode": json_mode,
+        }
+        if temperature > 0 and not self.coalesce_sampled:
+            return await self.inner.complete(**request)
+        key = ("llm", cache_key(self.inner.name, request))
+        return await self.flight.do(
+            key, lambda: self.inner.complete(**request), share=_shared,
+        )
+
+
+register("coalesced", CoalescedLLMProvider)
@@ -0,0 +1,81 @@
+"""Base class for wrappers that decorate another LLM provider."""
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterator
+
+from .base import LLMProvider
+
+
+class DelegatingLLMProvider(LLMProvider):
+    """An :class:`LLMProvider` that forwards everything to *inner*.
+
+    Name, models and capabilities are *inner*'s, and ``complete`` and
+    ``stream`` pass straight through, so a wrapper overrides only the
+    calls it changes.  Subclasses pass the collaborators they cannot
+    work without as keywords; *inner* or any of them being ``None``
+    raises ``ValueError``.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        inner: LLMProvider | None = None,
+        **required: Any,
+    ):
+        super().__init__(api_key=api_key)
+        missing = [name for name, value in {"inner": inner, **required}.items()
+                   if value is None]
+        if missing:
+            raise ValueError(f"{type(self).__name__} needs "
+                             + " and ".join(f"'{name}'" for name in missing))
+        self.inner = inner
+
+    @property
+    def name(self) -> str:
+        return self.inner.name
+
+    @property
+    def available_models(self) -> list[str]:
+        return self.inner.available_models
+
+    @property
+    def default_model(self) -> str:
+        return self.inner.default_model
+
+    async def complete(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        json_mode: bool = False,
+        system_prompt: str | None = None,
+    ) -> dict:
+        return await self.inner.complete(
+            messages, model, temperature=temperature, max_tokens=max_tokens,
+            json_mode=json_mode, system_prompt=system_prompt,
+        )
+
+    async def stream(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[str]:
+        async for chunk in self.inner.stream(
+            messages, model, temperature=temperature,
+            max_tokens=max_tokens, system_prompt=system_prompt,
+        ):
+            yield chunk
+
+    def is_available(self) -> bool:
+        return self.inner.is_available()
+
+    def supports_json_mode(self) -> bool:
+        return self.inner.supports_json_mode()
+
+    def supports_grounding(self) -> bool:
+        return self.inner.supports_grounding()
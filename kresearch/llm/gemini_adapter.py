@@ -35,6 +35,8 @@ class LegacyGeminiAdapter:
             "usage": {
                 "input_tokens": getattr(usage, "prompt_token_count", 0),
                 "output_tokens": getattr(usage, "candidates_token_count", 0),
+                "cached_input_tokens":
+                    getattr(usage, "cached_content_token_count", 0) or 0,
             },
         }
 
@@ -82,6 +84,8 @@ class NewGeminiAdapter:
             "usage": {
                 "input_tokens": getattr(usage, "prompt_token_count", 0),
                 "output_tokens": getattr(usage, "candidates_token_count", 0),
+                "cached_input_tokens":
+                    getattr(usage, "cached_content_token_count", 0) or 0,
             },
         }
 
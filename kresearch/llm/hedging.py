@@ -0,0 +1,71 @@
+"""hedged_call: race attempts over ordered routes with hedging and failover."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+async def hedged_call(
+    attempt: Callable[[int], Awaitable[Any]],
+    routes: int,
+    hedge_after: Optional[float],
+    stats: dict[str, int],
+) -> Any:
+    """Return the first successful ``attempt(index)`` over *routes* routes.
+
+    Route 0 starts immediately.  If it is still running after
+    *hedge_after* seconds (``None`` disables hedging), the next route is
+    started alongside it and the first success wins; attempts still
+    running then are cancelled.  Whenever every running attempt has
+    failed, the next route is started (a failover).  The last error is
+    raised once all routes have failed.  ``hedged``, ``hedge_wins`` and
+    ``failovers`` in *stats* are incremented along the way.
+    """
+    pending: dict[asyncio.Future, int] = {}
+    launched = 0
+    last_exc: Optional[BaseException] = None
+    started = time.monotonic()
+
+    def launch() -> None:
+        nonlocal launched
+        task = asyncio.ensure_future(attempt(launched))
+        # Losers may fail after the winner returned; mark their errors seen.
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        pending[task] = launched
+        launched += 1
+
+    try:
+        while True:
+            if not pending:
+                if launched == routes:
+                    raise last_exc  # type: ignore[misc]
+                if launched:
+                    stats["failovers"] += 1
+                    hedge_after = None
+                launch()
+            wait = None
+            if hedge_after is not None and launched < routes:
+                wait = max(0.0, started + hedge_after - time.monotonic())
+            done, _ = await asyncio.wait(
+                pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+            if not done:  # the running attempt is past its usual latency
+                stats["hedged"] += 1
+                launch()
+                hedge_after = None
+                continue
+            for task in done:
+                index = pending.pop(task)
+                if task.exception() is None:
+                    if index and pending:
+                        stats["hedge_wins"] += 1
+                    return task.result()
+                last_exc = task.exception()
+                logger.warning("Route %d failed: %s", index, last_exc)
+    finally:
+        for task in pending:
+            task.cancel()
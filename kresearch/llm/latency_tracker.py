@@ -0,0 +1,53 @@
+"""LatencyTracker: rolling per-route latencies and router counters."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Optional
+
+_WINDOW = 200
+
+
+class LatencyTracker:
+    """Keeps the most recent attempt latencies per ``(provider, model)``.
+
+    Attempts that were cancelled or failed count with their elapsed
+    time, a lower bound on the latency they would have had.
+
+    Shared by every router built during a run, so the hedge threshold
+    learned in one phase carries over to the next.  ``stats`` counts
+    routed calls, hedges sent, hedges that won and failovers.
+    """
+
+    def __init__(self, window: int = _WINDOW) -> None:
+        self.window = window
+        self._samples: dict[tuple[str, str], deque[float]] = {}
+        self.stats = {"calls": 0, "hedged": 0, "hedge_wins": 0, "failovers": 0}
+
+    def add(self, provider: str, model: str, latency: float) -> None:
+        key = (provider, model)
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(latency)
+
+    def count(self, provider: str, model: str) -> int:
+        return len(self._samples.get((provider, model), ()))
+
+    def quantile(self, provider: str, model: str, q: float) -> Optional[float]:
+        """Return the *q*-quantile of recent latencies, or ``None``."""
+        samples = self._samples.get((provider, model))
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def metrics(self) -> dict[str, dict]:
+        return {
+            f"{provider}/{model}": {
+                "samples": len(samples),
+                "p50": self.quantile(provider, model, 0.5),
+                "p95": self.quantile(provider, model, 0.95),
+            }
+            for (provider, model), samples in sorted(self._samples.items())
+        }
@@ -0,0 +1,98 @@
+"""Metering wrapper that records usage of every call in a UsageLedger."""
+
+from __future__ import annotations
+
+import time
+from typing import AsyncIterator, Optional
+
+from kresearch.core.usage import UsageLedger, current_scope
+from kresearch.utils.tokenizer import count_tokens
+
+from .base import LLMProvider
+from .cached_provider import CachedChunk
+from .delegating_provider import DelegatingLLMProvider
+from .pricing import estimate_cost
+from .registry import register
+
+
+class MeteredLLMProvider(DelegatingLLMProvider):
+    """Wraps another provider and records tokens, latency and cost.
+
+    Each call is attributed to the labels of the active
+    :func:`~kresearch.core.usage.usage_scope` plus the requested model.
+    Cache hits and coalesced (``"shared"``) responses count as cached.
+    Streaming calls report no usage, so their tokens are counted from
+    the text.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        inner: LLMProvider | None = None,
+        ledger: UsageLedger | None = None,
+        prices: Optional[dict[str, tuple[float, float]]] = None,
+        **kwargs,
+    ):
+        super().__init__(api_key=api_key, inner=inner, ledger=ledger)
+        self.ledger = ledger
+        self.prices = prices
+
+    async def complete(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        json_mode: bool = False,
+        system_prompt: str | None = None,
+    ) -> dict:
+        started = time.monotonic()
+        response = await self.inner.complete(
+            messages, model, temperature=temperature, max_tokens=max_tokens,
+            json_mode=json_mode, system_prompt=system_prompt,
+        )
+        usage = response.get("usage") or {}
+        # A router may have served the call from another model.
+        self._record(response.get("model") or model,
+                     usage.get("input_tokens", 0) or 0,
+                     usage.get("output_tokens", 0) or 0,
+                     time.monotonic() - started,
+                     bool(response.get("cached") or response.get("shared")),
+                     usage.get("cached_input_tokens", 0) or 0)
+        return response
+
+    async def stream(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[str]:
+        started = time.monotonic()
+        chunks: list[str] = []
+        cached = False
+        async for chunk in self.inner.stream(
+            messages, model, temperature=temperature,
+            max_tokens=max_tokens, system_prompt=system_prompt,
+        ):
+            chunks.append(chunk)
+            cached = cached or isinstance(chunk, CachedChunk)
+            yield chunk
+        prompt = (system_prompt or "") + "".join(
+            str(m.get("content", "")) for m in messages)
+        self._record(model, count_tokens(prompt, model),
+                     max(count_tokens("".join(chunks), model), 1),
+                     time.monotonic() - started, cached)
+
+    def _record(self, model: str, input_tokens: int, output_tokens: int,
+                latency: float, cached: bool, prefix_cached: int = 0) -> None:
+        self.ledger.record(
+            input_tokens, output_tokens, latency,
+            cost=estimate_cost(model, input_tokens, output_tokens, self.prices),
+            cached=cached, labels={**current_scope(), "model": model},
+            cached_input_tokens=prefix_cached,
+        )
+
+
+register("metered", MeteredLLMProvider)
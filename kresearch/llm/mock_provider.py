@@ -0,0 +1,125 @@
+"""Mock LLM provider: deterministic offline responses with simulated latency."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+from typing import AsyncIterator
+
+from kresearch.core.usage import current_scope
+from kresearch.utils.latency_model import LatencyModel
+from kresearch.utils.tokenizer import count_tokens
+
+from .base import LLMProvider
+from .models import MOCK_MODELS
+from .mock_responses import mock_content, prompt_family
+from .prompt_cache import plain_messages
+from .registry import register
+
+# Run-specific ids (mind-map nodes, evidence) in prompts; keyed by order
+# of appearance so the same run draws the same responses every time.
+_UUID = re.compile(r"[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12}")
+
+
+class MockLLMProvider(LLMProvider):
+    """Answers every call locally with a schema-valid canned response.
+
+    The response is picked by prompt family (intent, perspectives,
+    findings, claims, data assessments, consistency, resolutions,
+    skeleton, evaluation, verification code, or prose) and is a
+    function of the request alone (ids in it count by order of
+    appearance, not value).  Latency and failures come from a
+    seeded :class:`~kresearch.utils.latency_model.LatencyModel` (a
+    stream fails, if at all, before its first chunk), plus
+    *token_latency* seconds per output token; prose runs to about
+    *output_tokens* tokens.  Usage is counted with the tokenizer.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        latency: float = 0.0,
+        distribution: str = "lognormal",
+        spread: float = 0.5,
+        failure_rate: float = 0.0,
+        token_latency: float = 0.0,
+        output_tokens: int = 200,
+        seed: int = 0,
+        **kwargs,
+    ):
+        super().__init__(api_key=api_key or "mock")
+        self.timing = LatencyModel(latency, distribution, spread, failure_rate, seed)
+        self.token_latency = token_latency
+        self.output_tokens = output_tokens
+
+    @property
+    def name(self) -> str:
+        return "mock"
+
+    @property
+    def available_models(self) -> list[str]:
+        return list(MOCK_MODELS)
+
+    async def complete(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        json_mode: bool = False,
+        system_prompt: str | None = None,
+    ) -> dict:
+        key, prompt, content = self._respond(messages, model, max_tokens,
+                                             system_prompt)
+        output_tokens = count_tokens(content, model)
+        await self.timing.wait(key, self.token_latency * output_tokens)
+        return {
+            "content": content,
+            "model": model,
+            "usage": {"input_tokens": count_tokens(prompt, model),
+                      "output_tokens": output_tokens},
+        }
+
+    async def stream(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[str]:
+        key, _, content = self._respond(messages, model, max_tokens, system_prompt)
+        await self.timing.wait(key)
+        words = content.split(" ")
+        for i in range(0, len(words), 8):
+            chunk = " ".join(words[i:i + 8]) + (" " if i + 8 < len(words) else "")
+            if self.token_latency:
+                await asyncio.sleep(self.token_latency * count_tokens(chunk, model))
+            yield chunk
+
+    def _respond(self, messages: list[dict], model: str, max_tokens: int,
+                 system_prompt: str | None) -> tuple[str, str, str]:
+        """Return the request key, the prompt text and the response."""
+        text = "\n\n".join(str(m.get("content", ""))
+                           for m in plain_messages(messages))
+        prompt = (system_prompt or "") + text
+        ids: dict[str, str] = {}
+        stable = _UUID.sub(lambda m: ids.setdefault(m[0], f"id{len(ids)}"), text)
+        key = hashlib.sha256(json.dumps(
+            [model, system_prompt, stable], default=str).encode()).hexdigest()
+        family = prompt_family(f"{system_prompt or ''}\n{text}",
+                               current_scope().get("site"))
+        words = max(1, min(self.output_tokens, max_tokens) * 3 // 4)
+        return key, prompt, mock_content(family, text, random.Random(key), words)
+
+    def is_available(self) -> bool:
+        return True
+
+    def supports_json_mode(self) -> bool:
+        return True
+
+
+register("mock", MockLLMProvider)
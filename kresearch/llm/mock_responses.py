@@ -0,0 +1,149 @@
+"""Canned, schema-valid responses per prompt family for the mock provider."""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+from typing import Any, Callable, Optional
+
+_WORDS = ("evidence", "analysis", "growth", "adoption", "cost", "policy",
+          "efficiency", "market", "research", "risk", "trend", "impact")
+
+# (family, call site, marker in the system prompt or messages); the call
+# site decides when one is set, the marker otherwise.
+_FAMILIES = (
+    ("intent", "phase1.intent", "research-intent analyser"),
+    ("perspectives", "phase1.perspectives", "research-team assembler"),
+    ("findings", "phase2.synthesise", "Extract key findings as JSON"),
+    ("claims", "phase3.extract", "claim-verification analyst"),
+    ("code", "phase3.code", "Python script"),
+    ("code", "phase3.stats", "Python code"),
+    ("assessments", "phase3.data", "fact-verification analyst"),
+    ("consistency", "phase4.consistency", "consistency auditor"),
+    ("resolutions", "phase4.resolve", "conflict-resolution specialist"),
+    ("skeleton", "phase5.skeleton", "report architect"),
+    ("evaluation", "phase5.evaluate", "report evaluator"),
+)
+
+
+def prompt_family(text: str, site: Optional[str] = None) -> str:
+    """Return the family of a request (``"text"`` for free-form prose)."""
+    for family, family_site, _ in _FAMILIES:
+        if site == family_site:
+            return family
+    for family, _, marker in _FAMILIES:
+        if marker in text:
+            return family
+    return "text"
+
+
+def mock_content(family: str, text: str, rng: random.Random, words: int) -> str:
+    """Return the response for *family*; JSON families are serialised."""
+    if family in ("text", "code"):
+        return _BUILDERS[family](text, rng, words)
+    return json.dumps(_BUILDERS[family](text, rng, words))
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _prose(text: str, rng: random.Random, words: int) -> str:
+    sentences = [_sentence(rng) for _ in range(max(1, words // 12))]
+    paragraphs = [" ".join(sentences[i:i + 5]) for i in range(0, len(sentences), 5)]
+    return "## Findings\n\n" + "\n\n".join(paragraphs)
+
+
+def _code(text: str, rng: random.Random, words: int) -> str:
+    verdict = {"verified": rng.random() < 0.7, "evidence": "mock check",
+               "analysis": "mock analysis", "computed_value": rng.randint(1, 100)}
+    return f"import json\nprint(json.dumps({verdict!r}))\n"
+
+
+def _intent(text: str, rng: random.Random, words: int) -> dict:
+    topic = text.strip().splitlines()[0][:120] if text.strip() else "topic"
+    return {"topic": topic,
+            "sub_questions": [f"What is the {w} of {topic}?"
+                              for w in rng.sample(_WORDS, 3)],
+            "complexity": "complex", "research_type": "exploratory"}
+
+
+def _perspectives(text: str, rng: random.Random, words: int) -> list:
+    return [{"name": f"{w.capitalize()} Expert", "role": _sentence(rng, 8),
+             "expertise": rng.sample(_WORDS, 2),
+             "questions": [_sentence(rng, 8)[:-1] + "?" for _ in range(2)]}
+            for w in rng.sample(_WORDS, 3)]
+
+
+def _findings(text: str, rng: random.Random, words: int) -> list:
+    return [{"claim": f"{rng.choice(_WORDS).capitalize()} rose by "
+                      f"{rng.randint(2, 60)}% between 2019 and 2024.",
+             "confidence": round(rng.uniform(0.4, 0.9), 2),
+             "perspectives": [rng.choice(_WORDS)]}
+            for _ in range(rng.randint(2, 4))]
+
+
+def _claims(text: str, rng: random.Random, words: int) -> list:
+    kinds = ("factual", "factual", "numerical", "statistical", "computational")
+    return [{"node_id": nid, "claim": claim.strip(), "claim_type": rng.choice(kinds),
+             "verification_approach": "cross-check against sources"}
+            for nid, claim in re.findall(r"^\[([^\]]+)\] (.+)$", text, re.M)]
+
+
+def _assessment(payload: str, rng: random.Random) -> dict:
+    return {"verdict": rng.choice(("supported", "supported", "refuted",
+                                   "inconclusive")),
+            "confidence": round(rng.uniform(0.3, 0.95), 2),
+            "supporting": ["mock source agrees"], "contradicting": [],
+            "reasoning": "mock assessment"}
+
+
+def _resolution(payload: str, rng: random.Random) -> dict:
+    nodes = re.findall(r"^Node (\S+): P=", payload, re.M)
+    return {"winning_node_id": nodes[0] if nodes else None,
+            "rejected_node_ids": nodes[1:], "reason": "mock resolution",
+            "confidence": round(rng.uniform(0.5, 0.9), 2)}
+
+
+def _batch(item: Callable[[str, random.Random], dict]):
+    """Answer a :func:`~kresearch.phases.json_batch.complete_json_batch`
+    request: one *item* result per ``--- id: ... ---`` block."""
+    def build(text: str, rng: random.Random, words: int) -> dict:
+        parts = re.split(r'^--- id: ("[^"]*") ---$', text, flags=re.M)
+        return {"results": [{"id": json.loads(key), **item(payload, rng)}
+                            for key, payload in zip(parts[1::2], parts[2::2])]}
+    return build
+
+
+def _consistency(text: str, rng: random.Random, words: int) -> list:
+    nodes = re.findall(r"^\[([^\]]+)\] \(", text, re.M)
+    if "numerical inconsistencies" not in text or len(nodes) < 2:
+        return []
+    return [{"node_ids": rng.sample(nodes, 2), "severity": "medium",
+             "description": "Mock figures disagree between these nodes."}]
+
+
+def _skeleton(text: str, rng: random.Random, words: int) -> dict:
+    ids = re.findall(r'"id": "([^"]+)"', text)
+    size = max(1, -(-len(ids) // 3))
+    return {"title": "Mock research report",
+            "sections": [{"heading": f"Section {i + 1}: {rng.choice(_WORDS)}",
+                          "key_points": [_sentence(rng, 6) for _ in range(2)],
+                          "source_node_ids": ids[i * size:(i + 1) * size]}
+                         for i in range(3)]}
+
+
+def _evaluation(text: str, rng: random.Random, words: int) -> dict:
+    dims = ("accuracy", "completeness", "coherence", "citations", "balance")
+    return {"scores": {d: rng.randint(7, 9) for d in dims},
+            "feedback": "Mock feedback: tighten the citations."}
+
+
+_BUILDERS: dict[str, Callable[[str, random.Random, int], Any]] = {
+    "text": _prose, "code": _code, "intent": _intent,
+    "perspectives": _perspectives, "findings": _findings, "claims": _claims,
+    "assessments": _batch(_assessment), "consistency": _consistency,
+    "resolutions": _batch(_resolution), "skeleton": _skeleton,
+    "evaluation": _evaluation,
+}
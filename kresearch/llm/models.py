@@ -10,6 +10,7 @@ GROK_MODELS: list[str] = ["grok-3", "grok-3-mini"]
 PERPLEXITY_MODELS: list[str] = ["sonar", "sonar-pro"]
 DEEPSEEK_MODELS: list[str] = ["deepseek-chat", "deepseek-reasoner"]
 OLLAMA_MODELS: list[str] = ["llama3", "mistral", "phi3", "gemma"]
+MOCK_MODELS: list[str] = ["mock"]
 
 ALL_MODELS: dict[str, list[str]] = {
     "openai": OPENAI_MODELS,
@@ -19,6 +20,7 @@ ALL_MODELS: dict[str, list[str]] = {
     "perplexity": PERPLEXITY_MODELS,
     "deepseek": DEEPSEEK_MODELS,
     "ollama": OLLAMA_MODELS,
+    "mock": MOCK_MODELS,
 }
 
 DEFAULT_MODELS: dict[str, str] = {
@@ -29,6 +31,7 @@ DEFAULT_MODELS: dict[str, str] = {
     "perplexity": "sonar-pro",
     "deepseek": "deepseek-chat",
     "ollama": "llama3",
+    "mock": "mock",
 }
 
 # API endpoints for listing models dynamically.
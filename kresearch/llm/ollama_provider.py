@@ -6,6 +6,7 @@ from typing import AsyncIterator
 
 from .base import LLMProvider
 from .models import OLLAMA_MODELS
+from .prompt_cache import plain_messages
 from .registry import register
 
 
@@ -55,7 +56,7 @@ class OllamaProvider(LLMProvider):
         system_prompt: str | None = None,
     ) -> dict:
         client = self._get_client()
-        msgs = list(messages)
+        msgs = plain_messages(messages)
         if system_prompt:
             msgs = [{"role": "system", "content": system_prompt}, *msgs]
 
@@ -90,7 +91,7 @@ class OllamaProvider(LLMProvider):
         system_prompt: str | None = None,
     ) -> AsyncIterator[str]:
         client = self._get_client()
-        msgs = list(messages)
+        msgs = plain_messages(messages)
         if system_prompt:
             msgs = [{"role": "system", "content": system_prompt}, *msgs]
 
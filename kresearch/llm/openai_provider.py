@@ -7,6 +7,7 @@ from typing import AsyncIterator
 
 from .base import LLMProvider
 from .models import OPENAI_MODELS
+from .prompt_cache import plain_messages
 from .registry import register
 
 
@@ -52,7 +53,7 @@ class OpenAIProvider(LLMProvider):
         system_prompt: str | None = None,
     ) -> dict:
         client = self._get_client()
-        msgs = list(messages)
+        msgs = plain_messages(messages)
         if system_prompt:
             msgs = [{"role": "system", "content": system_prompt}, *msgs]
 
@@ -68,6 +69,7 @@ class OpenAIProvider(LLMProvider):
         response = await client.chat.completions.create(**kwargs)
         choice = response.choices[0]
         usage = response.usage
+        details = getattr(usage, "prompt_tokens_details", None)
 
         return {
             "content": choice.message.content or "",
@@ -75,6 +77,7 @@ class OpenAIProvider(LLMProvider):
             "usage": {
                 "input_tokens": usage.prompt_tokens if usage else 0,
                 "output_tokens": usage.completion_tokens if usage else 0,
+                "cached_input_tokens": getattr(details, "cached_tokens", 0) or 0,
             },
         }
 
@@ -87,7 +90,7 @@ class OpenAIProvider(LLMProvider):
         system_prompt: str | None = None,
     ) -> AsyncIterator[str]:
         client = self._get_client()
-        msgs = list(messages)
+        msgs = plain_messages(messages)
         if system_prompt:
             msgs = [{"role": "system", "content": system_prompt}, *msgs]
 
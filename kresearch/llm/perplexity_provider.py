@@ -6,8 +6,11 @@ import json
 import os
 from typing import AsyncIterator
 
+from kresearch.utils.http import pooled_client
+
 from .base import LLMProvider
 from .models import PERPLEXITY_MODELS
+from .prompt_cache import plain_messages
 from .registry import register
 
 _BASE_URL = "https://api.perplexity.ai"
@@ -48,7 +51,7 @@ class PerplexityProvider(LLMProvider):
         system_prompt: str | None,
         stream: bool = False,
     ) -> dict:
-        msgs = list(messages)
+        msgs = plain_messages(messages)
         if system_prompt:
             msgs = [{"role": "system", "content": system_prompt}, *msgs]
         return {
@@ -68,14 +71,12 @@ class PerplexityProvider(LLMProvider):
         json_mode: bool = False,
         system_prompt: str | None = None,
     ) -> dict:
-        import httpx
-
         payload = self._build_payload(messages, model, temperature, max_tokens, system_prompt)
 
-        async with httpx.AsyncClient(timeout=120) as client:
-            resp = await client.post(f"{_BASE_URL}/chat/completions", headers=self._headers(), json=payload)
-            resp.raise_for_status()
-            data = resp.json()
+        client = pooled_client(self, timeout=120)
+        resp = await client.post(f"{_BASE_URL}/chat/completions", headers=self._headers(), json=payload)
+        resp.raise_for_status()
+        data = resp.json()
 
         choice = data["choices"][0]
         usage = data.get("usage", {})
@@ -96,23 +97,21 @@ class PerplexityProvider(LLMProvider):
         max_tokens: int = 4096,
         system_prompt: str | None = None,
     ) -> AsyncIterator[str]:
-        import httpx
-
         payload = self._build_payload(messages, model, temperature, max_tokens, system_prompt, stream=True)
 
-        async with httpx.AsyncClient(timeout=120) as client:
-            async with client.stream("POST", f"{_BASE_URL}/chat/completions", headers=self._headers(), json=payload) as resp:
-                resp.raise_for_status()
-                async for line in resp.aiter_lines():
-                    if not line.startswith("data: "):
-                        continue
-                    raw = line[len("data: "):]
-                    if raw.strip() == "[DONE]":
-                        break
-                    chunk = json.loads(raw)
-                    delta = chunk["choices"][0].get("delta", {})
-                    if delta.get("content"):
-                        yield delta["content"]
+        client = pooled_client(self, timeout=120)
+        async with client.stream("POST", f"{_BASE_URL}/chat/completions", headers=self._headers(), json=payload) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                raw = line[len("data: "):]
+                if raw.strip() == "[DONE]":
+                    break
+                chunk = json.loads(raw)
+                delta = chunk["choices"][0].get("delta", {})
+                if delta.get("content"):
+                    yield delta["content"]
 
 
 register("perplexity", PerplexityProvider)
@@ -0,0 +1,37 @@
+"""Estimated list prices per model, used for cost accounting."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+# USD per 1M tokens as (input, output).  Estimates from public price
+# lists; override or extend them with ``budget.prices`` in the config.
+MODEL_PRICES: dict[str, tuple[float, float]] = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "o3-mini": (1.10, 4.40),
+    "claude-sonnet-4-20250514": (3.00, 15.00),
+    "claude-haiku-4-5-20251001": (1.00, 5.00),
+    "gemini-2.0-flash": (0.10, 0.40),
+    "gemini-2.5-pro": (1.25, 10.00),
+    "grok-3": (3.00, 15.00),
+    "grok-3-mini": (0.30, 0.50),
+    "sonar": (1.00, 1.00),
+    "sonar-pro": (3.00, 15.00),
+    "deepseek-chat": (0.27, 1.10),
+    "deepseek-reasoner": (0.55, 2.19),
+}
+
+
+def estimate_cost(
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    overrides: Optional[dict[str, tuple[float, float]]] = None,
+) -> float:
+    """Return the estimated USD cost of a call (``0.0`` for unknown or
+    local models)."""
+    price = (overrides or {}).get(model) or MODEL_PRICES.get(model)
+    if not price:
+        return 0.0
+    return (input_tokens * price[0] + output_tokens * price[1]) / 1_000_000
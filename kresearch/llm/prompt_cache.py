@@ -0,0 +1,51 @@
+"""Prompt-prefix caching: provider-neutral cache breakpoints on messages."""
+
+from __future__ import annotations
+
+# Message key marking the end of a prompt prefix that later calls repeat.
+BREAKPOINT = "cache_breakpoint"
+
+# Anthropic allows four cache_control blocks per request.
+_MAX_ANTHROPIC_BREAKPOINTS = 4
+
+
+def cache_breakpoint(message: dict) -> dict:
+    """Return a copy of *message* marking the end of a reusable prefix.
+
+    Everything up to and including the message -- system prompt first --
+    is expected to be sent again unchanged, so providers with explicit
+    prompt caching (Anthropic) cache it.  Providers that cache prefixes
+    automatically (OpenAI, DeepSeek, Gemini) simply drop the marker.
+    """
+    return {**message, BREAKPOINT: True}
+
+
+def mark_last(messages: list[dict]) -> list[dict]:
+    """Return *messages* with a breakpoint on the last one, for growing
+    conversations whose next turn re-sends everything so far."""
+    if not messages:
+        return []
+    return [*messages[:-1], cache_breakpoint(messages[-1])]
+
+
+def plain_messages(messages: list[dict]) -> list[dict]:
+    """Return *messages* without breakpoint markers."""
+    return [
+        {k: v for k, v in m.items() if k != BREAKPOINT} if BREAKPOINT in m else m
+        for m in messages
+    ]
+
+
+def anthropic_messages(messages: list[dict]) -> list[dict]:
+    """Return *messages* for the Anthropic API, with ``cache_control`` on
+    the text block of each marked message (the last four at most)."""
+    marked = [i for i, m in enumerate(messages) if m.get(BREAKPOINT)]
+    keep = set(marked[-_MAX_ANTHROPIC_BREAKPOINTS:])
+    out: list[dict] = []
+    for i, m in enumerate(messages):
+        m = {k: v for k, v in m.items() if k != BREAKPOINT}
+        if i in keep and isinstance(m.get("content"), str):
+            m["content"] = [{"type": "text", "text": m["content"],
+                             "cache_control": {"type": "ephemeral"}}]
+        out.append(m)
+    return out
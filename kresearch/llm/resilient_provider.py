@@ -0,0 +1,69 @@
+"""Resilience wrapper: retries with backoff behind a per-provider breaker."""
+
+from __future__ import annotations
+
+from typing import AsyncIterator
+
+from kresearch.utils.resilience import Resilience
+
+from .base import LLMProvider
+from .delegating_provider import DelegatingLLMProvider
+from .registry import register
+
+
+class ResilientLLMProvider(DelegatingLLMProvider):
+    """Wraps another provider and retries its transient failures.
+
+    *resilience* is the run's shared
+    :class:`~kresearch.utils.resilience.Resilience`, so every wrapper of
+    the same provider shares one circuit breaker (``"llm:<name>"``).
+    Streams are retried only before their first chunk.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        inner: LLMProvider | None = None,
+        resilience: Resilience | None = None,
+        **kwargs,
+    ):
+        super().__init__(api_key=api_key, inner=inner, resilience=resilience)
+        self.resilience = resilience
+
+    async def complete(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        json_mode: bool = False,
+        system_prompt: str | None = None,
+    ) -> dict:
+        return await self.resilience.call(
+            f"llm:{self.name}",
+            lambda: self.inner.complete(
+                messages, model, temperature=temperature,
+                max_tokens=max_tokens, json_mode=json_mode,
+                system_prompt=system_prompt,
+            ),
+        )
+
+    async def stream(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[str]:
+        async for chunk in self.resilience.stream(
+            f"llm:{self.name}",
+            lambda: self.inner.stream(
+                messages, model, temperature=temperature,
+                max_tokens=max_tokens, system_prompt=system_prompt,
+            ),
+        ):
+            yield chunk
+
+
+register("resilient", ResilientLLMProvider)
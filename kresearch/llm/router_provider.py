@@ -0,0 +1,142 @@
+"""Routing wrapper with hedged requests and cross-provider failover."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Optional
+
+from .base import LLMProvider
+from .delegating_provider import DelegatingLLMProvider
+from .hedging import hedged_call
+from .latency_tracker import LatencyTracker
+from .models import DEFAULT_MODELS
+from .registry import register
+
+logger = logging.getLogger(__name__)
+
+Route = tuple[LLMProvider, Optional[str]]  # provider, model override
+
+
+class RouterLLMProvider(DelegatingLLMProvider):
+    """Sends each completion to a primary route, hedging and failing over.
+
+    *routes* lists ``(provider, model)`` pairs, primary first; a ``None``
+    model means the requested model on the primary and the provider's
+    default model elsewhere.  Once a call has run longer than the
+    primary's observed ``quantile`` latency (``hedge_after`` seconds
+    until ``min_samples`` calls have been seen), a duplicate is sent to
+    the next route; the first answer wins and the loser is cancelled.
+    When every running attempt has failed, the next route is tried.
+    Streams fail over only before their first chunk.  Name, models and
+    capabilities are the primary's; it is available if any route is.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        routes: list[Route] | None = None,
+        tracker: LatencyTracker | None = None,
+        hedge: bool = True,
+        quantile: float = 0.95,
+        min_samples: int = 20,
+        hedge_after: float = 30.0,
+        attempt_timeout: float | None = None,
+        **kwargs,
+    ):
+        if not routes:
+            raise ValueError("RouterLLMProvider needs at least one route")
+        super().__init__(api_key=api_key, inner=routes[0][0])
+        self.routes = list(routes)
+        self.tracker = tracker or LatencyTracker()
+        self.hedge = hedge
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.hedge_after = hedge_after
+        self.attempt_timeout = attempt_timeout
+
+    async def complete(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        json_mode: bool = False,
+        system_prompt: str | None = None,
+    ) -> dict:
+        request = {"messages": messages, "temperature": temperature,
+                   "max_tokens": max_tokens, "json_mode": json_mode,
+                   "system_prompt": system_prompt}
+        self.tracker.stats["calls"] += 1
+        return await hedged_call(
+            lambda index: self._attempt(index, model, request),
+            len(self.routes),
+            self._hedge_delay(model) if self.hedge else None,
+            self.tracker.stats,
+        )
+
+    async def stream(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[str]:
+        last_exc: Optional[BaseException] = None
+        for index, (provider, _) in enumerate(self.routes):
+            if index:
+                self.tracker.stats["failovers"] += 1
+            streamed = False
+            try:
+                async for chunk in provider.stream(
+                    messages, self._model_for(index, model),
+                    temperature=temperature, max_tokens=max_tokens,
+                    system_prompt=system_prompt,
+                ):
+                    streamed = True
+                    yield chunk
+                return
+            except Exception as exc:
+                if streamed:
+                    raise
+                last_exc = exc
+                logger.warning("Route %s failed to stream: %s", provider.name, exc)
+        raise last_exc  # type: ignore[misc]
+
+    def _model_for(self, index: int, model: str) -> str:
+        provider, override = self.routes[index]
+        if override:
+            return override
+        if index == 0 or provider.name == self.name:
+            return model
+        return DEFAULT_MODELS.get(provider.name) or provider.available_models[0]
+
+    def _hedge_delay(self, model: str) -> float:
+        primary = self.routes[0][0].name
+        model = self._model_for(0, model)
+        if self.tracker.count(primary, model) < self.min_samples:
+            return self.hedge_after
+        return self.tracker.quantile(primary, model, self.quantile) or self.hedge_after
+
+    async def _attempt(self, index: int, model: str, request: dict) -> dict:
+        provider = self.routes[index][0]
+        model = self._model_for(index, model)
+        started = time.monotonic()
+        call = provider.complete(model=model, **request)
+        if self.attempt_timeout:
+            call = asyncio.wait_for(call, self.attempt_timeout)
+        try:
+            return await call
+        finally:
+            # An attempt that was out-raced by a hedge or failed still
+            # took at least this long; leaving it out would pull the
+            # quantile down and make hedges fire ever earlier.
+            self.tracker.add(provider.name, model, time.monotonic() - started)
+
+    def is_available(self) -> bool:
+        return any(provider.is_available() for provider, _ in self.routes)
+
+
+register("router", RouterLLMProvider)
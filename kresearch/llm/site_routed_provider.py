@@ -0,0 +1,94 @@
+"""Per-call-site routing wrapper: picks provider and model by call site."""
+
+from __future__ import annotations
+
+from typing import AsyncIterator, Callable, Optional
+
+from kresearch.core.usage import current_scope
+from kresearch.utils.patterns import match_policy
+
+from .base import LLMProvider
+from .delegating_provider import DelegatingLLMProvider
+from .models import DEFAULT_MODELS
+from .registry import register
+
+SiteRoute = tuple[Optional[str], Optional[str]]  # provider, model
+
+
+class SiteRoutedLLMProvider(DelegatingLLMProvider):
+    """Sends each call to the provider and model configured for its site.
+
+    The site is the ``site`` label of the active
+    :func:`~kresearch.core.usage.usage_scope` (set by ``@call_site``).
+    *routes* maps sites -- exact names or ``prefix.*`` patterns such as
+    ``"phase4.*"`` -- to ``(provider, model)``; either may be ``None``.
+    Another provider is built with ``resolve(name)`` and runs the route's
+    model, or that provider's default model.  Calls from unrouted sites
+    go to *inner* with the requested model.  :attr:`default_model` is
+    *model*, the run's configured model.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        inner: LLMProvider | None = None,
+        model: str | None = None,
+        routes: dict[str, SiteRoute] | None = None,
+        resolve: Callable[[str], LLMProvider] | None = None,
+        **kwargs,
+    ):
+        super().__init__(api_key=api_key, inner=inner)
+        self.model = model
+        self.routes = dict(routes or {})
+        self._resolve = resolve
+        self._providers: dict[str, LLMProvider] = {}
+
+    @property
+    def default_model(self) -> str:
+        return self.model or self.inner.default_model
+
+    async def complete(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        json_mode: bool = False,
+        system_prompt: str | None = None,
+    ) -> dict:
+        provider, model = self._target(model)
+        return await provider.complete(
+            messages, model, temperature=temperature, max_tokens=max_tokens,
+            json_mode=json_mode, system_prompt=system_prompt,
+        )
+
+    async def stream(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[str]:
+        provider, model = self._target(model)
+        async for chunk in provider.stream(
+            messages, model, temperature=temperature,
+            max_tokens=max_tokens, system_prompt=system_prompt,
+        ):
+            yield chunk
+
+    def _target(self, model: str) -> tuple[LLMProvider, str]:
+        site = current_scope().get("site")
+        route = match_policy(self.routes, site) if site else None
+        if route is None:
+            return self.inner, model
+        name, override = route
+        if not name or name == self.inner.name or self._resolve is None:
+            return self.inner, override or model
+        provider = self._providers.get(name)
+        if provider is None:
+            provider = self._providers[name] = self._resolve(name)
+        return provider, override or DEFAULT_MODELS.get(name) or provider.default_model
+
+
+register("site_routed", SiteRoutedLLMProvider)
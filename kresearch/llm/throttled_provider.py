@@ -0,0 +1,97 @@
+"""Throttling wrapper that runs every call under a per-model limiter."""
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterator
+
+from kresearch.core.usage import current_scope
+from kresearch.utils.tokenizer import count_tokens
+
+from .base import LLMProvider
+from .delegating_provider import DelegatingLLMProvider
+from .registry import register
+
+
+class ThrottledLLMProvider(DelegatingLLMProvider):
+    """Wraps another provider and bounds its concurrency and call rate.
+
+    *limiters* is normally the run's
+    :class:`~kresearch.utils.limiter_tree.LimiterTree`: its
+    ``slot(provider, model, tokens, kind)`` returns an async context
+    manager yielding the call's rate grant (or ``None``), and
+    ``limits_tokens(provider, model)`` says whether to count tokens.  A streaming
+    call holds its slot until the stream is exhausted.  The call site is
+    passed as the *kind*, so adaptive limits compare each call's latency
+    with earlier calls from the same site.
+
+    Where a tokens-per-minute limit applies, each call reserves its
+    prompt tokens plus *max_tokens* (the most it can cost) and settles
+    to the usage the provider reports, or to the streamed text.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        inner: LLMProvider | None = None,
+        limiters: Any = None,
+        **kwargs,
+    ):
+        super().__init__(api_key=api_key, inner=inner, limiters=limiters)
+        self.limiters = limiters
+
+    async def complete(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        json_mode: bool = False,
+        system_prompt: str | None = None,
+    ) -> dict:
+        tokens = self._reserve(messages, model, max_tokens, system_prompt)
+        async with self.limiters.slot(self.name, model, tokens,
+                                      current_scope().get("site") or "") as grant:
+            response = await self.inner.complete(
+                messages, model, temperature=temperature,
+                max_tokens=max_tokens, json_mode=json_mode,
+                system_prompt=system_prompt,
+            )
+        usage = response.get("usage") or {}
+        if grant is not None and usage:
+            grant.settle((usage.get("input_tokens") or 0)
+                         + (usage.get("output_tokens") or 0))
+        return response
+
+    async def stream(
+        self,
+        messages: list[dict],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[str]:
+        tokens = self._reserve(messages, model, max_tokens, system_prompt)
+        async with self.limiters.slot(self.name, model, tokens,
+                                      current_scope().get("site") or "") as grant:
+            chunks: list[str] = []
+            async for chunk in self.inner.stream(
+                messages, model, temperature=temperature,
+                max_tokens=max_tokens, system_prompt=system_prompt,
+            ):
+                chunks.append(chunk)
+                yield chunk
+            if grant is not None and tokens:
+                grant.settle(tokens - max_tokens
+                             + count_tokens("".join(chunks), model))
+
+    def _reserve(self, messages: list[dict], model: str, max_tokens: int,
+                 system_prompt: str | None) -> int:
+        """Tokens to reserve for a call: 0 unless a token limit applies."""
+        if not self.limiters.limits_tokens(self.name, model):
+            return 0
+        prompt = (system_prompt or "") + "".join(
+            str(m.get("content", "")) for m in messages)
+        return count_tokens(prompt, model) + max_tokens
+
+
+register("throttled", ThrottledLLMProvider)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import abc
 from typing import Any
 
+from kresearch.core.budget import Budget
 from kresearch.core.session import ResearchSession
 from kresearch.core.event_bus import EventBus
 
@@ -37,16 +38,24 @@ class Phase(abc.ABC):
     async def execute(self) -> None:
         """Run this phase, mutating session in place."""
 
+    @property
+    def budget(self) -> Budget:
+        """The run's spend budget (unlimited when none is configured)."""
+        budget = self.ctx.get("budget")
+        if budget is None:
+            budget = self.ctx["budget"] = Budget(self.session.usage)
+        return budget
+
     async def validate_preconditions(self) -> bool:
         """Check if this phase can run. Override for custom checks."""
         return True
 
     async def _get_llm(self):
         """Convenience: get the configured LLM provider."""
-        from kresearch.llm.factory import create_provider
-        return create_provider(self.config.llm.provider)
+        from kresearch.phases.providers import get_llm
+        return get_llm(self.ctx)
 
     async def _get_search(self):
         """Convenience: get the configured search provider."""
-        from kresearch.search.factory import create_provider
-        return create_provider(self.config.search.provider)
+        from kresearch.phases.providers import get_search
+        return get_search(self.ctx)
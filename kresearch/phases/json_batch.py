@@ -0,0 +1,98 @@
+"""JSON batching: many independent items per LLM request, split by ID."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Any, Callable, Optional
+
+from kresearch.utils.text import extract_json
+
+logger = logging.getLogger(__name__)
+
+_BATCH_FORMAT = """
+
+You will receive several independent items, each introduced by its "id". \
+Assess every item on its own. Return a JSON object {"results": [...]} \
+with exactly one object per item; each object has an "id" key with the \
+item's id, plus the keys described above for a single item. Return ONLY \
+valid JSON. No markdown fences."""
+
+
+async def complete_json_batch(
+    llm: Any,
+    items: dict[str, str],
+    instructions: str,
+    *,
+    batch_size: int = 8,
+    rounds: int = 2,
+    validate: Optional[Callable[[dict], bool]] = None,
+    temperature: float = 0.1,
+    tokens_per_item: int = 512,
+) -> dict[str, dict]:
+    """Assess *items* (``id -> payload text``) in JSON-mode requests of up
+    to *batch_size* items each, sharing the *instructions* system prompt.
+
+    The response is split back out by ``"id"``.  Items that are missing,
+    are not objects, or fail *validate* -- and every item of a request
+    that failed or returned unparsable JSON -- are re-issued, up to
+    *rounds* requests in total.  Returns ``id -> result`` for the items
+    that succeeded; callers fall back for the rest.
+    """
+    system_prompt = instructions + _BATCH_FORMAT
+    pending = list(items)
+    results: dict[str, dict] = {}
+    for attempt in range(rounds):
+        if not pending:
+            break
+        batches = [pending[i:i + batch_size]
+                   for i in range(0, len(pending), batch_size)]
+        answers = await asyncio.gather(*(
+            _complete(llm, {key: items[key] for key in batch}, system_prompt,
+                      temperature, tokens_per_item)
+            for batch in batches
+        ))
+        for answer in answers:
+            for key, result in answer.items():
+                if validate is None or validate(result):
+                    results[key] = result
+        pending = [key for key in pending if key not in results]
+        if pending and attempt + 1 < rounds:
+            logger.info("Re-issuing %d of %d batched items.",
+                        len(pending), len(items))
+    return results
+
+
+async def _complete(
+    llm: Any, batch: dict[str, str], system_prompt: str,
+    temperature: float, tokens_per_item: int,
+) -> dict[str, dict]:
+    """Send one batch; return its well-formed results by id."""
+    message = "\n\n".join(
+        f"--- id: {json.dumps(key)} ---\n{payload}"
+        for key, payload in batch.items()
+    )
+    try:
+        response = await llm.complete(
+            messages=[{"role": "user", "content": message}],
+            model=llm.default_model,
+            temperature=temperature,
+            max_tokens=tokens_per_item * len(batch),
+            json_mode=True,
+            system_prompt=system_prompt,
+        )
+        raw = response["content"]
+        data = extract_json(raw) if isinstance(raw, str) else raw
+    except Exception as exc:
+        logger.warning("Batched request of %d items failed: %s",
+                       len(batch), exc)
+        return {}
+    entries = data.get("results", []) if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        return {}
+    return {
+        str(entry["id"]): entry
+        for entry in entries
+        if isinstance(entry, dict) and str(entry.get("id")) in batch
+    }
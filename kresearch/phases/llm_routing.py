@@ -0,0 +1,62 @@
+"""LLM routing for phases: per-site routes and hedged failover."""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from kresearch.llm.base import LLMProvider
+from kresearch.llm.latency_tracker import LatencyTracker
+
+
+def routed_llm(
+    ctx: dict[str, Any],
+    name: str,
+    route: Callable[[str], LLMProvider],
+) -> LLMProvider:
+    """Return ``route(name)``, behind the registered ``"router"`` provider
+    when ``router.enabled``.
+
+    Fallback routes come from ``router.fallbacks``; each entry is a
+    provider name, optionally with a model (``"anthropic"`` or
+    ``"openai:gpt-4o-mini"``), resolved through *route* like the primary.
+    """
+    from kresearch.llm.factory import create_provider
+
+    primary = route(name)
+    settings = getattr(ctx["config"], "router", None)
+    if settings is None or not settings.enabled:
+        return primary
+    routes = [(primary, None)]
+    for spec in settings.fallbacks:
+        fallback, _, model = spec.partition(":")
+        routes.append((route(fallback.strip()), model.strip() or None))
+    return create_provider(
+        "router", routes=routes, tracker=latency_tracker(ctx),
+        **settings.model_dump(exclude={"enabled", "fallbacks"}),
+    )
+
+
+def site_routed_llm(
+    ctx: dict[str, Any],
+    stack: Callable[[str], LLMProvider],
+) -> LLMProvider:
+    """Return ``stack(llm.provider)`` behind the registered
+    ``"site_routed"`` provider, which applies the ``routing`` table and
+    makes ``llm.model`` the default model of every call site."""
+    from kresearch.llm.factory import create_provider
+
+    config = ctx["config"]
+    routes = {site: (route.provider, route.model)
+              for site, route in getattr(config, "routing", {}).items()}
+    return create_provider(
+        "site_routed", inner=stack(config.llm.provider),
+        model=config.llm.model, routes=routes, resolve=stack,
+    )
+
+
+def latency_tracker(ctx: dict[str, Any]) -> LatencyTracker:
+    """Return the run's :class:`LatencyTracker`, creating it on first use."""
+    tracker = ctx.get("llm_latency")
+    if tracker is None:
+        tracker = ctx["llm_latency"] = LatencyTracker()
+    return tracker
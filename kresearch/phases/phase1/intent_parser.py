@@ -6,6 +6,7 @@ import json
 import logging
 from typing import Any
 
+from kresearch.core.usage import call_site
 from kresearch.phases.base import Phase
 from .perspective_discovery import discover_perspectives
 from .task_graph_builder import build_task_graph
@@ -65,10 +66,13 @@ class IntentParser(Phase):
         logger.info("Discovered %d perspectives", len(perspectives))
 
         # Step 3 -- task-graph construction
+        planning = getattr(self.config, "planning", None)
         task_graph = await build_task_graph(
             query=query,
             intent=intent,
             perspectives=perspectives,
+            stop_words=getattr(planning, "stop_words", False),
+            stem=getattr(planning, "stem", False),
         )
         self.session.task_graph = task_graph
 
@@ -84,6 +88,7 @@ class IntentParser(Phase):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @call_site("phase1.intent")
     async def _parse_intent(self, query: str) -> dict[str, Any]:
         """Send the query to the LLM and return structured intent JSON."""
         llm = await self._get_llm()
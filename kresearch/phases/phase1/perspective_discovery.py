@@ -6,6 +6,8 @@ import json
 import logging
 from typing import Any
 
+from kresearch.core.usage import call_site
+
 logger = logging.getLogger(__name__)
 
 _PERSPECTIVE_SYSTEM_PROMPT = """\
@@ -24,6 +26,7 @@ Ensure the perspectives span different viewpoints, methodologies, \
 and disciplines. Return ONLY valid JSON. No markdown, no commentary."""
 
 
+@call_site("phase1.perspectives")
 async def discover_perspectives(
     query: str,
     intent: dict[str, Any],
@@ -0,0 +1,101 @@
+"""QueryIndex: inverted word -> task index for matching search queries."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+# Common English function words ignored when ``stop_words`` is enabled.
+_STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "does",
+    "for", "from", "has", "have", "how", "in", "is", "it", "its", "of",
+    "on", "or", "that", "the", "their", "this", "to", "was", "what",
+    "when", "where", "which", "who", "why", "will", "with",
+})
+
+# (suffix, replacement) rules, longest first so "ations" wins over "s".
+# Replacements map an inflection onto the stem of its base form, e.g.
+# "studies" -> "study"; rules whose replacement equals the suffix keep
+# words like "speed" or "analysis" from losing a false suffix.
+_SUFFIXES = (
+    ("ational", "ate"), ("ations", "ate"), ("ation", "ate"),
+    ("nesses", ""), ("ments", ""), ("ness", ""), ("ment", ""),
+    ("sses", "ss"), ("shes", "sh"), ("ches", "ch"), ("ings", ""),
+    ("ies", "y"), ("ied", "y"), ("xes", "x"), ("eed", "eed"),
+    ("ing", ""), ("ed", ""), ("ss", "ss"), ("us", "us"), ("is", "is"),
+    ("s", ""),
+)
+
+_PUNCTUATION = "?!.,;:\"'()[]{}"
+
+
+def stem(word: str) -> str:
+    """Reduce *word* to a light stem shared with its common inflections.
+
+    "study", "studies" and "studied" all become "study"; "regulate",
+    "regulated", "regulation" and "regulations" all become "regulat".
+    """
+    for suffix, replacement in _SUFFIXES:
+        if word.endswith(suffix) and (
+                suffix == replacement or len(word) - len(suffix) >= 3):
+            word = word[: len(word) - len(suffix)] + replacement
+            break
+    # A final silent "e" is dropped so "regulate" meets "regulated".
+    if word.endswith("e") and len(word) > 4:
+        word = word[:-1]
+    return word
+
+
+class QueryIndex:
+    """Maps normalised words to the ids of the tasks whose query uses them.
+
+    Each query is tokenised once, when its task is added, so matching a
+    sub-question costs O(words in the sub-question + matching postings)
+    rather than a scan over every task.
+
+    Parameters
+    ----------
+    stop_words:
+        Drop common function words before indexing and matching.
+    stem:
+        Reduce words to a light stem so "regulations" matches "regulate".
+    """
+
+    def __init__(self, stop_words: bool = False, stem: bool = False) -> None:
+        self.stop_words = stop_words
+        self.stem = stem
+        self._postings: dict[str, list[str]] = {}
+        self._order: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def tokens(self, text: str) -> set[str]:
+        """Return the normalised word set for *text*."""
+        words = text.lower().split()
+        if self.stop_words or self.stem:
+            words = [w.strip(_PUNCTUATION) for w in words]
+        if self.stop_words:
+            words = [w for w in words if w and w not in _STOP_WORDS]
+        if self.stem:
+            words = [stem(w) for w in words]
+        return {w for w in words if w}
+
+    def add(self, task_id: str, query: str) -> None:
+        """Index *query* under *task_id*."""
+        if task_id in self._order:
+            return
+        self._order[task_id] = len(self._order)
+        for word in self.tokens(query):
+            self._postings.setdefault(word, []).append(task_id)
+
+    def match(self, text: str, min_overlap: int = 2) -> list[str]:
+        """Return task ids sharing at least *min_overlap* words with *text*.
+
+        Results are in the order the tasks were added.
+        """
+        hits: Counter[str] = Counter()
+        for word in self.tokens(text):
+            hits.update(self._postings.get(word, ()))
+        matched = [tid for tid, n in hits.items() if n >= min_overlap]
+        matched.sort(key=self._order.__getitem__)
+        return matched
@@ -7,6 +7,7 @@ from typing import Any
 
 from kresearch.core.task_node import TaskNode, TaskType
 from kresearch.core.task_graph import TaskGraph
+from .query_index import QueryIndex
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +22,8 @@ async def build_task_graph(
     query: str,
     intent: dict[str, Any],
     perspectives: list[dict[str, Any]],
+    stop_words: bool = False,
+    stem: bool = False,
 ) -> TaskGraph:
     """Create a :class:`TaskGraph` with SEARCH, DISCOURSE, and VERIFY tasks.
 
@@ -38,6 +41,9 @@ async def build_task_graph(
         Parsed intent containing *sub_questions* and *complexity*.
     perspectives:
         List of perspective dicts, each with a *questions* list.
+    stop_words, stem:
+        Normalisation applied when matching sub-questions to SEARCH
+        tasks (see :class:`QueryIndex`); set from ``config.planning``.
 
     Returns
     -------
@@ -45,6 +51,7 @@ async def build_task_graph(
         A fully wired task graph ready for execution.
     """
     graph = TaskGraph()
+    search_index = QueryIndex(stop_words=stop_words, stem=stem)
 
     complexity = intent.get("complexity", "moderate")
     is_complex = complexity in ("complex", "expert")
@@ -68,6 +75,7 @@ async def build_task_graph(
                 metadata={"source_perspective": p_name},
             )
             graph.add_task(task)
+            search_index.add(task.id, question)
             p_search_ids.append(task.id)
 
         search_ids_by_perspective[p_name] = p_search_ids
@@ -78,7 +86,7 @@ async def build_task_graph(
             continue
 
         # Depend on all SEARCH tasks whose query overlaps this sub-question
-        deps = _find_related_searches(sq, graph)
+        deps = search_index.match(sq)
 
         task = TaskNode(
             task_type=TaskType.DISCOURSE,
@@ -123,25 +131,3 @@ def _needs_discourse(sub_question: str, is_complex: bool) -> bool:
     lower = sub_question.lower()
     return any(kw in lower for kw in _CONTESTED_KEYWORDS)
 
-
-def _find_related_searches(
-    sub_question: str, graph: TaskGraph
-) -> list[str]:
-    """Return IDs of SEARCH tasks whose query overlaps *sub_question*."""
-    sq_words = set(sub_question.lower().split())
-    related: list[str] = []
-
-    progress = graph.get_progress()  # ensures graph has nodes
-    if progress["total"] == 0:
-        return related
-
-    for layer in graph.get_topological_layers():
-        for task in layer:
-            if task.task_type != TaskType.SEARCH:
-                continue
-            task_words = set(task.query.lower().split())
-            overlap = sq_words & task_words
-            if len(overlap) >= 2:
-                related.append(task.id)
-
-    return related
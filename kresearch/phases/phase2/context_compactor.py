@@ -5,10 +5,9 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-logger = logging.getLogger(__name__)
+from kresearch.utils.tokenizer import pack_within_budget, truncate_to_tokens
 
-# Rough estimate: 1 token ~ 4 characters.
-_CHARS_PER_TOKEN = 4
+logger = logging.getLogger(__name__)
 
 
 async def compact_context(
@@ -36,9 +35,8 @@ async def compact_context(
     if not snippets:
         return ""
 
-    # Reserve roughly half the budget for the LLM's output.
-    input_budget = (max_tokens // 2) * _CHARS_PER_TOKEN
-    combined = _join_within_budget(snippets, input_budget)
+    # Reserve half the budget for the LLM's output.
+    combined = _join_within_budget(snippets, max_tokens // 2, model or "")
 
     summary = await _llm_summarise(llm_provider, combined, max_tokens, model)
     return summary
@@ -97,19 +95,9 @@ def _is_near_duplicate(
 # Budget-aware joining
 # ------------------------------------------------------------------
 
-def _join_within_budget(snippets: list[str], max_chars: int) -> str:
-    """Concatenate snippets until *max_chars* is reached."""
-    parts: list[str] = []
-    total = 0
-    for snippet in snippets:
-        if total + len(snippet) > max_chars:
-            remaining = max_chars - total
-            if remaining > 50:
-                parts.append(snippet[:remaining])
-            break
-        parts.append(snippet)
-        total += len(snippet)
-    return "\n---\n".join(parts)
+def _join_within_budget(snippets: list[str], max_tokens: int, model: str = "") -> str:
+    """Concatenate snippets, in order, within *max_tokens* tokens."""
+    return "\n---\n".join(pack_within_budget(snippets, max_tokens, model))
 
 
 # ------------------------------------------------------------------
@@ -138,7 +126,7 @@ async def _llm_summarise(
     try:
         resp = await llm_provider.complete(
             messages=messages,
-            model=model or llm_provider.available_models[0],
+            model=model or llm_provider.default_model,
             temperature=0.2,
             max_tokens=max_tokens // 2,
         )
@@ -146,5 +134,4 @@ async def _llm_summarise(
     except Exception as exc:
         logger.warning("LLM summarisation failed: %s -- returning raw text", exc)
         # Graceful fallback: return truncated raw text.
-        budget = max_tokens * _CHARS_PER_TOKEN
-        return combined_text[:budget]
+        return truncate_to_tokens(combined_text, max_tokens, model or "")
@@ -7,6 +7,9 @@ import logging
 from typing import Any
 
 from kresearch.core.task_node import TaskNode
+from kresearch.core.usage import call_site
+from kresearch.llm.prompt_cache import mark_last
+from kresearch.utils.tokenizer import pack_within_budget
 
 logger = logging.getLogger(__name__)
 _MIN_TURNS = 3
@@ -24,32 +27,40 @@ _INTERROGATOR_SYSTEM = (
 )
 
 
+@call_site("phase2.discourse")
 async def run_discourse(
     task: TaskNode, perspectives: list[dict], llm_provider: Any,
     context_docs: list[Any], event_bus: Any, num_turns: int = _MAX_TURNS,
-    model: str | None = None,
+    model: str | None = None, budget: Any = None,
 ) -> dict:
     """Simulate a multi-turn debate between an expert and interrogator.
 
+    A tight *budget* holds the debate to ``_MIN_TURNS``; an exhausted
+    one ends it early.
+
     Returns dict with ``findings`` (list of claims) and ``transcript``.
     """
     num_turns = max(_MIN_TURNS, min(num_turns, _MAX_TURNS))
-    _model = model or llm_provider.available_models[0]
+    if budget is not None and budget.tight("phase2"):
+        num_turns = _MIN_TURNS
+    _model = model or llm_provider.default_model
     task.mark_running()
     await event_bus.publish("discourse.start",
                             {"task_id": task.id, "query": task.query})
 
     perspective_label = _pick_perspective(task, perspectives)
-    context_text = _build_context_snippet(context_docs)
+    context_text = _build_context_snippet(context_docs, model=_model)
     transcript: list[dict] = []
     expert_msgs = _seed_expert(task.query, context_text)
     interr_msgs = _seed_interrogator(task.query)
 
     try:
         for turn in range(num_turns):
-            # Expert turn
+            if turn and budget is not None and budget.exhausted("phase2"):
+                break  # out of budget: synthesise what we have
+            # Expert turn (the transcript so far is the next turn's prefix)
             expert_reply = await llm_provider.complete(
-                messages=expert_msgs, model=_model,
+                messages=mark_last(expert_msgs), model=_model,
                 system_prompt=_EXPERT_SYSTEM.format(perspective=perspective_label),
                 temperature=0.7, max_tokens=600,
             )
@@ -60,7 +71,7 @@ async def run_discourse(
             interr_msgs.append({"role": "user", "content": expert_text})
             # Interrogator turn
             interr_reply = await llm_provider.complete(
-                messages=interr_msgs, model=_model,
+                messages=mark_last(interr_msgs), model=_model,
                 system_prompt=_INTERROGATOR_SYSTEM,
                 temperature=0.6, max_tokens=400,
             )
@@ -91,22 +102,19 @@ def _pick_perspective(task: TaskNode, perspectives: list[dict]) -> str:
     return "general analyst"
 
 
-def _build_context_snippet(docs: list[Any], max_chars: int = 3000) -> str:
-    parts: list[str] = []
-    total = 0
-    for doc in docs:
-        snippet = doc.get("snippet", "") if isinstance(doc, dict) else str(doc)
-        if total + len(snippet) > max_chars:
-            break
-        parts.append(snippet)
-        total += len(snippet)
+def _build_context_snippet(
+    docs: list[Any], max_tokens: int = 750, model: str = "",
+) -> str:
+    snippets = [doc.get("snippet", "") if isinstance(doc, dict) else str(doc)
+                for doc in docs]
+    parts = pack_within_budget(snippets, max_tokens, model, truncate=False)
     return "\n---\n".join(parts) if parts else "(no prior context)"
 
 
 def _seed_expert(query: str, context: str) -> list[dict]:
     return [{"role": "user", "content": (
-        f"Research question: {query}\n\nContext from prior retrieval:\n"
-        f"{context}\n\nPresent your initial argument."
+        f"Context from prior retrieval:\n{context}\n\n"
+        f"Research question: {query}\n\nPresent your initial argument."
     )}]
 
 
@@ -117,6 +125,7 @@ def _seed_interrogator(query: str) -> list[dict]:
     )}]
 
 
+@call_site("phase2.synthesise")
 async def _synthesise(llm_provider: Any, transcript: list[dict], query: str, model: str) -> list[dict]:
     condensed = "\n".join(
         f"[{t['role']} turn {t['turn']}]: {t['text'][:300]}" for t in transcript
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
 from kresearch.core.mind_map_node import ConfidenceLevel, MindMapNode, NodeType
 from kresearch.core.task_node import TaskNode, TaskType
+from kresearch.core.usage import usage_scope
 from kresearch.phases.base import Phase
 from .discourse_engine import run_discourse
 from .retrieval_agent import execute_search_task
+from .task_scheduler import ReadyQueueScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -30,65 +31,63 @@ class SwarmCoordinator(Phase):
         return "Decentralized Swarm Retrieval"
 
     async def execute(self) -> None:
-        """Walk the task graph layer-by-layer, executing tasks concurrently."""
+        """Stream the task graph through a dependency-driven ready queue."""
+        scheduler = ReadyQueueScheduler(
+            self.session.task_graph,
+            self._dispatch_task,
+            limits=self._task_limits(),
+            on_settled=self._report_progress,
+        )
+        await scheduler.run()
+
+    def _task_limits(self) -> dict[TaskType, int]:
+        """Per-type caps; with adaptive concurrency the provider limiters
+        set the real pace, so the scheduler only bounds at their maximum."""
+        adaptive = getattr(self.config, "adaptive", None)
+        if adaptive is not None and adaptive.enabled:
+            return {TaskType.SEARCH: adaptive.max_limit,
+                    TaskType.DISCOURSE: adaptive.max_limit}
         concurrency = getattr(self.config, "concurrency", None)
         per_limits = getattr(concurrency, "per_provider_limits", {}) if concurrency else {}
-        self._search_sem = asyncio.Semaphore(
-            per_limits.get("search", _DEFAULT_SEARCH_CONCURRENCY),
-        )
-        self._llm_sem = asyncio.Semaphore(
-            per_limits.get("llm", _DEFAULT_LLM_CONCURRENCY),
+        return {
+            TaskType.SEARCH: per_limits.get("search", _DEFAULT_SEARCH_CONCURRENCY),
+            TaskType.DISCOURSE: per_limits.get("llm", _DEFAULT_LLM_CONCURRENCY),
+        }
+
+    async def _report_progress(self, task: TaskNode) -> None:
+        """Publish progress each time a task settles."""
+        await self.event_bus.publish(
+            "phase.progress",
+            {"task": task.id,
+             "progress": self.session.task_graph.get_progress()},
         )
-        layers = self.session.task_graph.get_topological_layers()
-        for layer_idx, layer in enumerate(layers):
-            logger.info(
-                "Processing layer %d/%d (%d tasks)",
-                layer_idx + 1, len(layers), len(layer),
-            )
-            await self._process_layer(layer)
-            await self.event_bus.publish(
-                "phase.progress",
-                {"layer": layer_idx + 1,
-                 "progress": self.session.task_graph.get_progress()},
-            )
-
-    async def _process_layer(self, tasks: list[TaskNode]) -> None:
-        """Execute all tasks in a single dependency layer concurrently."""
-        coros = [self._dispatch_task(t) for t in tasks]
-        results = await asyncio.gather(*coros, return_exceptions=True)
-        for task, result in zip(tasks, results):
-            if isinstance(result, BaseException):
-                logger.error("Task %s raised: %s", task.id, result)
-                if task.status.value not in ("COMPLETED", "FAILED"):
-                    task.mark_failed(str(result))
 
     async def _dispatch_task(self, task: TaskNode) -> Any:
         """Route a single task to the appropriate agent."""
-        if task.task_type == TaskType.SEARCH:
-            return await self._run_search(task)
-        if task.task_type == TaskType.DISCOURSE:
-            return await self._run_discourse(task)
+        with usage_scope(task=task.id):
+            if task.task_type == TaskType.SEARCH:
+                return await self._run_search(task)
+            if task.task_type == TaskType.DISCOURSE:
+                return await self._run_discourse(task)
         task.mark_completed([])
         return []
 
     async def _run_search(self, task: TaskNode) -> list[dict]:
         search_provider = await self._get_search()
-        async with self._search_sem:
-            results = await execute_search_task(
-                task, search_provider, self.event_bus,
-            )
+        results = await execute_search_task(
+            task, search_provider, self.event_bus,
+        )
         self.session.retrieved_documents.extend(results)
         self._update_mind_map_from_search(task, results)
         return results
 
     async def _run_discourse(self, task: TaskNode) -> dict:
         llm_provider = await self._get_llm()
-        async with self._llm_sem:
-            insights = await run_discourse(
-                task, self.session.perspectives, llm_provider,
-                self.session.retrieved_documents, self.event_bus,
-                model=self.config.llm.model,
-            )
+        insights = await run_discourse(
+            task, self.session.perspectives, llm_provider,
+            self.session.retrieved_documents, self.event_bus,
+            model=self.config.llm.model, budget=self.budget,
+        )
         self._update_mind_map_from_discourse(task, insights)
         return insights
 
@@ -101,9 +100,11 @@ class SwarmCoordinator(Phase):
                 content=doc.get("snippet", ""),
                 confidence=ConfidenceLevel.UNVERIFIED,
                 sources=[doc.get("url", "")],
+                perspectives=[task.perspective] if task.perspective else [],
                 metadata={"title": doc.get("title", ""), "task": task.id},
             )
-            self.session.mind_map.add_node(node)
+            # Hits already found by another task fold into that node.
+            self.session.mind_map.add_or_merge(node)
 
     def _update_mind_map_from_discourse(
         self, task: TaskNode, insights: dict,
@@ -0,0 +1,129 @@
+"""ReadyQueueScheduler: dependency-driven streaming execution of a TaskGraph."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+from kresearch.core.task_graph import TaskGraph
+from kresearch.core.task_node import TaskNode, TaskStatus, TaskType
+
+logger = logging.getLogger(__name__)
+
+_TERMINAL = (TaskStatus.COMPLETED, TaskStatus.FAILED)
+
+Dispatch = Callable[[TaskNode], Awaitable[Any]]
+Settled = Callable[[TaskNode], Awaitable[None]]
+
+
+class ReadyQueueScheduler:
+    """Start each task as soon as its own dependencies have settled.
+
+    Ready tasks wait in a per-type heap ordered by ``priority`` (lower
+    is more urgent), then by critical-path length (longer chains first),
+    then by insertion order.  ``limits`` caps how many tasks of a given
+    :class:`TaskType` run at once; types without a limit are unbounded.
+
+    A dependency counts as settled once it is COMPLETED *or* FAILED, so
+    one failed search never strands the discourse tasks built on it.
+    """
+
+    def __init__(
+        self,
+        graph: TaskGraph,
+        dispatch: Dispatch,
+        limits: Optional[dict[TaskType, int]] = None,
+        on_settled: Optional[Settled] = None,
+    ) -> None:
+        self.graph = graph
+        self._dispatch = dispatch
+        self._limits = dict(limits or {})
+        self._on_settled = on_settled
+        self._ready: dict[TaskType, list[tuple]] = {}
+        self._active: dict[TaskType, int] = {}
+        self._waiting: dict[str, int] = {}
+        self._seq = itertools.count()
+        self._critical: dict[str, int] = {}
+
+    async def run(self) -> None:
+        """Execute every non-terminal task in the graph."""
+        self._critical = _critical_path_lengths(self.graph)
+        for task in self.graph.get_tasks():
+            if task.status in _TERMINAL:
+                continue
+            blockers = sum(
+                1 for dep_id in set(task.dependencies)
+                if (dep := self.graph.get_task(dep_id)) is not None
+                and dep.status not in _TERMINAL
+            )
+            self._waiting[task.id] = blockers
+            if blockers == 0:
+                self._push(task)
+
+        running: dict[asyncio.Task, TaskNode] = {}
+        try:
+            self._start_ready(running)
+            while running:
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED,
+                )
+                for fut in done:
+                    await self._settle(running.pop(fut), fut)
+                self._start_ready(running)
+        finally:
+            for fut in running:
+                fut.cancel()
+            # Let cancelled tasks unwind (mark_failed, observers) before
+            # run() returns or re-raises.
+            await asyncio.gather(*running, return_exceptions=True)
+
+        if self._waiting:
+            logger.warning("%d task(s) never became ready (cycle?)",
+                           len(self._waiting))
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _push(self, task: TaskNode) -> None:
+        key = (task.priority, -self._critical.get(task.id, 1), next(self._seq))
+        heapq.heappush(self._ready.setdefault(task.task_type, []), (*key, task))
+
+    def _start_ready(self, running: dict[asyncio.Task, TaskNode]) -> None:
+        for task_type, heap in self._ready.items():
+            limit = self._limits.get(task_type)
+            while heap and (limit is None
+                            or self._active.get(task_type, 0) < limit):
+                task = heapq.heappop(heap)[-1]
+                self._waiting.pop(task.id, None)
+                self._active[task_type] = self._active.get(task_type, 0) + 1
+                running[asyncio.create_task(self._dispatch(task))] = task
+
+    async def _settle(self, task: TaskNode, fut: asyncio.Task) -> None:
+        self._active[task.task_type] -= 1
+        exc = None if fut.cancelled() else fut.exception()
+        if fut.cancelled() or exc is not None:
+            logger.error("Task %s raised: %s", task.id, exc or "cancelled")
+            if task.status not in _TERMINAL:
+                task.mark_failed(str(exc or "cancelled"))
+        for dependent in self.graph.get_dependents(task.id):
+            if dependent.id not in self._waiting:
+                continue
+            self._waiting[dependent.id] -= 1
+            if self._waiting[dependent.id] == 0:
+                self._push(dependent)
+        if self._on_settled is not None:
+            await self._on_settled(task)
+
+
+def _critical_path_lengths(graph: TaskGraph) -> dict[str, int]:
+    """Return, per task, the number of tasks on its longest downstream chain."""
+    lengths: dict[str, int] = {}
+    for layer in reversed(graph.get_topological_layers()):
+        for task in layer:
+            below = [lengths.get(d.id, 0) for d in graph.get_dependents(task.id)]
+            lengths[task.id] = 1 + max(below, default=0)
+    return lengths
@@ -8,6 +8,7 @@ from typing import Any
 
 from kresearch.core.mind_map import EpistemicMindMap
 from kresearch.core.mind_map_node import ConfidenceLevel
+from kresearch.core.usage import call_site
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,7 @@ Classify as:
 Return ONLY a valid JSON array. No markdown fences."""
 
 
+@call_site("phase3.extract")
 async def extract_claims(
     mind_map: EpistemicMindMap,
     llm_provider: Any,
@@ -63,7 +65,7 @@ async def extract_claims(
 
     response = await llm_provider.complete(
         messages=[{"role": "user", "content": claims_text}],
-        model=llm_provider.available_models[0],
+        model=llm_provider.default_model,
         temperature=0.1,
         max_tokens=2048,
         json_mode=True,
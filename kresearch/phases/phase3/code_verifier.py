@@ -6,6 +6,8 @@ import json
 import logging
 from typing import Any
 
+from kresearch.core.usage import call_site
+
 logger = logging.getLogger(__name__)
 
 _CODE_GEN_PROMPT = """\
@@ -43,6 +45,7 @@ Return ONLY corrected Python code. No markdown fences, no commentary."""
 MAX_RETRIES = 3
 
 
+@call_site("phase3.code")
 async def verify_with_code(
     claim: dict,
     llm_provider: Any,
@@ -63,7 +66,7 @@ async def verify_with_code(
     prompt = _CODE_GEN_PROMPT.format(claim=claim_text, approach=approach)
     response = await llm_provider.complete(
         messages=[{"role": "user", "content": prompt}],
-        model=llm_provider.available_models[0],
+        model=llm_provider.default_model,
         temperature=0.1,
         max_tokens=2048,
     )
@@ -100,7 +103,7 @@ async def verify_with_code(
             )
             fix_response = await llm_provider.complete(
                 messages=[{"role": "user", "content": fix_prompt}],
-                model=llm_provider.available_models[0],
+                model=llm_provider.default_model,
                 temperature=0.2,
                 max_tokens=2048,
             )
@@ -2,29 +2,33 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 from typing import Any
 
+from kresearch.core.usage import call_site
+from kresearch.phases.json_batch import complete_json_batch
+
 logger = logging.getLogger(__name__)
 
+_BATCH_SIZE = 6
+
 _ASSESS_PROMPT = """\
 You are a fact-verification analyst. Given a claim and a set of search \
 results, determine whether the evidence supports or refutes the claim.
 
-Claim: {claim}
-
-Search results:
-{results}
-
-Return a JSON object with EXACTLY these keys:
+For each claim, return a JSON object with EXACTLY these keys:
 - "verdict": one of "supported", "refuted", "inconclusive"
 - "confidence": float between 0.0 and 1.0
 - "supporting": list of brief descriptions of supporting evidence
 - "contradicting": list of brief descriptions of contradicting evidence
-- "reasoning": brief explanation of your assessment
+- "reasoning": brief explanation of your assessment"""
+
+_CLAIM_ITEM = """\
+Claim: {claim}
 
-Return ONLY valid JSON. No markdown fences."""
+Search results:
+{results}"""
 
 
 async def verify_with_data(
@@ -32,70 +36,79 @@ async def verify_with_data(
     search_provider: Any,
     llm_provider: Any,
 ) -> dict:
-    """Verify a factual claim via web search and LLM assessment.
+    """Verify one factual claim; see :func:`verify_claims_with_data`."""
+    results = await verify_claims_with_data([claim], search_provider, llm_provider)
+    return results[0]
 
-    Searches for corroborating and contradicting evidence, then uses
-    the LLM to assess the overall verdict.
 
-    Returns a dict with keys:
+@call_site("phase3.data")
+async def verify_claims_with_data(
+    claims: list[dict],
+    search_provider: Any,
+    llm_provider: Any,
+) -> list[dict]:
+    """Verify factual claims via web search and LLM assessment.
+
+    Searches for corroborating and contradicting evidence for every
+    claim, then has the LLM assess the verdicts, several claims per
+    JSON-mode request.  A claim whose search fails gets a failed result
+    without affecting the others.
+
+    Returns one dict per claim with keys:
         verified, confidence, supporting, contradicting
     """
-    claim_text = claim.get("claim", "")
-
-    # Step 1: Search for supporting evidence
-    support_query = f"evidence for: {claim_text}"
-    support_results = await search_provider.search(
-        support_query, max_results=5,
+    evidence = await asyncio.gather(*(
+        _search_evidence(claim.get("claim", ""), search_provider)
+        for claim in claims
+    ), return_exceptions=True)
+    items = {
+        str(i): _CLAIM_ITEM.format(claim=claim.get("claim", ""),
+                                   results=_format_results(found))
+        for i, (claim, found) in enumerate(zip(claims, evidence))
+        if found and not isinstance(found, BaseException)
+    }
+    assessments = await complete_json_batch(
+        llm_provider, items, _ASSESS_PROMPT, batch_size=_BATCH_SIZE,
+        validate=lambda item: "verdict" in item, tokens_per_item=1024,
     )
 
-    # Step 2: Search for contradicting evidence
-    contra_query = f"evidence against: {claim_text}"
-    contra_results = await search_provider.search(
-        contra_query, max_results=5,
+    results: list[dict] = []
+    for i, claim in enumerate(claims):
+        assessment = assessments.get(str(i))
+        if isinstance(evidence[i], BaseException):
+            logger.error("Error searching evidence for claim %s: %s",
+                         claim.get("node_id"), evidence[i])
+            results.append(_failed(0.1, "Verification error"))
+        elif not evidence[i]:
+            logger.warning("No search results found for claim: %s",
+                           claim.get("claim", ""))
+            results.append(_failed(0.2, "No search results found"))
+        elif assessment is None:
+            logger.error("LLM returned invalid JSON for data verification.")
+            results.append(_failed(0.1, "Failed to parse LLM assessment"))
+        else:
+            verdict = assessment.get("verdict", "inconclusive")
+            results.append({
+                "verified": verdict == "supported",
+                "confidence": float(assessment.get("confidence", 0.3)),
+                "supporting": assessment.get("supporting", []),
+                "contradicting": assessment.get("contradicting", []),
+            })
+    return results
+
+
+async def _search_evidence(claim_text: str, search_provider: Any) -> list[dict]:
+    """Search for supporting, then contradicting, evidence."""
+    support_results, contra_results = await asyncio.gather(
+        search_provider.search(f"evidence for: {claim_text}", max_results=5),
+        search_provider.search(f"evidence against: {claim_text}", max_results=5),
     )
+    return support_results + contra_results
 
-    all_results = support_results + contra_results
-    if not all_results:
-        logger.warning("No search results found for claim: %s", claim_text)
-        return {
-            "verified": False,
-            "confidence": 0.2,
-            "supporting": [],
-            "contradicting": ["No search results found"],
-        }
-
-    # Step 3: Format results for LLM assessment
-    results_text = _format_results(all_results)
-
-    # Step 4: LLM assessment
-    prompt = _ASSESS_PROMPT.format(claim=claim_text, results=results_text)
-    response = await llm_provider.complete(
-        messages=[{"role": "user", "content": prompt}],
-        model=llm_provider.available_models[0],
-        temperature=0.1,
-        max_tokens=1024,
-        json_mode=True,
-    )
 
-    raw = response["content"]
-    try:
-        assessment = json.loads(raw) if isinstance(raw, str) else raw
-    except json.JSONDecodeError:
-        logger.error("LLM returned invalid JSON for data verification.")
-        return {
-            "verified": False,
-            "confidence": 0.1,
-            "supporting": [],
-            "contradicting": ["Failed to parse LLM assessment"],
-        }
-
-    verdict = assessment.get("verdict", "inconclusive")
-    return {
-        "verified": verdict == "supported",
-        "confidence": float(assessment.get("confidence", 0.3)),
-        "supporting": assessment.get("supporting", []),
-        "contradicting": assessment.get("contradicting", []),
-    }
+def _failed(confidence: float, reason: str) -> dict:
+    return {"verified": False, "confidence": confidence,
+            "supporting": [], "contradicting": [reason]}
 
 
 def _format_results(results: list[dict], max_items: int = 8) -> str:
@@ -6,6 +6,8 @@ import json
 import logging
 from typing import Any
 
+from kresearch.core.usage import call_site
+
 logger = logging.getLogger(__name__)
 
 _STATS_CODE_PROMPT = """\
@@ -45,6 +47,7 @@ Return ONLY corrected Python code. No markdown fences."""
 MAX_RETRIES = 3
 
 
+@call_site("phase3.stats")
 async def verify_statistical(
     claim: dict,
     llm_provider: Any,
@@ -65,7 +68,7 @@ async def verify_statistical(
     prompt = _STATS_CODE_PROMPT.format(claim=claim_text, approach=approach)
     response = await llm_provider.complete(
         messages=[{"role": "user", "content": prompt}],
-        model=llm_provider.available_models[0],
+        model=llm_provider.default_model,
         temperature=0.1,
         max_tokens=2048,
     )
@@ -100,7 +103,7 @@ async def verify_statistical(
             )
             fix_resp = await llm_provider.complete(
                 messages=[{"role": "user", "content": fix_prompt}],
-                model=llm_provider.available_models[0],
+                model=llm_provider.default_model,
                 temperature=0.2,
                 max_tokens=2048,
             )
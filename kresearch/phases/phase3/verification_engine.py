@@ -9,12 +9,13 @@ from kresearch.core.mind_map_node import ConfidenceLevel
 from kresearch.phases.base import Phase
 from .claim_extractor import extract_claims
 from .code_verifier import verify_with_code
-from .data_verifier import verify_with_data
+from .data_verifier import verify_claims_with_data
 from .statistical_analyzer import verify_statistical
 
 logger = logging.getLogger(__name__)
 
 _CODE_TYPES = {"numerical", "computational"}
+_SANDBOX_TYPES = _CODE_TYPES | {"statistical"}
 
 
 class VerificationEngine(Phase):
@@ -47,14 +48,15 @@ class VerificationEngine(Phase):
             await self._finish(verified=0, failed=0)
             return
 
-        # Step 2: Route and verify each claim
+        # Step 2: Route and verify each claim; data claims share requests
+        data_results = await self._verify_data_claims(claims, search, llm)
         verified_count = 0
         failed_count = 0
-        for claim in claims:
+        for index, claim in enumerate(claims):
             claim_type = claim.get("claim_type", "")
             try:
-                result = await self._route_claim(
-                    claim, claim_type, llm, search, sandbox,
+                result = data_results.get(index) or await self._route_claim(
+                    claim, claim_type, llm, sandbox,
                 )
             except Exception:
                 logger.exception(
@@ -83,18 +85,36 @@ class VerificationEngine(Phase):
         await self._finish(verified=verified_count, failed=failed_count)
 
     async def _route_claim(
-        self, claim: dict, claim_type: str,
-        llm: Any, search: Any, sandbox: Any,
+        self, claim: dict, claim_type: str, llm: Any, sandbox: Any,
     ) -> dict:
-        """Route a claim to the appropriate verifier by type."""
+        """Route a code or statistical claim to its verifier."""
         if claim_type in _CODE_TYPES:
             return await verify_with_code(claim, llm, sandbox)
-        if claim_type == "statistical":
-            return await verify_statistical(claim, llm, sandbox)
-        if claim_type == "factual":
-            return await verify_with_data(claim, search, llm)
-        logger.warning("Unknown claim type '%s', using data verifier.", claim_type)
-        return await verify_with_data(claim, search, llm)
+        return await verify_statistical(claim, llm, sandbox)
+
+    @staticmethod
+    async def _verify_data_claims(
+        claims: list[dict], search: Any, llm: Any,
+    ) -> dict[int, dict]:
+        """Verify every factual (or untyped) claim in one batch, by index."""
+        indices = []
+        for index, claim in enumerate(claims):
+            claim_type = claim.get("claim_type", "")
+            if claim_type in _SANDBOX_TYPES:
+                continue
+            if claim_type != "factual":
+                logger.warning("Unknown claim type '%s', using data verifier.",
+                               claim_type)
+            indices.append(index)
+        try:
+            results = await verify_claims_with_data(
+                [claims[i] for i in indices], search, llm,
+            )
+        except Exception:
+            logger.exception("Error verifying %d data claims", len(indices))
+            results = [{"verified": False, "confidence": 0.1,
+                        "evidence": "Verification error"} for _ in indices]
+        return dict(zip(indices, results))
 
     @staticmethod
     def _apply_result(mind_map: Any, claim: dict, result: dict) -> None:
@@ -113,9 +133,9 @@ class VerificationEngine(Phase):
             node.update_confidence(ConfidenceLevel.LOW)
 
     async def _get_sandbox(self) -> Any:
-        """Get the configured sandbox instance."""
-        from kresearch.sandbox.factory import create_sandbox
-        return await create_sandbox(self.config)
+        """Get the configured sandbox, throttled by the run's limiters."""
+        from kresearch.phases.providers import get_sandbox
+        return await get_sandbox(self.ctx)
 
     async def _finish(self, verified: int, failed: int) -> None:
         """Publish completion stats."""
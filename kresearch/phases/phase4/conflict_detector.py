@@ -7,6 +7,7 @@ import uuid
 from typing import Any
 
 from kresearch.core.mind_map_node import ConfidenceLevel
+from kresearch.core.usage import usage_scope
 from kresearch.phases.base import Phase
 from .consistency_checker import check_consistency
 from .source_hierarchy import rank_sources
@@ -53,7 +54,8 @@ class ConflictDetector(Phase):
             conflict["ranked_sources"] = rank_sources(sources)
 
         # Step 5 -- resolve conflicts using Markov resolver
-        resolutions = await resolve_conflicts(conflicts, mind_map, llm)
+        with usage_scope(site="phase4.resolve"):
+            resolutions = await resolve_conflicts(conflicts, mind_map, llm)
         logger.info("Resolved %d conflicts", len(resolutions))
 
         # Step 6 -- apply resolution outcomes to mind map
@@ -117,3 +119,4 @@ class ConflictDetector(Phase):
                 if node:
                     node.update_confidence(ConfidenceLevel.CONTESTED)
                     node.metadata["contest_reason"] = res.get("reason", "")
+        mind_map.touch()  # metadata edits bypass the map's versioning
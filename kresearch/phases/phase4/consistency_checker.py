@@ -6,6 +6,9 @@ import json
 import logging
 from typing import Any
 
+from kresearch.core.usage import call_site
+from kresearch.llm.prompt_cache import cache_breakpoint
+
 logger = logging.getLogger(__name__)
 
 # The seven consistency-check levels in order of evaluation.
@@ -21,7 +24,7 @@ CHECK_LEVELS = [
 
 _SYSTEM_PROMPT = """\
 You are an epistemic consistency auditor. Given a set of claims from a \
-research mind map, check for {level} inconsistencies.
+research mind map, check for the level of inconsistency named after them.
 
 Rules for each level:
 - logical: detect contradictions, fallacies, or mutually exclusive claims
@@ -65,24 +68,29 @@ async def check_consistency(
     return all_issues
 
 
+@call_site("phase4.consistency")
 async def _check_level(
     level: str, nodes_payload: str, llm_provider
 ) -> list[dict[str, Any]]:
-    """Run a single consistency-check level via the LLM."""
-    prompt = _SYSTEM_PROMPT.format(level=level)
-    user_msg = (
-        f"Check these mind-map nodes for {level} inconsistencies:\n\n"
-        f"{nodes_payload}"
-    )
+    """Run a single consistency-check level via the LLM.
+
+    The system prompt and node listing are identical for every level and
+    come first, as a cacheable prefix; only the final message differs.
+    """
+    messages = [
+        cache_breakpoint({"role": "user",
+                          "content": f"Mind-map nodes:\n\n{nodes_payload}"}),
+        {"role": "user", "content": f"Check these nodes for {level} inconsistencies."},
+    ]
 
     try:
         response = await llm_provider.complete(
-            messages=[{"role": "user", "content": user_msg}],
-            model=llm_provider.available_models[0],
+            messages=messages,
+            model=llm_provider.default_model,
             temperature=0.2,
             max_tokens=2048,
             json_mode=True,
-            system_prompt=prompt,
+            system_prompt=_SYSTEM_PROMPT,
         )
         raw = response["content"]
         parsed = json.loads(raw) if isinstance(raw, str) else raw
@@ -108,7 +116,14 @@ def _validate_issue(item: Any) -> dict[str, Any]:
 
 
 def _serialize_nodes(mind_map) -> str:
-    """Serialize mind-map nodes into a compact text representation."""
+    """Serialize mind-map nodes into a compact text representation.
+
+    Cached on the map, so all seven check levels share one rendering.
+    """
+    return mind_map.cached_view("consistency.nodes", _render_nodes)
+
+
+def _render_nodes(mind_map) -> str:
     data = mind_map.to_dict()
     nodes = data.get("nodes", {})
     if not nodes:
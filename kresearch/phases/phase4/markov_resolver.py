@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import uuid
 from datetime import datetime
 from typing import Any
 
+from kresearch.phases.json_batch import complete_json_batch
 from .source_hierarchy import rank_source
 
 logger = logging.getLogger(__name__)
@@ -17,26 +17,40 @@ You are a conflict-resolution specialist for a research system. Given a \
 conflict between claims and their transition-probability scores, decide \
 which claim is most likely correct.
 
-Return a JSON object with:
+For each conflict, return a JSON object with:
 - "winning_node_id": the ID of the most credible node
 - "rejected_node_ids": list of IDs for rejected nodes
 - "reason": a 1-2 sentence explanation
-- "confidence": float between 0.0 and 1.0
+- "confidence": float between 0.0 and 1.0"""
 
-Return ONLY valid JSON. No markdown fences."""
+_BATCH_SIZE = 8
 
 
 async def resolve_conflicts(
     conflicts: list[dict[str, Any]], mind_map, llm_provider,
 ) -> list[dict[str, Any]]:
-    """Resolve each conflict using Markov transition probabilities."""
+    """Resolve each conflict using Markov transition probabilities.
+
+    The LLM adjudicates several conflicts per JSON-mode request; a
+    conflict it fails to answer goes to the most probable node.
+    """
+    conflicts = [c for c in conflicts if c.get("node_ids")]
+    probs = [_calculate_probabilities(c["node_ids"], mind_map) for c in conflicts]
+    results = await complete_json_batch(
+        llm_provider,
+        {str(i): _describe(c, p, mind_map)
+         for i, (c, p) in enumerate(zip(conflicts, probs))},
+        _RESOLVE_PROMPT, batch_size=_BATCH_SIZE,
+    )
     resolutions: list[dict[str, Any]] = []
-    for conflict in conflicts:
-        node_ids = conflict.get("node_ids", [])
-        if not node_ids:
-            continue
-        probs = _calculate_probabilities(node_ids, mind_map)
-        resolution = await _resolve_single(conflict, probs, mind_map, llm_provider)
+    for i, conflict in enumerate(conflicts):
+        result = results.get(str(i))
+        if result is None:
+            logger.warning("LLM resolution failed for conflict %s",
+                           conflict.get("conflict_id"))
+            resolution = _fallback_resolution(conflict, probs[i])
+        else:
+            resolution = _normalize_resolution(result, conflict, probs[i])
         resolution["conflict_id"] = conflict.get("conflict_id", str(uuid.uuid4()))
         resolutions.append(resolution)
     return resolutions
@@ -91,33 +105,19 @@ def _recency_score(node) -> float:
         return 0.5
 
 
-async def _resolve_single(
-    conflict: dict, probabilities: dict[str, float], mind_map, llm_provider,
-) -> dict[str, Any]:
-    """Ask the LLM to adjudicate a single conflict."""
+def _describe(conflict: dict, probabilities: dict[str, float], mind_map) -> str:
+    """Render one conflict and its node probabilities for the LLM."""
     summaries = []
     for nid, prob in probabilities.items():
         node = mind_map.get_node(nid)
         summaries.append(
             f"Node {nid}: P={prob:.3f} | {node.content[:150] if node else 'Unknown'}"
         )
-    user_msg = (
+    return (
         f"Conflict: {conflict.get('description', 'No description')}\n"
         f"Severity: {conflict.get('severity', 'unknown')}\n\n"
         f"Nodes and transition probabilities:\n" + "\n".join(summaries)
     )
-    try:
-        response = await llm_provider.complete(
-            messages=[{"role": "user", "content": user_msg}],
-            model=llm_provider.available_models[0], temperature=0.1, max_tokens=512,
-            json_mode=True, system_prompt=_RESOLVE_PROMPT,
-        )
-        raw = response["content"]
-        result = json.loads(raw) if isinstance(raw, str) else raw
-        return _normalize_resolution(result, conflict, probabilities)
-    except (json.JSONDecodeError, KeyError, TypeError) as exc:
-        logger.warning("LLM resolution failed: %s", exc)
-        return _fallback_resolution(conflict, probabilities)
 
 
 def _normalize_resolution(result: dict, conflict: dict, probs: dict) -> dict[str, Any]:
@@ -6,7 +6,10 @@ import json
 import logging
 from typing import Any
 
+from kresearch.core.usage import call_site
 from kresearch.phases.base import Phase
+from .draft_stream import stream_draft
+from .evidence import evidence_text
 from .skeleton_builder import build_skeleton
 from .evaluation_loop import evaluate_draft
 from .finalizer import finalize_report
@@ -65,9 +68,12 @@ class DiffusionWriter(Phase):
 
         # Step 3 -- iterative denoising loop
         min_score = self.config.eval.min_score
-        max_iters = self.config.eval.max_iterations
+        # A tight budget buys a single refinement pass.
+        max_iters = 1 if self.budget.tight("phase5") else self.config.eval.max_iterations
 
         for i in range(1, max_iters + 1):
+            if i > 1 and self.budget.exhausted("phase5"):
+                break
             eval_result = await evaluate_draft(draft, query, llm)
             avg = eval_result["avg_score"]
             feedback = eval_result["feedback"]
@@ -97,45 +103,33 @@ class DiffusionWriter(Phase):
         """Check whether every dimension meets the minimum threshold."""
         return all(v >= threshold for v in scores.values())
 
+    @call_site("phase5.draft")
     async def _generate_rough_draft(self, skeleton: dict[str, Any], llm: Any) -> str:
         """Create the initial rough draft from the skeleton."""
         skeleton_text = json.dumps(skeleton, indent=2, default=str)
-        response = await llm.complete(
+        return await stream_draft(
+            llm, self.event_bus, "draft", len(self.session.draft_iterations),
             messages=[{"role": "user", "content": f"Report skeleton:\n{skeleton_text}"}],
             model=self.config.llm.model,
             temperature=0.5, max_tokens=4096,
             system_prompt=_ROUGH_DRAFT_PROMPT,
         )
-        return response["content"]
 
+    @call_site("phase5.denoise")
     async def _denoise_draft(
         self, draft: str, mind_map: Any, feedback: str, llm: Any,
     ) -> str:
         """Refine the draft using mind-map evidence and prior feedback."""
-        evidence = self._extract_evidence(mind_map)
+        evidence = evidence_text(mind_map, self.config.llm.model)
         user_msg = (
             f"Current draft:\n{draft}\n\n"
-            f"Evidence nodes:\n{json.dumps(evidence, indent=2, default=str)}\n\n"
+            f"Evidence nodes:\n{evidence}\n\n"
             f"Evaluator feedback:\n{feedback}"
         )
-        response = await llm.complete(
+        return await stream_draft(
+            llm, self.event_bus, "denoise", len(self.session.draft_iterations),
             messages=[{"role": "user", "content": user_msg}],
             model=self.config.llm.model,
             temperature=0.4, max_tokens=4096,
             system_prompt=_DENOISE_PROMPT,
         )
-        return response["content"]
-
-    @staticmethod
-    def _extract_evidence(mind_map: Any) -> list[dict]:
-        """Pull evidence-relevant data from mind-map nodes."""
-        data = mind_map.to_dict()
-        return [
-            {
-                "id": nid,
-                "content": nd.get("content", ""),
-                "confidence": nd.get("confidence", "UNVERIFIED"),
-                "sources": nd.get("sources", []),
-            }
-            for nid, nd in data.get("nodes", {}).items()
-        ]
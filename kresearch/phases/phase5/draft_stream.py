@@ -0,0 +1,71 @@
+"""Streaming draft generation with incremental ``draft.delta`` events."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from kresearch.core.event_bus import EventBus
+
+logger = logging.getLogger(__name__)
+
+# Minimum interval between draft.delta events while a stream is running.
+_FLUSH_SECONDS = 0.25
+
+
+async def stream_draft(
+    llm: Any,
+    event_bus: EventBus,
+    stage: str,
+    iteration: int,
+    **request: Any,
+) -> str:
+    """Generate text with ``llm.stream(**request)`` and return it.
+
+    Chunks are batched into ``draft.delta`` events at most every
+    ``_FLUSH_SECONDS``.  Each event carries the new text (``delta``),
+    the full text so far (``text``) and whether the stream has ended
+    (``done``), so a subscriber that only sees the latest event still
+    has the whole draft.  If the stream fails before its first chunk,
+    the draft is generated with ``complete`` instead; a failure after
+    that is raised, since subscribers have already seen part of the
+    draft and the partial call has been billed.
+    """
+    parts: list[str] = []
+    flushed = 0
+    last_flush = time.monotonic()
+    try:
+        async for chunk in llm.stream(**request):
+            parts.append(chunk)
+            if time.monotonic() - last_flush >= _FLUSH_SECONDS:
+                flushed = await _publish(event_bus, stage, iteration, parts,
+                                         flushed, done=False)
+                last_flush = time.monotonic()
+    except Exception as exc:
+        if parts:
+            raise
+        logger.warning("Streaming %s failed (%s); using complete()", stage, exc)
+        response = await llm.complete(**request)
+        parts = [response["content"]]
+    await _publish(event_bus, stage, iteration, parts, flushed, done=True)
+    return "".join(parts)
+
+
+async def _publish(
+    event_bus: EventBus,
+    stage: str,
+    iteration: int,
+    parts: list[str],
+    flushed: int,
+    done: bool,
+) -> int:
+    """Publish the chunks after index *flushed*; return the new index."""
+    await event_bus.publish("draft.delta", {
+        "stage": stage,
+        "iteration": iteration,
+        "delta": "".join(parts[flushed:]),
+        "text": "".join(parts),
+        "done": done,
+    })
+    return len(parts)
@@ -6,6 +6,8 @@ import json
 import logging
 from typing import Any
 
+from kresearch.core.usage import call_site
+
 logger = logging.getLogger(__name__)
 
 _EVALUATOR_SYSTEM_PROMPT = """\
@@ -27,6 +29,7 @@ Return a JSON object with EXACTLY these keys:
 Return ONLY valid JSON. No markdown fences."""
 
 
+@call_site("phase5.evaluate")
 async def evaluate_draft(
     draft: str,
     query: str,
@@ -44,7 +47,7 @@ async def evaluate_draft(
 
     response = await llm_provider.complete(
         messages=[{"role": "user", "content": user_msg}],
-        model=llm_provider.available_models[0],
+        model=llm_provider.default_model,
         temperature=0.2,
         max_tokens=1024,
         json_mode=True,
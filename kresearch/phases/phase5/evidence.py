@@ -0,0 +1,54 @@
+"""Evidence for Phase 5: mind-map nodes ranked and packed into a token budget."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from kresearch.utils.tokenizer import pack_within_budget
+
+# Tokens of evidence sent with each denoising pass.
+EVIDENCE_TOKENS = 6000
+
+# Better-supported nodes are packed first.
+_RANK = ["VERIFIED", "HIGH", "MEDIUM", "CONTESTED", "UNVERIFIED", "LOW"]
+
+
+def evidence_text(mind_map: Any, model: str = "",
+                  max_tokens: int = EVIDENCE_TOKENS) -> str:
+    """Return mind-map evidence as JSON lines within *max_tokens* tokens.
+
+    Nodes are ranked by confidence, then by number of sources; nodes
+    that do not fit are left out.  Cached on the map until it changes.
+    """
+    return mind_map.cached_view(
+        f"phase5.evidence_text:{model}:{max_tokens}",
+        lambda mm: _render(mm, model, max_tokens),
+    )
+
+
+def _render(mind_map: Any, model: str, max_tokens: int) -> str:
+    nodes = extract_evidence(mind_map)
+    nodes.sort(key=lambda n: (_rank(n["confidence"]), -len(n["sources"])))
+    items = [json.dumps(node, default=str) for node in nodes]
+    return "\n".join(pack_within_budget(
+        items, max_tokens, model, separator="\n", truncate=False,
+    ))
+
+
+def _rank(confidence: str) -> int:
+    return _RANK.index(confidence) if confidence in _RANK else len(_RANK)
+
+
+def extract_evidence(mind_map: Any) -> list[dict]:
+    """Pull evidence-relevant data from mind-map nodes."""
+    data = mind_map.to_dict()
+    return [
+        {
+            "id": nid,
+            "content": nd.get("content", ""),
+            "confidence": nd.get("confidence", "UNVERIFIED"),
+            "sources": nd.get("sources", []),
+        }
+        for nid, nd in data.get("nodes", {}).items()
+    ]
@@ -7,6 +7,7 @@ import logging
 from typing import Any
 
 from kresearch.core.mind_map import EpistemicMindMap
+from kresearch.core.usage import call_site
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,18 @@ Return ONLY valid JSON. No markdown fences, no commentary."""
 
 def _serialize_nodes(mind_map: EpistemicMindMap) -> list[dict]:
     """Convert mind-map nodes to a compact list for the LLM prompt."""
+    return mind_map.cached_view("skeleton.nodes", _build_nodes)
+
+
+def _nodes_text(mind_map: EpistemicMindMap) -> str:
+    """Prompt text form of :func:`_serialize_nodes` (cached on the map)."""
+    return mind_map.cached_view(
+        "skeleton.nodes_text",
+        lambda mm: json.dumps(_serialize_nodes(mm), indent=2, default=str),
+    )
+
+
+def _build_nodes(mind_map: EpistemicMindMap) -> list[dict]:
     data = mind_map.to_dict()
     nodes = []
     for nid, node_data in data.get("nodes", {}).items():
@@ -43,6 +56,7 @@ def _serialize_nodes(mind_map: EpistemicMindMap) -> list[dict]:
     return nodes
 
 
+@call_site("phase5.skeleton")
 async def build_skeleton(
     mind_map: EpistemicMindMap,
     query: str,
@@ -66,12 +80,12 @@ async def build_skeleton(
         f"Research query: {query}\n\n"
         f"Parsed intent: {intent_summary}\n\n"
         f"Mind-map nodes ({len(nodes)} total):\n"
-        f"{json.dumps(nodes, indent=2, default=str)}"
+        f"{_nodes_text(mind_map)}"
     )
 
     response = await llm_provider.complete(
         messages=[{"role": "user", "content": user_msg}],
-        model=llm_provider.available_models[0],
+        model=llm_provider.default_model,
         temperature=0.3,
         max_tokens=2048,
         json_mode=True,
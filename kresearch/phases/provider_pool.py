@@ -0,0 +1,55 @@
+"""ProviderPool: long-lived, connection-pooled provider instances per run context."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderPool:
+    """Hands out one shared instance per (kind, provider, kwargs).
+
+    Provider adapters keep their SDK or HTTP client on the instance, so
+    reusing instances keeps connection pools and TLS sessions warm
+    across tasks and phases.  :meth:`aclose` closes every instance and
+    is called when the application shuts down.
+    """
+
+    def __init__(self) -> None:
+        self._instances: dict[tuple, Any] = {}
+        self.stats = {"created": 0, "reused": 0}
+
+    def llm(self, name: str, **kwargs: Any):
+        """Return the pooled LLM provider *name*."""
+        from kresearch.llm.factory import create_provider
+        return self._get("llm", name, create_provider, kwargs)
+
+    def search(self, name: str, **kwargs: Any):
+        """Return the pooled search provider *name*."""
+        from kresearch.search.factory import create_provider
+        return self._get("search", name, create_provider, kwargs)
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    async def aclose(self) -> None:
+        """Close every pooled provider and empty the pool."""
+        instances, self._instances = self._instances, {}
+        for key, provider in instances.items():
+            try:
+                await provider.aclose()
+            except Exception as exc:  # keep closing the rest
+                logger.warning("Closing provider %s failed: %s", key[1], exc)
+
+    def _get(self, kind: str, name: str, factory, kwargs: dict) -> Any:
+        key = (kind, name.lower(), repr(sorted(kwargs.items())))
+        provider = self._instances.get(key)
+        if provider is None:
+            provider = factory(name, **kwargs)
+            self._instances[key] = provider
+            self.stats["created"] += 1
+        else:
+            self.stats["reused"] += 1
+        return provider
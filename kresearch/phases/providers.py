@@ -0,0 +1,103 @@
+"""Provider resolution for phases: pooled instances, hooks and wrappers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from kresearch.phases.llm_routing import routed_llm, site_routed_llm
+from kresearch.phases.provider_pool import ProviderPool
+from kresearch.phases.run_services import (
+    limiters,
+    llm_cache,
+    resilience,
+    single_flight,
+)
+
+
+def get_llm(ctx: dict[str, Any]):
+    """Return the configured LLM provider for a run.
+
+    Instances come from the context's :class:`ProviderPool`;
+    ``ctx["llm_factory"]``, when set, replaces the pool (trace recording
+    and replay use this).  Calls run under the run's
+    :class:`LimiterTree` (``"throttled"``), transient errors are retried
+    behind per-provider circuit breakers (``"resilient"``), calls are
+    hedged and fail over across providers when ``router.enabled``,
+    identical concurrent calls share one request (``"coalesced"``), with ``cache.enabled`` repeats
+    are served by ``"cached"``, and calls are metered into the session's
+    :class:`UsageLedger`.  Finally the ``routing`` table picks the
+    provider and model of each call site.
+    """
+    return site_routed_llm(ctx, lambda name: _llm_stack(ctx, name))
+
+
+def _llm_stack(ctx: dict[str, Any], name: str):
+    from kresearch.llm.factory import create_provider
+
+    config = ctx["config"]
+    factory = ctx.get("llm_factory") or provider_pool(ctx).llm
+    provider = routed_llm(ctx, name, lambda name: _resilient(
+        ctx, create_provider, create_provider(
+            "throttled", inner=factory(name), limiters=limiters(ctx)),
+    ))
+    flight = single_flight(ctx)
+    if flight is not None:
+        provider = create_provider(
+            "coalesced", inner=provider, flight=flight,
+            coalesce_sampled=config.coalesce.sampled,
+        )
+    store = llm_cache(ctx)
+    if store is not None:
+        provider = create_provider(
+            "cached", inner=provider, store=store,
+            cache_sampled=config.cache.cache_sampled,
+        )
+    session = ctx.get("session")
+    if session is not None:
+        provider = create_provider(
+            "metered", inner=provider, ledger=session.usage,
+            prices=config.budget.prices,
+        )
+    return provider
+
+
+def get_search(ctx: dict[str, Any]):
+    """Return the configured search provider (``ctx["search_factory"]``
+    overrides the pool like ``llm_factory``), throttled, resilient and
+    coalesced like LLM calls."""
+    from kresearch.search.factory import create_provider
+
+    factory = ctx.get("search_factory") or provider_pool(ctx).search
+    provider = _resilient(ctx, create_provider, create_provider(
+        "throttled", inner=factory(ctx["config"].search.provider),
+        limiters=limiters(ctx),
+    ))
+    flight = single_flight(ctx)
+    if flight is not None:
+        provider = create_provider("coalesced", inner=provider, flight=flight)
+    return provider
+
+
+def _resilient(ctx: dict[str, Any], create_provider, provider):
+    """Wrap *provider* in ``"resilient"`` (retries outside the limiter
+    slot, so a backing-off call does not hold one)."""
+    guard = resilience(ctx)
+    if guard is None:
+        return provider
+    return create_provider("resilient", inner=provider, resilience=guard)
+
+
+async def get_sandbox(ctx: dict[str, Any]):
+    """Return a code sandbox whose executions run under the limiters."""
+    from kresearch.sandbox.factory import create_sandbox
+    from kresearch.sandbox.throttled_sandbox import ThrottledSandbox
+
+    return ThrottledSandbox(await create_sandbox(ctx["config"]), limiters(ctx))
+
+
+def provider_pool(ctx: dict[str, Any]) -> ProviderPool:
+    """Return the context's provider pool, creating it on first use."""
+    pool = ctx.get("providers")
+    if pool is None:
+        pool = ctx["providers"] = ProviderPool()
+    return pool
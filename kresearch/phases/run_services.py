@@ -0,0 +1,76 @@
+"""Per-run services shared by provider wrappers, created lazily on the ctx."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Optional
+
+
+def limiters(ctx: dict[str, Any]):
+    """Return the run's :class:`LimiterTree`, building it on first use."""
+    tree = ctx.get("limiters")
+    if tree is None:
+        from kresearch.utils.limiter_tree import LimiterTree
+
+        tree = ctx["limiters"] = LimiterTree.from_config(ctx["config"])
+    return tree
+
+
+def single_flight(ctx: dict[str, Any]):
+    """Return the run's :class:`SingleFlight` group, or ``None`` when
+    coalescing is disabled."""
+    settings = getattr(ctx["config"], "coalesce", None)
+    if settings is None or not settings.enabled:
+        return None
+    flight = ctx.get("single_flight")
+    if flight is None:
+        from kresearch.utils.single_flight import SingleFlight
+
+        flight = ctx["single_flight"] = SingleFlight()
+    return flight
+
+
+def llm_cache(ctx: dict[str, Any]):
+    """Return the run's shared :class:`LLMCacheStore`, opening it on first
+    use, or ``None`` when caching is disabled."""
+    settings = getattr(ctx["config"], "cache", None)
+    if settings is None or not settings.enabled:
+        return None
+    store = ctx.get("llm_cache")
+    if store is None:
+        from kresearch.llm.cache_store import LLMCacheStore
+
+        store = LLMCacheStore(
+            _cache_path(ctx["config"]),
+            ttl_seconds=settings.ttl_seconds,
+            max_entries=settings.max_entries,
+        )
+        ctx["llm_cache"] = store
+    return store
+
+
+def _cache_path(config) -> Path:
+    path: Optional[Path] = config.cache.path
+    return Path(path) if path else Path(config.output_dir) / "llm_cache.sqlite3"
+
+
+def resilience(ctx: dict[str, Any]):
+    """Return the run's :class:`Resilience` (retries and circuit
+    breakers), or ``None`` when ``resilience.enabled`` is off."""
+    settings = getattr(ctx["config"], "resilience", None)
+    if settings is None or not settings.enabled:
+        return None
+    guard = ctx.get("resilience")
+    if guard is None:
+        from kresearch.utils.resilience import Resilience
+        from kresearch.utils.retry import RetryConfig
+
+        guard = ctx["resilience"] = Resilience(
+            RetryConfig(max_retries=settings.max_retries,
+                        base_delay=settings.base_delay,
+                        max_delay=settings.max_delay, jitter=settings.jitter),
+            failure_threshold=settings.failure_threshold,
+            reset_timeout=settings.reset_timeout,
+            event_bus=ctx.get("event_bus"),
+        )
+    return guard
@@ -0,0 +1,24 @@
+"""Console summary printed when a research run finishes."""
+
+from __future__ import annotations
+
+from kresearch.core.session import ResearchSession
+
+
+def print_summary(session: ResearchSession, elapsed: float) -> None:
+    """Print a brief summary after research completes."""
+    try:
+        from rich.console import Console
+        from rich.panel import Panel
+        console = Console()
+        stats = session.get_summary()
+        body = (
+            f"Session: {session.id[:8]}\n"
+            f"Phases completed: {stats['phase_index']}/5\n"
+            f"Mind map nodes: {stats.get('mind_map_stats', {}).get('total_nodes', 0)}\n"
+            f"Time: {elapsed:.1f}s"
+        )
+        console.print(Panel(body, title="Research Complete",
+                            border_style="green"))
+    except ImportError:
+        print(f"\n--- Research Complete ({elapsed:.1f}s) ---")
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import time
-from typing import Any
+from typing import Any, Optional
 
+from kresearch.core.budget import Budget
+from kresearch.core.checkpoint import CheckpointError, CheckpointStore, default_store
 from kresearch.core.session import ResearchSession
 from kresearch.core.event_bus import EventBus
+from kresearch.core.usage import usage_scope
+from kresearch.phases.run_summary import print_summary
 from kresearch.utils.logger import get_logger
+from kresearch.utils.tokenizer import preload_tokenizers
 
 logger = get_logger(__name__)
 
@@ -19,16 +24,69 @@ class PhaseRunner:
         self.ctx = ctx
         self.config = ctx["config"]
         self.event_bus: EventBus = ctx["event_bus"]
+        self.checkpoints: Optional[CheckpointStore] = default_store(self.config)
 
     async def run(self, query: str) -> ResearchSession:
-        """Run the full 5-phase pipeline for the given query."""
+        """Run the full 5-phase pipeline for the given query (recording a
+        trace when ``trace.record`` is enabled)."""
+        from kresearch.trace import start_recording
+
         session = ResearchSession(original_query=query)
+        recorder = start_recording(self.ctx, session.id)
+        try:
+            return await self._execute(session)
+        finally:
+            if recorder is not None:
+                await recorder.close()
+
+    async def replay(self, trace_path: str, realtime: bool = False,
+                     speed: float = 1.0) -> ResearchSession:
+        """Re-run a recorded query with every LLM and search call served
+        from the trace; ``realtime`` reproduces recorded latencies."""
+        from kresearch.trace import TraceReplayer
+
+        replayer = TraceReplayer(trace_path, realtime=realtime, speed=speed)
+        replayer.attach(self.ctx)
+        try:
+            return await self.run(replayer.query)
+        finally:
+            replayer.detach()
+            logger.info("Replay served %s", replayer.stats)
+
+    async def resume(self, session_id: str) -> ResearchSession:
+        """Reload a checkpointed session and continue at its first
+        incomplete phase.
+
+        Raises ``FileNotFoundError`` if no checkpoint exists for
+        *session_id* (or checkpointing is disabled).
+        """
+        if self.checkpoints is None:
+            raise FileNotFoundError("Checkpointing is disabled")
+        session = self.checkpoints.load(session_id)
+        logger.info("Resuming session %s at phase %d",
+                    session.id, session.current_phase + 1)
+        return await self._execute(session)
+
+    async def _execute(self, session: ResearchSession) -> ResearchSession:
+        """Run every phase not yet completed on *session*."""
         self.ctx["session"] = session
+        self.ctx["budget"] = Budget.from_config(
+            session.usage, getattr(self.config, "budget", None))
+        query = session.original_query
+        await preload_tokenizers([self.config.llm.model] + [
+            route.model for route in getattr(self.config, "routing", {}).values()
+            if route.model])
 
-        await self.event_bus.publish("research.start", {"query": query})
+        await self.event_bus.publish(
+            "research.start",
+            {"query": query, "session_id": session.id,
+             "resumed_from": session.current_phase},
+        )
         start = time.time()
 
-        phases = self._build_phases(session)
+        # ``current_phase`` counts completed phases, so it is also the
+        # index of the first phase that still has to run.
+        phases = self._build_phases(session)[session.current_phase:]
         for phase in phases:
             phase_name = phase.phase_name
             await self.event_bus.publish(
@@ -36,8 +94,10 @@ class PhaseRunner:
                 {"phase": phase.phase_number, "name": phase_name},
             )
             try:
-                await phase.execute()
+                with usage_scope(phase=f"phase{phase.phase_number}"):
+                    await phase.execute()
                 session.advance_phase()
+                self._checkpoint(session)
                 await self.event_bus.publish(
                     "phase.complete",
                     {"phase": phase.phase_number, "name": phase_name},
@@ -46,7 +106,8 @@ class PhaseRunner:
                 logger.error("Phase %s failed: %s", phase_name, exc)
                 await self.event_bus.publish(
                     "phase.failed",
-                    {"phase": phase.phase_number, "error": str(exc)},
+                    {"phase": phase.phase_number, "error": str(exc),
+                     "session_id": session.id},
                 )
                 break
 
@@ -55,9 +116,20 @@ class PhaseRunner:
             "research.complete",
             {"query": query, "elapsed": elapsed},
         )
-        self._print_summary(session, elapsed)
+        print_summary(session, elapsed)
         return session
 
+    def _checkpoint(self, session: ResearchSession) -> None:
+        """Persist *session*; a failed write never aborts the run."""
+        if self.checkpoints is None:
+            return
+        try:
+            self.checkpoints.save(session)
+        except OSError as exc:
+            logger.warning("Checkpoint for %s failed: %s", session.id, exc)
+        except CheckpointError as exc:
+            logger.error("Checkpoint for %s not written: %s", session.id, exc)
+
     def _build_phases(self, session: ResearchSession) -> list:
         """Instantiate and return all 5 phases in order."""
         from kresearch.phases.phase1.intent_parser import IntentParser
@@ -74,20 +146,3 @@ class PhaseRunner:
             ConflictDetector(*args),
             DiffusionWriter(*args),
         ]
-
-    def _print_summary(self, session: ResearchSession, elapsed: float) -> None:
-        """Print a brief summary after research completes."""
-        try:
-            from rich.console import Console
-            from rich.panel import Panel
-            console = Console()
-            stats = session.get_summary()
-            body = (
-                f"Phases completed: {stats['phase_index']}/5\n"
-                f"Mind map nodes: {stats.get('mind_map_stats', {}).get('total_nodes', 0)}\n"
-                f"Time: {elapsed:.1f}s"
-            )
-            console.print(Panel(body, title="Research Complete",
-                                border_style="green"))
-        except ImportError:
-            print(f"\n--- Research Complete ({elapsed:.1f}s) ---")
@@ -0,0 +1,39 @@
+"""Throttled sandbox - runs every execution under the run's limiters."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from kresearch.sandbox.base import ExecutionResult, Sandbox
+
+
+class ThrottledSandbox(Sandbox):
+    """Wraps another sandbox and bounds how many executions run at once.
+
+    Executions count against the ``"sandbox"`` provider of *limiters*
+    (normally the run's :class:`~kresearch.utils.limiter_tree.LimiterTree`)
+    and against its global limit.
+    """
+
+    def __init__(self, inner: Sandbox, limiters: Any) -> None:
+        self.inner = inner
+        self.limiters = limiters
+
+    async def execute_python(
+        self,
+        code: str,
+        timeout: int = 30,
+    ) -> ExecutionResult:
+        async with self.limiters.slot("sandbox"):
+            return await self.inner.execute_python(code, timeout=timeout)
+
+    async def execute_shell(
+        self,
+        cmd: str,
+        timeout: int = 30,
+    ) -> ExecutionResult:
+        async with self.limiters.slot("sandbox"):
+            return await self.inner.execute_shell(cmd, timeout=timeout)
+
+    async def cleanup(self) -> None:
+        await self.inner.cleanup()
@@ -37,13 +37,17 @@ __all__ = [
 # ---------------------------------------------------------------------------
 def _load_providers() -> None:
     from . import (  # noqa: F401
+        coalesced_provider,
         duckduckgo_provider,
         gemini_grounding,
         google_cse_provider,
         jina_provider,
+        mock_provider,
+        resilient_provider,
         scraper_provider,
         serpapi_provider,
         tavily_provider,
+        throttled_provider,
     )
 
 
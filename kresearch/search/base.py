@@ -51,3 +51,11 @@ class SearchProvider(ABC):
     def is_available(self) -> bool:
         """Check whether the provider is usable (SDK present, key set, etc.)."""
         return self._api_key is not None
+
+    async def aclose(self) -> None:
+        """Release the SDK / HTTP clients this provider holds open."""
+        from kresearch.utils.http import close_quietly
+
+        await close_quietly(getattr(self, "_client", None),
+                            getattr(self, "_http", None))
+        self._client = self._http = None
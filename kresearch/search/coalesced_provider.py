@@ -0,0 +1,34 @@
+"""Coalescing wrapper that shares identical in-flight searches."""
+
+from __future__ import annotations
+
+from kresearch.utils.single_flight import SingleFlight
+
+from .base import SearchProvider
+from .delegating_provider import DelegatingSearchProvider
+from .registry import register
+
+
+class CoalescedSearchProvider(DelegatingSearchProvider):
+    """Wraps another search provider so identical concurrent searches
+    (same query and ``max_results``) make one request; joined callers
+    receive their own copy of the results."""
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        inner: SearchProvider | None = None,
+        flight: SingleFlight | None = None,
+        **kwargs,
+    ):
+        super().__init__(api_key=api_key, inner=inner)
+        self.flight = flight or SingleFlight()
+
+    async def search(self, query: str, max_results: int = 10) -> list[dict]:
+        key = ("search", self.inner.name, query, max_results)
+        return await self.flight.do(
+            key, lambda: self.inner.search(query, max_results=max_results),
+        )
+
+
+register("coalesced", CoalescedSearchProvider)
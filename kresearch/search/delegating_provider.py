@@ -0,0 +1,46 @@
+"""Base class for wrappers that decorate another search provider."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .base import SearchProvider
+
+
+class DelegatingSearchProvider(SearchProvider):
+    """A :class:`SearchProvider` that forwards everything to *inner*.
+
+    Name, pricing and availability are *inner*'s and ``search`` passes
+    straight through, so a wrapper overrides only ``search``.
+    Subclasses pass the collaborators they cannot work without as
+    keywords; *inner* or any of them being ``None`` raises
+    ``ValueError``.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        inner: SearchProvider | None = None,
+        **required: Any,
+    ):
+        super().__init__(api_key=api_key)
+        missing = [name for name, value in {"inner": inner, **required}.items()
+                   if value is None]
+        if missing:
+            raise ValueError(f"{type(self).__name__} needs "
+                             + " and ".join(f"'{name}'" for name in missing))
+        self.inner = inner
+
+    @property
+    def name(self) -> str:
+        return self.inner.name
+
+    @property
+    def is_free(self) -> bool:
+        return self.inner.is_free
+
+    async def search(self, query: str, max_results: int = 10) -> list[dict]:
+        return await self.inner.search(query, max_results=max_results)
+
+    def is_available(self) -> bool:
+        return self.inner.is_available()
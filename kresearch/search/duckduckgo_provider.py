@@ -67,44 +67,28 @@ class DuckDuckGoSearchProvider(SearchProvider):
     # ------------------------------------------------------------------
 
     async def search(self, query: str, max_results: int = 10) -> list[dict]:
-        """Run a DuckDuckGo text search with retry logic."""
+        """Run a DuckDuckGo text search.
+
+        A single attempt: retries and back-off happen in the
+        ``"resilient"`` wrapper, without holding a worker thread.
+        """
         return await asyncio.to_thread(
             self._sync_search, query, max_results,
         )
 
-    def _sync_search(
-        self, query: str, max_results: int, _retries: int = 3,
-    ) -> list[dict]:
-        """Synchronous search with basic retry/back-off."""
+    def _sync_search(self, query: str, max_results: int) -> list[dict]:
+        """Synchronous search in a worker thread."""
         DDGS = _import_ddgs()
-        import time
-
-        last_err: Exception | None = None
-        for attempt in range(1, _retries + 1):
-            try:
-                with DDGS() as ddgs:
-                    raw_results = list(
-                        ddgs.text(
-                            query,
-                            region=self._region,
-                            safesearch=self._safesearch,
-                            max_results=max_results,
-                        )
-                    )
-                return self._normalise(raw_results)
-            except Exception as exc:
-                last_err = exc
-                logger.warning(
-                    "DuckDuckGo attempt %d/%d failed: %s",
-                    attempt, _retries, exc,
+        with DDGS() as ddgs:
+            raw_results = list(
+                ddgs.text(
+                    query,
+                    region=self._region,
+                    safesearch=self._safesearch,
+                    max_results=max_results,
                 )
-                if attempt < _retries:
-                    time.sleep(1.0 * attempt)
-
-        logger.error("DuckDuckGo search failed after %d retries", _retries)
-        if last_err:
-            raise last_err
-        return []
+            )
+        return self._normalise(raw_results)
 
     # ------------------------------------------------------------------
     # Helpers
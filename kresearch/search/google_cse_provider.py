@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import os
 
+from kresearch.utils.http import pooled_client
+
 from .base import SearchProvider
 from .registry import register
 
@@ -57,8 +59,6 @@ class GoogleCSESearchProvider(SearchProvider):
 
     async def search(self, query: str, max_results: int = 10) -> list[dict]:
         """Query Google CSE and return normalised results."""
-        import httpx
-
         # Google CSE caps at 10 per request; handle pagination if needed.
         num = min(max_results, 10)
         params = {
@@ -68,10 +68,10 @@ class GoogleCSESearchProvider(SearchProvider):
             "num": num,
         }
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.get(self.BASE_URL, params=params)
-            resp.raise_for_status()
-            data = resp.json()
+        client = pooled_client(self, timeout=30)
+        resp = await client.get(self.BASE_URL, params=params)
+        resp.raise_for_status()
+        data = resp.json()
 
         results: list[dict] = []
         for item in data.get("items", [])[:max_results]:
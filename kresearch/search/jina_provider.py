@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import os
 
+from kresearch.utils.http import pooled_client
+
 from .base import SearchProvider
 from .registry import register
 
@@ -57,13 +59,11 @@ class JinaSearchProvider(SearchProvider):
 
     async def search(self, query: str, max_results: int = 10) -> list[dict]:
         """Search the web via Jina's search endpoint."""
-        import httpx
-
         url = self.SEARCH_URL.format(query=query)
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.get(url, headers=self._headers())
-            resp.raise_for_status()
-            data = resp.json()
+        client = pooled_client(self, timeout=30)
+        resp = await client.get(url, headers=self._headers())
+        resp.raise_for_status()
+        data = resp.json()
 
         results: list[dict] = []
         items = data.get("data", data.get("results", []))
@@ -81,13 +81,11 @@ class JinaSearchProvider(SearchProvider):
 
     async def read_page(self, page_url: str) -> str:
         """Read and extract text from a page via Jina Reader."""
-        import httpx
-
         url = self.READER_URL.format(url=page_url)
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.get(url, headers=self._headers())
-            resp.raise_for_status()
-            data = resp.json()
+        client = pooled_client(self, timeout=30)
+        resp = await client.get(url, headers=self._headers())
+        resp.raise_for_status()
+        data = resp.json()
 
         return data.get("data", {}).get("content", "")
 
@@ -0,0 +1,70 @@
+"""Mock search provider: deterministic synthetic hits with simulated latency."""
+
+from __future__ import annotations
+
+import hashlib
+import random
+
+from kresearch.utils.latency_model import LatencyModel
+
+from .base import SearchProvider
+from .models import SearchResult
+from .registry import register
+
+_TERMS = ("report", "survey", "dataset", "analysis", "review", "study")
+
+
+class MockSearchProvider(SearchProvider):
+    """Returns synthetic results derived from the query alone.
+
+    Every query yields *results* hits (at most ``max_results``) whose
+    titles, URLs and snippets are seeded by the query text, after a
+    delay drawn from a seeded
+    :class:`~kresearch.utils.latency_model.LatencyModel` that may also
+    fail the call.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        latency: float = 0.0,
+        distribution: str = "lognormal",
+        spread: float = 0.5,
+        failure_rate: float = 0.0,
+        results: int = 5,
+        seed: int = 0,
+        **kwargs,
+    ):
+        super().__init__(api_key=api_key or "mock")
+        self.timing = LatencyModel(latency, distribution, spread, failure_rate, seed)
+        self.results = results
+
+    @property
+    def name(self) -> str:
+        return "mock"
+
+    @property
+    def is_free(self) -> bool:
+        return True
+
+    async def search(self, query: str, max_results: int = 10) -> list[dict]:
+        key = hashlib.sha256(query.encode()).hexdigest()
+        await self.timing.wait(key)
+        rng = random.Random(key)
+        hits: list[dict] = []
+        for i in range(min(self.results, max_results)):
+            term = rng.choice(_TERMS)
+            hits.append(SearchResult(
+                title=f"{query[:60]} - {term} {i + 1}",
+                url=f"https://example.org/{key[:8]}/{term}-{i + 1}",
+                snippet=(f"A {term} on {query[:80]} reports a figure of "
+                         f"{rng.randint(2, 90)}% in {rng.randint(2015, 2024)}."),
+                source=self.name,
+            ).to_dict())
+        return hits
+
+    def is_available(self) -> bool:
+        return True
+
+
+register("mock", MockSearchProvider)
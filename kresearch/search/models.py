@@ -40,6 +40,7 @@ SEARCH_PROVIDERS: dict[str, str] = {
     "google_cse": "Google Custom Search Engine (paid, requires GOOGLE_API_KEY + GOOGLE_CSE_ID)",
     "scraper": "Direct web scraper using aiohttp + BeautifulSoup4 (free)",
     "gemini_grounding": "Search via Google Gemini grounding API (uses Gemini credits)",
+    "mock": "Deterministic synthetic results for offline runs and benchmarks",
 }
 
-FREE_PROVIDERS: set[str] = {"duckduckgo", "jina", "scraper"}
+FREE_PROVIDERS: set[str] = {"duckduckgo", "jina", "scraper", "mock"}
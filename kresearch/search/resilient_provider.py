@@ -0,0 +1,36 @@
+"""Resilience wrapper: retries searches behind a per-provider breaker."""
+
+from __future__ import annotations
+
+from kresearch.utils.resilience import Resilience
+
+from .base import SearchProvider
+from .delegating_provider import DelegatingSearchProvider
+from .registry import register
+
+
+class ResilientSearchProvider(DelegatingSearchProvider):
+    """Wraps another search provider and retries its transient failures.
+
+    Shares the run's :class:`~kresearch.utils.resilience.Resilience`;
+    the breaker is keyed ``"search:<name>"``.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        inner: SearchProvider | None = None,
+        resilience: Resilience | None = None,
+        **kwargs,
+    ):
+        super().__init__(api_key=api_key, inner=inner, resilience=resilience)
+        self.resilience = resilience
+
+    async def search(self, query: str, max_results: int = 10) -> list[dict]:
+        return await self.resilience.call(
+            f"search:{self.name}",
+            lambda: self.inner.search(query, max_results=max_results),
+        )
+
+
+register("resilient", ResilientSearchProvider)
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import os
 
+from kresearch.utils.http import pooled_client
+
 from .base import SearchProvider
 from .registry import register
 
@@ -47,8 +49,6 @@ class SerpAPISearchProvider(SearchProvider):
 
     async def search(self, query: str, max_results: int = 10) -> list[dict]:
         """Query SerpAPI and return normalised results."""
-        import httpx
-
         params = {
             "q": query,
             "api_key": self._api_key,
@@ -56,10 +56,10 @@ class SerpAPISearchProvider(SearchProvider):
             "num": max_results,
         }
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.get(self.BASE_URL, params=params)
-            resp.raise_for_status()
-            data = resp.json()
+        client = pooled_client(self, timeout=30)
+        resp = await client.get(self.BASE_URL, params=params)
+        resp.raise_for_status()
+        data = resp.json()
 
         results: list[dict] = []
         for item in data.get("organic_results", [])[:max_results]:
@@ -0,0 +1,35 @@
+"""Throttling wrapper that runs every search under a per-provider limiter."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .base import SearchProvider
+from .delegating_provider import DelegatingSearchProvider
+from .registry import register
+
+
+class ThrottledSearchProvider(DelegatingSearchProvider):
+    """Wraps another search provider and bounds its concurrency.
+
+    *limiters* is any object whose ``slot(provider)`` returns an async
+    context manager, normally the run's
+    :class:`~kresearch.utils.limiter_tree.LimiterTree`.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        inner: SearchProvider | None = None,
+        limiters: Any = None,
+        **kwargs,
+    ):
+        super().__init__(api_key=api_key, inner=inner, limiters=limiters)
+        self.limiters = limiters
+
+    async def search(self, query: str, max_results: int = 10) -> list[dict]:
+        async with self.limiters.slot(self.name):
+            return await self.inner.search(query, max_results=max_results)
+
+
+register("throttled", ThrottledSearchProvider)
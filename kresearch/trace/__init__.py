@@ -0,0 +1,16 @@
+"""Trace recording and deterministic replay of research runs."""
+
+from .log import TraceWriter, read_trace, request_key
+from .recorder import TraceRecorder, start_recording
+from .replayer import ReplayedError, ReplayError, TraceReplayer
+
+__all__ = [
+    "TraceWriter",
+    "read_trace",
+    "request_key",
+    "TraceRecorder",
+    "start_recording",
+    "TraceReplayer",
+    "ReplayError",
+    "ReplayedError",
+]
@@ -0,0 +1,32 @@
+"""Install and restore the ctx provider-factory hooks used by phases."""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+FACTORY_KEYS = ("llm_factory", "search_factory")
+
+
+def current_factories(ctx: dict) -> tuple[Callable, Callable]:
+    """Return the (llm, search) factories *ctx* currently resolves to."""
+    from kresearch.phases.providers import provider_pool
+
+    pool = provider_pool(ctx)
+    return (ctx.get("llm_factory") or pool.llm,
+            ctx.get("search_factory") or pool.search)
+
+
+def install_factories(ctx: dict, llm: Callable, search: Callable) -> dict[str, Any]:
+    """Point *ctx* at new factories; return what they replaced."""
+    previous = {key: ctx.get(key) for key in FACTORY_KEYS}
+    ctx["llm_factory"], ctx["search_factory"] = llm, search
+    return previous
+
+
+def restore_factories(ctx: dict, previous: dict[str, Any]) -> None:
+    """Undo :func:`install_factories`."""
+    for key, value in previous.items():
+        if value is None:
+            ctx.pop(key, None)
+        else:
+            ctx[key] = value
@@ -0,0 +1,64 @@
+"""Trace log: compact JSON-lines storage for recorded runs."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+# Ids are random per run; mask them so prompts from a replayed run
+# produce the same key as the recorded one.
+_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+
+
+def request_key(kind: str, provider: str, request: dict) -> str:
+    """Return a stable digest identifying a provider request."""
+    text = json.dumps(request, sort_keys=True, default=str)
+    text = _UUID_RE.sub("<id>", text)
+    digest = hashlib.sha1(f"{kind}\0{provider}\0{text}".encode("utf-8"))
+    return digest.hexdigest()[:20]
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class TraceWriter:
+    """Appends trace entries to a JSON-lines file (gzipped for ``.gz``)."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = _open(self.path, "w")
+        self.entries = 0
+
+    def write(self, entry: dict[str, Any]) -> None:
+        self._fh.write(json.dumps(entry, separators=(",", ":"), default=str))
+        self._fh.write("\n")
+        self.entries += 1
+
+    def close(self) -> None:
+        if not self._fh.closed:
+            self._fh.close()
+
+
+def read_trace(path: Path | str) -> Iterator[dict[str, Any]]:
+    """Yield the entries of a trace file in recorded order."""
+    with _open(Path(path), "r") as fh:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
+
+def llm_request(messages, model, temperature, max_tokens, system_prompt,
+                **extra) -> dict:
+    """Return the keyword arguments of an LLM call as a trace request."""
+    return {"messages": messages, "model": model, "temperature": temperature,
+            "max_tokens": max_tokens, "system_prompt": system_prompt, **extra}
@@ -0,0 +1,84 @@
+"""TraceRecorder: capture events and provider calls of a live run."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from kresearch.core.event_bus import Event
+
+from .hooks import current_factories, install_factories, restore_factories
+from .log import TraceWriter
+from .recording import RecordingLLMProvider, RecordingSearchProvider
+
+
+class TraceRecorder:
+    """Writes every EventBus event and provider call to a trace file.
+
+    :meth:`attach` subscribes to ``*`` on the run's event bus and
+    installs ``llm_factory``/``search_factory`` hooks on *ctx* so each
+    provider a phase obtains is wrapped in a recording proxy.  Entry
+    timestamps are seconds since the recorder was attached.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.writer = TraceWriter(path)
+        self._start = time.monotonic()
+        self._ctx: Optional[dict] = None
+        self._previous: dict[str, Any] = {}
+        self._described: set[tuple[str, str]] = set()
+
+    @property
+    def path(self) -> Path:
+        return self.writer.path
+
+    def now(self) -> float:
+        return round(time.monotonic() - self._start, 6)
+
+    def write(self, entry: dict[str, Any]) -> None:
+        self.writer.write(entry)
+
+    def describe(self, kind: str, name: str, **meta: Any) -> None:
+        """Record provider metadata (once per provider) for replay."""
+        if (kind, name) not in self._described:
+            self._described.add((kind, name))
+            self.write({"t": "provider", "kind": kind, "name": name, **meta})
+
+    def attach(self, ctx: dict) -> None:
+        """Start recording the run driven by *ctx*."""
+        self._ctx = ctx
+        self._start = time.monotonic()
+        llm_factory, search_factory = current_factories(ctx)
+        self._previous = install_factories(
+            ctx,
+            lambda name, **kw: RecordingLLMProvider(llm_factory(name, **kw), self),
+            lambda name, **kw: RecordingSearchProvider(
+                search_factory(name, **kw), self),
+        )
+        ctx["event_bus"].subscribe("*", self._on_event)
+
+    async def close(self) -> None:
+        """Flush queued events, stop recording and close the trace file."""
+        if self._ctx is not None:
+            await self._ctx["event_bus"].drain()
+            self._ctx["event_bus"].unsubscribe("*", self._on_event)
+            restore_factories(self._ctx, self._previous)
+            self._ctx = None
+        self.writer.close()
+
+    async def _on_event(self, event: Event) -> None:
+        self.write({"t": "event", "at": self.now(),
+                    "type": event.type, "data": event.data})
+
+
+def start_recording(ctx: dict, session_id: str) -> Optional[TraceRecorder]:
+    """Attach a recorder for *session_id* if ``trace.record`` is enabled."""
+    config = ctx["config"]
+    settings = getattr(config, "trace", None)
+    if settings is None or not settings.record:
+        return None
+    root = settings.directory or Path(config.output_dir) / "traces"
+    recorder = TraceRecorder(Path(root) / f"{session_id}.jsonl.gz")
+    recorder.attach(ctx)
+    return recorder
@@ -0,0 +1,104 @@
+"""Recording proxies that log every LLM and search call to a trace."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable
+
+from kresearch.llm.base import LLMProvider
+from kresearch.llm.delegating_provider import DelegatingLLMProvider
+from kresearch.search.base import SearchProvider
+from kresearch.search.delegating_provider import DelegatingSearchProvider
+from kresearch.utils.transient import is_rate_limited, is_transient, retry_after
+
+from .log import llm_request
+
+if TYPE_CHECKING:
+    from .recorder import TraceRecorder
+
+
+def _entry(recorder: "TraceRecorder", kind: str, provider: str,
+           request: dict) -> dict:
+    return {"t": kind, "provider": provider, "request": request,
+            "at": recorder.now()}
+
+
+async def _record(recorder: "TraceRecorder", kind: str, provider: str,
+                  request: dict, call: Awaitable[Any]) -> Any:
+    entry = _entry(recorder, kind, provider, request)
+    started = time.monotonic()
+    try:
+        entry["response"] = await call
+        return entry["response"]
+    except Exception as exc:
+        _failed(entry, exc)
+        raise
+    finally:
+        entry["elapsed"] = round(time.monotonic() - started, 6)
+        recorder.write(entry)
+
+
+def _failed(entry: dict, exc: Exception) -> None:
+    entry["error"] = f"{type(exc).__name__}: {exc}"
+    entry["error_info"] = _error_info(exc)
+
+
+def _error_info(exc: Exception) -> dict:
+    """What the resilience layer needs to treat a replayed error alike."""
+    status = getattr(exc, "status_code", None) or getattr(
+        getattr(exc, "response", None), "status_code", None)
+    return {"type": type(exc).__name__,
+            "status_code": status if isinstance(status, int) else None,
+            "transient": is_transient(exc), "rate_limited": is_rate_limited(exc),
+            "retry_after": retry_after(exc)}
+
+
+class RecordingLLMProvider(DelegatingLLMProvider):
+    """Forwards to *inner* and writes every call to the recorder."""
+
+    def __init__(self, inner: LLMProvider, recorder: "TraceRecorder") -> None:
+        super().__init__(inner=inner, recorder=recorder)
+        self.recorder = recorder
+        recorder.describe("llm", inner.name, models=list(inner.available_models))
+
+    async def complete(self, messages, model, temperature=0.7, max_tokens=4096,
+                       json_mode=False, system_prompt=None) -> dict:
+        request = llm_request(messages, model, temperature, max_tokens,
+                               system_prompt, json_mode=json_mode)
+        return await _record(self.recorder, "llm", self.name, request,
+                             self.inner.complete(**request))
+
+    async def stream(self, messages, model, temperature=0.7, max_tokens=4096,
+                     system_prompt=None) -> AsyncIterator[str]:
+        request = llm_request(messages, model, temperature, max_tokens,
+                               system_prompt)
+        # Chunks pass through as they arrive; the entry -- with whatever
+        # was streamed before an error or an early close -- is written
+        # once the stream ends.
+        entry = _entry(self.recorder, "llm.stream", self.name, request)
+        entry["response"] = chunks = []
+        started = time.monotonic()
+        try:
+            async for chunk in self.inner.stream(**request):
+                chunks.append((round(time.monotonic() - started, 6), chunk))
+                yield chunk
+        except Exception as exc:
+            _failed(entry, exc)
+            raise
+        finally:
+            entry["elapsed"] = round(time.monotonic() - started, 6)
+            self.recorder.write(entry)
+
+
+class RecordingSearchProvider(DelegatingSearchProvider):
+    """Forwards to *inner* and writes every search to the recorder."""
+
+    def __init__(self, inner: SearchProvider, recorder: "TraceRecorder") -> None:
+        super().__init__(inner=inner, recorder=recorder)
+        self.recorder = recorder
+        recorder.describe("search", inner.name, free=inner.is_free)
+
+    async def search(self, query: str, max_results: int = 10) -> list[dict]:
+        request = {"query": query, "max_results": max_results}
+        return await _record(self.recorder, "search", self.name, request,
+                             self.inner.search(**request))
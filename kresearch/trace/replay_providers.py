@@ -0,0 +1,71 @@
+"""Replay proxies that serve LLM and search calls from a trace."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, AsyncIterator
+
+from kresearch.llm.base import LLMProvider
+from kresearch.search.base import SearchProvider
+
+from .log import llm_request
+
+if TYPE_CHECKING:
+    from .replayer import TraceReplayer
+
+
+class ReplayLLMProvider(LLMProvider):
+    """Serves recorded completions; never touches the network."""
+
+    def __init__(self, replayer: "TraceReplayer", name: str,
+                 models: list[str]) -> None:
+        super().__init__(api_key="replay")
+        self.replayer = replayer
+        self._name = name
+        self._models = models
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def available_models(self) -> list[str]:
+        return self._models
+
+    async def complete(self, messages, model, temperature=0.7, max_tokens=4096,
+                       json_mode=False, system_prompt=None) -> dict:
+        request = llm_request(messages, model, temperature, max_tokens,
+                               system_prompt, json_mode=json_mode)
+        return await self.replayer.serve("llm", self._name, request)
+
+    async def stream(self, messages, model, temperature=0.7, max_tokens=4096,
+                     system_prompt=None) -> AsyncIterator[str]:
+        request = llm_request(messages, model, temperature, max_tokens,
+                               system_prompt)
+        async for chunk in self.replayer.serve_stream(self._name, request):
+            yield chunk
+
+    def supports_json_mode(self) -> bool:
+        return True
+
+
+class ReplaySearchProvider(SearchProvider):
+    """Serves recorded search results; never touches the network."""
+
+    def __init__(self, replayer: "TraceReplayer", name: str,
+                 free: bool = True) -> None:
+        super().__init__(api_key="replay")
+        self.replayer = replayer
+        self._name = name
+        self._free = free
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def is_free(self) -> bool:
+        return self._free
+
+    async def search(self, query: str, max_results: int = 10) -> list[dict]:
+        request = {"query": query, "max_results": max_results}
+        return await self.replayer.serve("search", self._name, request)
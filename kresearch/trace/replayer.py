@@ -0,0 +1,149 @@
+"""TraceReplayer: re-drive a recorded run without network access."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+from collections import deque
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
+
+from .hooks import install_factories, restore_factories
+from .log import read_trace, request_key
+from .replay_providers import ReplayLLMProvider, ReplaySearchProvider
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayError(RuntimeError):
+    """The trace holds no recorded answer for a request."""
+
+
+class ReplayedError(RuntimeError):
+    """Raised in replay where the recorded call raised.
+
+    Carries the recorded error's class name, HTTP status, transience,
+    rate limiting and requested wait, so retries and breakers react as in the live run.
+    """
+
+    def __init__(self, message: str, info: Optional[dict] = None) -> None:
+        super().__init__(message)
+        info = info or {}
+        self.error_type: Optional[str] = info.get("type")
+        self.status_code: Optional[int] = info.get("status_code")
+        self.transient: Optional[bool] = info.get("transient")
+        self.rate_limited: Optional[bool] = info.get("rate_limited")
+        self.retry_after: Optional[float] = info.get("retry_after")
+
+
+class TraceReplayer:
+    """Serves provider calls from a trace written by ``TraceRecorder``.
+
+    Each request is matched by its :func:`request_key`; when the replayed
+    run drifts (a different prompt), the next unused call recorded for
+    the same provider is served instead and counted as a fallback.  With
+    ``realtime=True`` every answer is delayed by its recorded latency
+    divided by ``speed``.
+    """
+
+    def __init__(self, path: Path | str, realtime: bool = False,
+                 speed: float = 1.0) -> None:
+        self.path = Path(path)
+        self.realtime = realtime
+        self.speed = speed
+        self.query = ""
+        self.stats = {"exact": 0, "fallback": 0, "missing": 0}
+        self._providers: dict[str, dict[str, dict]] = {"llm": {}, "search": {}}
+        self._by_key: dict[str, deque] = {}
+        self._by_provider: dict[tuple[str, str], deque] = {}
+        self._ctx: Optional[dict] = None
+        self._previous: dict[str, Any] = {}
+        self._load()
+
+    def attach(self, ctx: dict) -> None:
+        """Route every provider *ctx* hands out to this trace."""
+        self._ctx = ctx
+        self._previous = install_factories(
+            ctx, self._create_llm, self._create_search)
+
+    def detach(self) -> None:
+        """Restore the factories that were active before :meth:`attach`."""
+        if self._ctx is not None:
+            restore_factories(self._ctx, self._previous)
+            self._ctx = None
+
+    async def serve(self, kind: str, provider: str, request: dict) -> Any:
+        """Return (or raise) the recorded outcome of *request*."""
+        entry = self._take(kind, provider, request)
+        if self.realtime:
+            await asyncio.sleep(entry.get("elapsed", 0.0) / self.speed)
+        if "error" in entry:
+            raise ReplayedError(entry["error"], entry.get("error_info"))
+        return copy.deepcopy(entry.get("response"))
+
+    async def serve_stream(self, provider: str, request: dict) -> AsyncIterator[str]:
+        """Yield the recorded chunks of a streamed completion."""
+        entry = self._take("llm.stream", provider, request)
+        previous = 0.0
+        for offset, chunk in entry.get("response") or []:
+            if self.realtime:
+                await asyncio.sleep(max(offset - previous, 0.0) / self.speed)
+                previous = offset
+            yield chunk
+        if "error" in entry:
+            raise ReplayedError(entry["error"], entry.get("error_info"))
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        for entry in read_trace(self.path):
+            kind = entry.get("t")
+            if kind == "provider":
+                self._providers[entry["kind"]].setdefault(entry["name"], entry)
+            elif kind == "event":
+                if entry["type"] == "research.start" and not self.query:
+                    self.query = entry["data"].get("query", "")
+            elif kind in ("llm", "llm.stream", "search"):
+                key = request_key(kind, entry["provider"], entry["request"])
+                self._by_key.setdefault(key, deque()).append(entry)
+                self._by_provider.setdefault(
+                    (kind, entry["provider"]), deque()).append(entry)
+
+    def _take(self, kind: str, provider: str, request: dict) -> dict:
+        queue = self._by_key.get(request_key(kind, provider, request))
+        entry = self._pop_unused(queue)
+        if entry is not None:
+            self.stats["exact"] += 1
+            return entry
+        entry = self._pop_unused(self._by_provider.get((kind, provider)))
+        if entry is None:
+            self.stats["missing"] += 1
+            raise ReplayError(f"No recorded {kind} call left for {provider}")
+        self.stats["fallback"] += 1
+        logger.debug("Replay fell back to recorded order for a %s call", kind)
+        return entry
+
+    @staticmethod
+    def _pop_unused(queue: Optional[deque]) -> Optional[dict]:
+        while queue:
+            entry = queue.popleft()
+            if not entry.get("_used"):
+                entry["_used"] = True
+                return entry
+        return None
+
+    def _resolve(self, kind: str, name: str) -> Optional[dict]:
+        recorded = self._providers[kind]
+        # A CI config may name another provider; use what was recorded.
+        return recorded.get(name) or next(iter(recorded.values()), None)
+
+    def _create_llm(self, name: str, **kwargs: Any) -> ReplayLLMProvider:
+        meta = self._resolve("llm", name) or {"name": name, "models": [""]}
+        return ReplayLLMProvider(self, meta["name"], meta["models"])
+
+    def _create_search(self, name: str, **kwargs: Any) -> ReplaySearchProvider:
+        meta = self._resolve("search", name) or {"name": name}
+        return ReplaySearchProvider(self, meta["name"], meta.get("free", True))
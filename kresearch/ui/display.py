@@ -33,6 +33,8 @@ class DisplayManager:
         self._current_phase: int = 0
         self._phase_name: str = ""
         self._results: list[dict] = []
+        self._draft_key: tuple = ()
+        self._draft_shown: int = 0
 
     # ------------------------------------------------------------------
     # Setup
@@ -46,6 +48,7 @@ class DisplayManager:
         self._bus.subscribe("retrieval.result", self._on_retrieval_result)
         self._bus.subscribe("task.progress", self._on_task_progress)
         self._bus.subscribe("session.complete", self._on_session_complete)
+        self._bus.subscribe("draft.delta", self._on_draft_delta)
 
     # ------------------------------------------------------------------
     # Event handlers
@@ -86,6 +89,19 @@ class DisplayManager:
                 f"  [info]{label}:[/info] {completed}/{total}"
             )
 
+    async def _on_draft_delta(self, event: Event) -> None:
+        # Events carry the full text, so coalesced deltas lose nothing.
+        text = event.data.get("text", "")
+        key = (event.data.get("stage", "draft"), event.data.get("iteration", 0))
+        if key != self._draft_key:
+            self._draft_key, self._draft_shown = key, 0
+            self._console.rule(f"[info]Draft {key[1]} ({key[0]})[/info]")
+        self._console.print(text[self._draft_shown:], end="",
+                            markup=False, highlight=False)
+        self._draft_shown = len(text)
+        if event.data.get("done"):
+            self._console.print()
+
     async def _on_session_complete(self, event: Event) -> None:
         self._console.print()
         self._console.rule("[success]Research Complete[/success]")
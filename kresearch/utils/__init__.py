@@ -8,6 +8,11 @@ from kresearch.utils.text import (
     slugify,
     deduplicate_texts,
 )
+from kresearch.utils.tokenizer import (
+    count_tokens,
+    truncate_to_tokens,
+    pack_within_budget,
+)
 from kresearch.utils.async_helpers import (
     gather_with_limit,
     run_sync,
@@ -16,6 +21,11 @@ from kresearch.utils.async_helpers import (
 )
 from kresearch.utils.retry import RetryConfig, retry, with_retry
 from kresearch.utils.rate_limiter import RateLimiter, TokenBucket
+from kresearch.utils.adaptive_limiter import AdaptiveLimiter
+from kresearch.utils.limiter_tree import LimiterTree
+from kresearch.utils.rate_limits import RateLimitRegistry, RateWindow
+from kresearch.utils.single_flight import SingleFlight
+from kresearch.utils.transient import is_overload
 from kresearch.utils.logger import setup_logger, get_logger
 from kresearch.utils.validators import (
     validate_query,
@@ -33,6 +43,10 @@ __all__ = [
     "extract_json",
     "slugify",
     "deduplicate_texts",
+    # tokens
+    "count_tokens",
+    "truncate_to_tokens",
+    "pack_within_budget",
     # async
     "gather_with_limit",
     "run_sync",
@@ -45,6 +59,12 @@ __all__ = [
     # rate limiter
     "RateLimiter",
     "TokenBucket",
+    "AdaptiveLimiter",
+    "is_overload",
+    "LimiterTree",
+    "RateLimitRegistry",
+    "RateWindow",
+    "SingleFlight",
     # logger
     "setup_logger",
     "get_logger",
@@ -0,0 +1,150 @@
+"""AIMD adaptive concurrency limiting for provider calls."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator
+
+from kresearch.utils.transient import is_overload
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that adapts with additive-increase/multiplicative-decrease.
+
+    Each successful call made while every slot is held by a call at the
+    backend raises the limit by ``1 / limit`` (about +1 per window of
+    calls).  An overload error, or a latency above ``tolerance`` times
+    the smoothed baseline for calls of the same *kind* (so short JSON
+    calls and long drafts are not compared), multiplies the limit by
+    ``backoff``; further cuts are ignored for one baseline latency so a
+    burst of failures counts as a single signal.  Callers wrap each
+    request in ``slot()``, or ``acquire`` and then :meth:`measure` it.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        backoff: float = 0.5,
+        tolerance: float = 2.0,
+        smoothing: float = 0.2,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, min_limit)
+        self.limit = float(min(max(initial, min_limit), self.max_limit))
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.in_flight = 0
+        self.active = 0  # held slots whose call has reached the backend
+        self._waiters: deque[asyncio.Future] = deque()
+        self._baselines: dict[str, float] = {}
+        self._hold_until = 0.0
+        self.stats = {"calls": 0, "increases": 0, "decreases": 0, "overloads": 0}
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for fut in self._waiters if not fut.done())
+
+    @asynccontextmanager
+    async def slot(self, kind: str = "") -> AsyncIterator[None]:
+        """Hold one unit of concurrency and feed the call's outcome back."""
+        await self.acquire()
+        try:
+            with self.measure(kind):
+                yield
+        finally:
+            self.release()
+
+    @contextmanager
+    def measure(self, kind: str = "") -> Iterator[None]:
+        """Time a call of *kind* at the backend (its slot already held)."""
+        self.active += 1
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as exc:
+            if is_overload(exc):
+                self.on_overload()
+            raise
+        else:
+            self.on_success(time.monotonic() - started, kind)
+        finally:
+            self.active -= 1
+
+    async def acquire(self) -> None:
+        if self.in_flight < int(self.limit) and not self.queued:
+            self.in_flight += 1
+            return
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self.release()  # granted just before we were cancelled
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < int(self.limit):
+            fut = self._waiters.popleft()
+            if not fut.done():
+                self.in_flight += 1
+                fut.set_result(None)
+
+    def on_success(self, latency: float, kind: str = "") -> None:
+        """Record a successful call of *kind* that took *latency* seconds."""
+        self.stats["calls"] += 1
+        baseline = self._baselines.get(kind)
+        self._baselines[kind] = latency if baseline is None else (
+            baseline + self.smoothing * (latency - baseline))
+        if baseline is not None and latency > baseline * self.tolerance:
+            self._decrease()
+        elif self.active >= int(self.limit) and self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self.stats["increases"] += 1
+
+    def on_overload(self) -> None:
+        """Record a call that failed with a rate limit, overload or timeout."""
+        self.stats["overloads"] += 1
+        self._decrease()
+
+    def metrics(self) -> dict:
+        return {"limit": int(self.limit), "in_flight": self.in_flight,
+                "queued": self.queued, "latency": self._slowest(),
+                **self.stats}
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now < self._hold_until:
+            return
+        self.limit = max(float(self.min_limit), self.limit * self.backoff)
+        self._hold_until = now + (self._slowest() or 1.0)
+        self.stats["decreases"] += 1
+
+    def _slowest(self) -> float:
+        return max(self._baselines.values(), default=0.0)
+
+
+class AdaptiveLimiterRegistry:
+    """One :class:`AdaptiveLimiter` per ``(provider, model)`` pair."""
+
+    def __init__(self, **settings) -> None:
+        self.settings = settings
+        self._limiters: dict[tuple[str, str], AdaptiveLimiter] = {}
+
+    def get(self, provider: str, model: str = "") -> AdaptiveLimiter:
+        key = (provider.lower(), model)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = self._limiters[key] = AdaptiveLimiter(**self.settings)
+        return limiter
+
+    def metrics(self) -> dict[str, dict]:
+        return {f"{p}/{m}" if m else p: limiter.metrics()
+                for (p, m), limiter in sorted(self._limiters.items())}
@@ -0,0 +1,79 @@
+"""CircuitBreaker: fail fast while a backend keeps failing."""
+
+from __future__ import annotations
+
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a backend whose circuit is open."""
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(f"{name} is unavailable (circuit open, "
+                         f"retry in {retry_after:.1f}s)")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Three-state breaker counting consecutive failures.
+
+    After *failure_threshold* consecutive failures the circuit opens and
+    :meth:`check` raises :class:`CircuitOpenError` for *reset_timeout*
+    seconds.  Then one trial call is let through (half-open): success
+    closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5,
+                 reset_timeout: float = 30.0) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    def check(self) -> None:
+        """Raise :class:`CircuitOpenError` unless a call may proceed."""
+        if self.state == CLOSED:
+            return
+        wait = self._opened_at + self.reset_timeout - time.monotonic()
+        if self.state == OPEN and wait <= 0:
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return
+        raise CircuitOpenError(self.name, max(wait, 0.0))
+
+    def record_success(self) -> str:
+        """Note a successful call; return the resulting state."""
+        self.failures = 0
+        self._probing = False
+        self.state = CLOSED
+        return self.state
+
+    def record_failure(self) -> str:
+        """Note a failed call; return the resulting state."""
+        self.failures += 1
+        self._probing = False
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.opened += 1
+            self.state = OPEN
+            self._opened_at = time.monotonic()
+        return self.state
+
+    def release(self) -> None:
+        """Give up a half-open trial slot without a verdict (cancellation,
+        or an error that says nothing about the backend's health)."""
+        self._probing = False
+
+    def metrics(self) -> dict:
+        return {"state": self.state, "failures": self.failures,
+                "opened": self.opened}
@@ -0,0 +1,42 @@
+"""Pooled HTTP clients shared by provider adapters."""
+
+from __future__ import annotations
+
+import inspect
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def pooled_client(owner: Any, timeout: float = 30.0):
+    """Return *owner*'s long-lived ``httpx.AsyncClient``.
+
+    The client is created on first use and stored as ``owner._http`` so
+    keep-alive connections (and their TLS sessions) are reused across
+    calls instead of being rebuilt per request.  Close it with
+    :func:`close_quietly`.
+    """
+    import httpx
+
+    client = getattr(owner, "_http", None)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(timeout=timeout)
+        owner._http = client
+    return client
+
+
+async def close_quietly(*resources: Any) -> None:
+    """Close each resource via ``aclose()``/``close()``, logging failures."""
+    for resource in resources:
+        if resource is None:
+            continue
+        closer = getattr(resource, "aclose", None) or getattr(resource, "close", None)
+        if closer is None:
+            continue
+        try:
+            result = closer()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as exc:  # shutdown must not fail on one client
+            logger.debug("Closing %r failed: %s", resource, exc)
@@ -0,0 +1,80 @@
+"""Seeded latency and failure draws for simulated (mock) providers."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+
+DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+
+class SimulatedFailure(ConnectionError):
+    """A failure injected by :class:`LatencyModel`; transient, so the
+    resilience layer retries it like a dropped connection."""
+
+
+class LatencyModel:
+    """Draws each simulated call's latency and whether it fails.
+
+    *latency* is the typical delay in seconds: the constant for
+    ``"fixed"``, the centre of ``latency * (1 ± spread)`` for
+    ``"uniform"``, the mean for ``"exponential"`` and the median for
+    ``"lognormal"`` (with *spread* as sigma).  Each call fails with
+    probability *failure_rate*.
+
+    Draws depend only on *seed*, the request key and how often that key
+    was seen before, so the same requests get the same draws whatever
+    order concurrent calls happen in -- and a retry gets a fresh draw.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        distribution: str = "lognormal",
+        spread: float = 0.5,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{distribution}'. "
+                             f"Available: {', '.join(DISTRIBUTIONS)}")
+        if not 0.0 <= failure_rate <= 1.0:
+            raise ValueError("failure_rate must be between 0 and 1")
+        self.latency = max(0.0, latency)
+        self.distribution = distribution
+        self.spread = spread
+        self.failure_rate = failure_rate
+        self.seed = seed
+        self._seen: dict[str, int] = {}
+        self.stats = {"calls": 0, "failures": 0, "latency": 0.0}
+
+    def draw(self, key: str) -> tuple[float, bool]:
+        """Return ``(seconds, fails)`` for the next call with *key*."""
+        attempt = self._seen.get(key, 0)
+        self._seen[key] = attempt + 1
+        rng = random.Random(f"{self.seed}:{key}:{attempt}")
+        return self._sample(rng), rng.random() < self.failure_rate
+
+    async def wait(self, key: str, extra: float = 0.0) -> None:
+        """Sleep for the next draw plus *extra* seconds; raise
+        :class:`SimulatedFailure` if the draw says the call fails."""
+        seconds, fails = self.draw(key)
+        seconds += max(0.0, extra)
+        self.stats["calls"] += 1
+        self.stats["latency"] += seconds
+        if seconds:
+            await asyncio.sleep(seconds)
+        if fails:
+            self.stats["failures"] += 1
+            raise SimulatedFailure(f"simulated failure ({key[:12]})")
+
+    def _sample(self, rng: random.Random) -> float:
+        if self.latency <= 0.0 or self.distribution == "fixed":
+            return self.latency
+        if self.distribution == "uniform":
+            return max(0.0, self.latency * rng.uniform(1 - self.spread,
+                                                       1 + self.spread))
+        if self.distribution == "exponential":
+            return rng.expovariate(1.0 / self.latency)
+        return self.latency * math.exp(rng.gauss(0.0, self.spread))
@@ -0,0 +1,127 @@
+"""LimiterTree: run-wide global -> provider -> model concurrency limits."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager, nullcontext
+from typing import Any, AsyncIterator, Optional
+
+from kresearch.utils.adaptive_limiter import AdaptiveLimiter, AdaptiveLimiterRegistry
+from kresearch.utils.rate_limits import RateGrant, RateLimitRegistry
+
+
+def _fixed(limit: int) -> AdaptiveLimiter:
+    """A limiter whose bounds coincide, so it never adapts."""
+    return AdaptiveLimiter(initial=limit, min_limit=limit, max_limit=limit)
+
+
+class LimiterTree:
+    """Hierarchy of concurrency limits that every provider call goes through.
+
+    ``slot(provider, model)`` holds one unit at each level that applies:
+    the model (an adaptive limiter, when *adaptive* is given), the
+    provider (when *provider_limits* names it) and the global limit.
+    Levels are acquired most specific first, so a call queued behind a
+    busy provider never holds a global slot.  The adaptive level times
+    only the call itself, against the baseline for its *kind*, and
+    counts it towards saturation only once every level is held.  Before
+    taking any of them, a call waits for room under the requests- and
+    tokens-per-minute limits of *rates* that apply to it.
+
+    Parameters
+    ----------
+    global_limit:
+        Maximum calls in flight across all providers.
+    provider_limits:
+        Maximum calls in flight per provider name (e.g. ``{"tavily": 5}``).
+    adaptive:
+        Optional per-model AIMD limiters.
+    rates:
+        Optional per-model requests/tokens per minute limits.
+    """
+
+    def __init__(
+        self,
+        global_limit: int,
+        provider_limits: Optional[dict[str, int]] = None,
+        adaptive: Optional[AdaptiveLimiterRegistry] = None,
+        rates: Optional[RateLimitRegistry] = None,
+    ) -> None:
+        self.root = _fixed(global_limit)
+        self.provider_limits = {
+            name.lower(): limit for name, limit in (provider_limits or {}).items()
+        }
+        self.adaptive = adaptive
+        self.rates = rates
+        self._providers: dict[str, AdaptiveLimiter] = {}
+
+    @classmethod
+    def from_config(cls, config: Any) -> LimiterTree:
+        """Build the tree from ``config.concurrency`` (including its
+        ``rate_limits``) and ``config.adaptive``."""
+        concurrency = config.concurrency
+        settings = getattr(config, "adaptive", None)
+        adaptive = None
+        if settings is not None and settings.enabled:
+            adaptive = AdaptiveLimiterRegistry(
+                **settings.model_dump(exclude={"enabled"}))
+        rates = None
+        if concurrency.rate_limits:
+            rates = RateLimitRegistry({
+                key: (limit.rpm, limit.tpm)
+                for key, limit in concurrency.rate_limits.items()})
+        return cls(concurrency.global_limit,
+                   concurrency.per_provider_limits, adaptive, rates)
+
+    def limits_tokens(self, provider: str, model: str = "") -> bool:
+        """Whether calls to *provider*/*model* count against a token limit,
+        so callers only estimate prompt sizes when it matters."""
+        window = self.rates.get(provider, model) if self.rates else None
+        return window is not None and bool(window.tpm)
+
+    @asynccontextmanager
+    async def slot(self, provider: str, model: str = "", tokens: int = 0,
+                   kind: str = "") -> AsyncIterator[Optional[RateGrant]]:
+        """Hold a slot at every level for one call to *provider*/*model*.
+
+        Yields the call's :class:`RateGrant` when a rate limit applies
+        (else ``None``): *tokens* are reserved up front, and the caller
+        settles the grant with the usage the provider reports.
+        """
+        window = self.rates.get(provider, model) if self.rates else None
+        grant = await window.acquire(tokens) if window is not None else None
+        adaptive = self.adaptive.get(provider, model) if self.adaptive else None
+        levels = [level for level in (adaptive, self._provider(provider), self.root)
+                  if level is not None]
+        held: list[AdaptiveLimiter] = []
+        try:
+            for level in levels:
+                await level.acquire()
+                held.append(level)
+            with adaptive.measure(kind) if adaptive is not None else nullcontext():
+                yield grant
+        finally:
+            for level in reversed(held):
+                level.release()
+
+    def rate_metrics(self) -> dict[str, dict]:
+        """Requests and tokens in the current minute per rate-limited model."""
+        return self.rates.metrics() if self.rates is not None else {}
+
+    def metrics(self) -> list[dict]:
+        """Live limit, in-flight and queued counts for every level in use."""
+        rows = [{"level": "global", "name": "all", "adaptive": False,
+                 **self.root.metrics()}]
+        rows += [{"level": "provider", "name": name, "adaptive": False,
+                  **limiter.metrics()}
+                 for name, limiter in sorted(self._providers.items())]
+        if self.adaptive is not None:
+            rows += [{"level": "model", "name": name, "adaptive": True, **m}
+                     for name, m in self.adaptive.metrics().items()]
+        return rows
+
+    def _provider(self, provider: str) -> Optional[AdaptiveLimiter]:
+        name = provider.lower()
+        limiter = self._providers.get(name)
+        if limiter is None and name in self.provider_limits:
+            limiter = self._providers[name] = _fixed(self.provider_limits[name])
+        return limiter
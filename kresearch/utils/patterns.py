@@ -0,0 +1,18 @@
+"""Lookup of dotted names (``phase4.resolve``) in exact-or-``prefix.*`` tables."""
+
+from __future__ import annotations
+
+from typing import Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def match_policy(policies: dict[str, T], name: str) -> Optional[T]:
+    """Return the entry of *policies* for *name*: its exact key, else the
+    first ``prefix.*`` pattern it falls under, else ``None``."""
+    if name in policies:
+        return policies[name]
+    for pattern, policy in policies.items():
+        if pattern.endswith(".*") and name.startswith(pattern[:-1]):
+            return policy
+    return None
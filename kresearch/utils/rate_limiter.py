@@ -4,12 +4,18 @@ from __future__ import annotations
 
 import asyncio
 import time
-from collections import deque
+
+from kresearch.utils.rate_limits import RateWindow
 
 
 class RateLimiter:
     """Sliding-window rate limiter based on requests per minute.
 
+    A single-limit front for :class:`~kresearch.utils.rate_limits.RateWindow`,
+    which sleeps without holding a lock, so waiters do not queue behind
+    one another; provider calls are limited per model through
+    :class:`~kresearch.utils.rate_limits.RateLimitRegistry` instead.
+
     Usage::
 
         limiter = RateLimiter(requests_per_minute=60)
@@ -24,38 +30,21 @@ class RateLimiter:
 
     def __init__(self, requests_per_minute: int) -> None:
         self.requests_per_minute = requests_per_minute
-        self._timestamps: deque[float] = deque()
-        self._lock = asyncio.Lock()
+        self._window = RateWindow(rpm=requests_per_minute)
 
     async def acquire(self) -> None:
         """Wait until a request slot is available, then record the timestamp."""
-        async with self._lock:
-            now = time.monotonic()
-            window = 60.0
-
-            # Discard timestamps older than the window
-            while self._timestamps and (now - self._timestamps[0]) >= window:
-                self._timestamps.popleft()
-
-            if len(self._timestamps) >= self.requests_per_minute:
-                # Wait until the oldest timestamp exits the window
-                sleep_for = window - (now - self._timestamps[0])
-                if sleep_for > 0:
-                    await asyncio.sleep(sleep_for)
-
-                # Clean again after sleeping
-                now = time.monotonic()
-                while self._timestamps and (now - self._timestamps[0]) >= window:
-                    self._timestamps.popleft()
-
-            self._timestamps.append(time.monotonic())
+        await self._window.acquire()
 
 
 class TokenBucket:
     """Async token-bucket rate limiter.
 
     Tokens are refilled continuously at *rate* tokens per second up to
-    *capacity*.
+    *capacity*.  A consumer takes its tokens at once -- the balance may
+    go negative -- and then sleeps, without holding a lock, until the
+    refill has paid them back, so concurrent consumers are served in
+    order without waiting on one another's sleeps.
 
     Usage::
 
@@ -76,7 +65,6 @@ class TokenBucket:
         self.capacity = capacity
         self.tokens = capacity
         self.last_refill = time.monotonic()
-        self._lock = asyncio.Lock()
 
     def _refill(self) -> None:
         """Add tokens based on elapsed time since last refill."""
@@ -90,17 +78,15 @@ class TokenBucket:
 
         Returns ``True`` once the tokens have been consumed.  If *n*
         exceeds *capacity* the call will still eventually succeed after
-        enough tokens have accumulated.
+        enough tokens have accumulated.  A cancelled wait returns its
+        tokens.
         """
-        async with self._lock:
-            self._refill()
-
-            while self.tokens < n:
-                # Calculate wait time for enough tokens
-                deficit = n - self.tokens
-                wait = deficit / self.rate
-                await asyncio.sleep(wait)
-                self._refill()
-
-            self.tokens -= n
-            return True
+        self._refill()
+        self.tokens -= n
+        if self.tokens < 0:
+            try:
+                await asyncio.sleep(-self.tokens / self.rate)
+            except asyncio.CancelledError:
+                self.tokens += n
+                raise
+        return True
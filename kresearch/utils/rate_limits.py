@@ -0,0 +1,128 @@
+"""Requests- and tokens-per-minute limits per provider and model."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+_WINDOW = 60.0
+
+RateLimit = tuple[Optional[int], Optional[int]]  # requests/min, tokens/min
+
+
+class RateGrant:
+    """One admitted call: when it started and the tokens charged to it."""
+
+    __slots__ = ("at", "tokens", "_window")
+
+    def __init__(self, window: RateWindow, at: float, tokens: int) -> None:
+        self._window = window
+        self.at = at
+        self.tokens = tokens
+
+    def settle(self, tokens: int) -> None:
+        """Replace the reserved estimate with the call's actual *tokens*."""
+        tokens = max(0, int(tokens))
+        freed = tokens < self.tokens
+        self.tokens = tokens
+        if freed:
+            self._window.wake()
+
+
+class RateWindow:
+    """Sliding one-minute window enforcing *rpm* requests and *tpm* tokens.
+
+    :meth:`acquire` works out how long both limits require it to wait,
+    sleeps without holding a lock and checks again, so waiters queue side
+    by side rather than one behind another; the check and the admission
+    run without an ``await`` in between.  Tokens are reserved up front
+    from an estimate and corrected with :meth:`RateGrant.settle` once
+    the provider reports usage, which also wakes waiters.  A call larger
+    than *tpm* is admitted on its own once the window is empty.
+    """
+
+    def __init__(self, rpm: Optional[int] = None, tpm: Optional[int] = None) -> None:
+        self.rpm = rpm
+        self.tpm = tpm
+        self._grants: deque[RateGrant] = deque()
+        self._freed = asyncio.Event()
+        self.stats = {"calls": 0, "waits": 0, "waited": 0.0}
+
+    async def acquire(self, tokens: int = 0) -> RateGrant:
+        """Wait until one more call of *tokens* fits, then admit it."""
+        tokens = max(0, int(tokens))
+        waiting = False
+        while True:
+            now = time.monotonic()
+            wait = self._wait(now, tokens)
+            if wait <= 0:
+                break
+            if not waiting:
+                waiting = True
+                self.stats["waits"] += 1
+            freed = self._freed
+            try:
+                await asyncio.wait_for(freed.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+            self.stats["waited"] += time.monotonic() - now
+        grant = RateGrant(self, now, tokens)
+        self._grants.append(grant)
+        self.stats["calls"] += 1
+        return grant
+
+    def wake(self) -> None:
+        """Let waiters re-check the window (a reservation shrank)."""
+        self._freed.set()
+        self._freed = asyncio.Event()
+
+    def _wait(self, now: float, tokens: int) -> float:
+        grants = self._grants
+        while grants and now - grants[0].at >= _WINDOW:
+            grants.popleft()
+        wait = 0.0
+        if self.rpm and len(grants) >= self.rpm:
+            wait = grants[len(grants) - self.rpm].at + _WINDOW - now
+        if self.tpm:
+            excess = sum(g.tokens for g in grants) + tokens - self.tpm
+            for grant in grants:
+                if excess <= 0:
+                    break
+                excess -= grant.tokens
+                wait = max(wait, grant.at + _WINDOW - now)
+        return wait
+
+    def metrics(self) -> dict:
+        self._wait(time.monotonic(), 0)
+        return {"rpm": self.rpm, "tpm": self.tpm, "requests": len(self._grants),
+                "tokens": sum(g.tokens for g in self._grants), **self.stats}
+
+
+class RateLimitRegistry:
+    """One :class:`RateWindow` per ``(provider, model)`` that has limits.
+
+    *limits* maps ``"provider:model"`` or ``"provider"`` to
+    ``(requests_per_minute, tokens_per_minute)``; either may be ``None``.
+    A ``"provider"`` entry applies to each of its models separately,
+    because providers meter every model on its own.
+    """
+
+    def __init__(self, limits: dict[str, RateLimit]) -> None:
+        self.limits = {key.lower(): limit for key, limit in limits.items()}
+        self._windows: dict[tuple[str, str], Optional[RateWindow]] = {}
+
+    def get(self, provider: str, model: str = "") -> Optional[RateWindow]:
+        """Return the window for *provider*/*model*, or ``None`` if unlimited."""
+        key = (provider.lower(), model)
+        if key not in self._windows:
+            limit = (self.limits.get(f"{key[0]}:{model.lower()}")
+                     if model else None) or self.limits.get(key[0])
+            self._windows[key] = RateWindow(*limit) if limit else None
+        return self._windows[key]
+
+    def metrics(self) -> dict[str, dict]:
+        return {f"{p}/{m}" if m else p: window.metrics()
+                for (p, m), window in sorted(self._windows.items())
+                if window is not None}
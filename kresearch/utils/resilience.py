@@ -0,0 +1,117 @@
+"""Resilience: jittered retries and per-backend circuit breakers for provider calls."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+from kresearch.utils.circuit_breaker import CLOSED, OPEN, CircuitBreaker
+from kresearch.utils.retry import RetryConfig
+from kresearch.utils.transient import is_rate_limited, is_transient, retry_after
+
+logger = logging.getLogger(__name__)
+T = TypeVar("T")
+
+
+class Resilience:
+    """Retries transient provider errors and keeps a breaker per backend.
+
+    Waits follow ``Retry-After`` when the backend sends it (giving up if
+    that exceeds ``max_delay``), else full-jitter exponential backoff.
+    Rate limits only back off; consecutive connection errors, timeouts
+    and 5xx responses open the backend's breaker, and calls then fail
+    fast with :class:`~kresearch.utils.circuit_breaker.CircuitOpenError`.
+    ``provider.retry`` and ``provider.breaker`` events go to *event_bus*.
+    """
+
+    def __init__(self, retry: Optional[RetryConfig] = None, failure_threshold: int = 5,
+                 reset_timeout: float = 30.0, event_bus: Any = None) -> None:
+        self.retry = retry or RetryConfig(jitter=True)
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.event_bus = event_bus
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self.retries = 0
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        found = self.breakers.get(name)
+        if found is None:
+            found = self.breakers[name] = CircuitBreaker(
+                name, self.failure_threshold, self.reset_timeout)
+        return found
+
+    async def call(self, name: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Return ``await fn()``, retried and guarded by *name*'s breaker."""
+        breaker = self.breaker(name)
+        for attempt in itertools.count():
+            breaker.check()
+            try:
+                result = await fn()
+            except BaseException as exc:
+                await self._failed(name, breaker, exc, attempt)
+                continue
+            await self._succeeded(name, breaker)
+            return result
+
+    async def stream(self, name: str, start: Callable[[], AsyncIterator[str]]
+                     ) -> AsyncIterator[str]:
+        """Yield from ``start()``; retried only until the first chunk."""
+        breaker = self.breaker(name)
+        for attempt in itertools.count():
+            breaker.check()
+            started = False
+            try:
+                async for chunk in start():
+                    if not started:
+                        started = True
+                        await self._succeeded(name, breaker)
+                    yield chunk
+                if not started:
+                    await self._succeeded(name, breaker)
+                return
+            except BaseException as exc:
+                if started:
+                    raise
+                await self._failed(name, breaker, exc, attempt)
+
+    async def _failed(self, name: str, breaker: CircuitBreaker,
+                      exc: BaseException, attempt: int) -> None:
+        """Record *exc*; sleep before the next attempt, or re-raise."""
+        if not isinstance(exc, Exception) or not is_transient(exc):
+            breaker.release()
+            raise exc
+        if is_rate_limited(exc):
+            breaker.release()  # the backend is up, just asking us to slow down
+        elif breaker.record_failure() == OPEN:
+            logger.warning("Circuit for %s opened after %d failures", name,
+                           breaker.failures)
+            await self._publish("provider.breaker", name=name, state=OPEN,
+                                error=str(exc))
+            raise exc
+        wait = retry_after(exc)
+        if wait is None:
+            wait = self.retry.delay_for(attempt)
+        if attempt >= self.retry.max_retries or wait > self.retry.max_delay:
+            raise exc
+        self.retries += 1
+        logger.warning("%s attempt %d failed (%s: %s); retrying in %.1fs", name,
+                       attempt + 1, type(exc).__name__, exc, wait)
+        await self._publish("provider.retry", name=name, attempt=attempt + 1,
+                            delay=wait, error=str(exc))
+        await asyncio.sleep(wait)
+
+    async def _succeeded(self, name: str, breaker: CircuitBreaker) -> None:
+        previous = breaker.state
+        breaker.record_success()
+        if previous != CLOSED:
+            logger.info("Circuit for %s closed", name)
+            await self._publish("provider.breaker", name=name, state=CLOSED)
+
+    async def _publish(self, event_type: str, **data: Any) -> None:
+        if self.event_bus is not None:
+            await self.event_bus.publish(event_type, data)
+
+    def metrics(self) -> dict[str, dict]:
+        return {name: b.metrics() for name, b in sorted(self.breakers.items())}
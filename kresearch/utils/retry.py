@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import functools
 import logging
+import random
 from dataclasses import dataclass, field
 from typing import Any, Callable, Coroutine, TypeVar
 
@@ -23,17 +24,23 @@ class RetryConfig:
     base_delay: float = 1.0
     max_delay: float = 30.0
     exponential: bool = True
+    jitter: bool = False
     retryable_exceptions: tuple[type[BaseException], ...] = field(
         default_factory=lambda: (Exception,),
     )
 
     def delay_for(self, attempt: int) -> float:
-        """Return the delay (in seconds) for the given *attempt* number."""
+        """Return the delay (in seconds) for the given *attempt* number.
+
+        With *jitter* ("full jitter") the delay is drawn uniformly from
+        zero up to that value, so concurrent callers spread out.
+        """
         if self.exponential:
             delay = self.base_delay * (2 ** attempt)
         else:
             delay = self.base_delay
-        return min(delay, self.max_delay)
+        delay = min(delay, self.max_delay)
+        return random.uniform(0.0, delay) if self.jitter else delay
 
 
 async def retry(
@@ -0,0 +1,65 @@
+"""SingleFlight: share one in-flight call between identical concurrent requests."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that carry the same key.
+
+    The first caller for a key (the leader) starts the call; callers
+    arriving while it is in flight await the same task and receive
+    ``share(result)`` (a deep copy by default), or the same exception.
+    Nothing is kept once the call settles, so this removes duplicate
+    work without caching.  The shared call is cancelled only when every
+    caller waiting on it has been cancelled.
+
+    Usage::
+
+        flight = SingleFlight()
+        results = await flight.do(("search", query), lambda: search(query))
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Any, list] = {}  # key -> [task, waiters]
+        self.stats = {"calls": 0, "shared": 0}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(
+        self,
+        key: Any,
+        fn: Callable[[], Awaitable[Any]],
+        share: Callable[[Any], Any] = copy.deepcopy,
+    ) -> Any:
+        """Run ``fn()`` for *key*, or join the identical call in flight."""
+        entry = self._calls.get(key)
+        leader = entry is None
+        if leader:
+            task = asyncio.ensure_future(fn())
+            entry = self._calls[key] = [task, 0]
+            task.add_done_callback(lambda _: self._forget(key, task))
+            self.stats["calls"] += 1
+        else:
+            self.stats["shared"] += 1
+        entry[1] += 1
+        try:
+            result = await asyncio.shield(entry[0])
+        except asyncio.CancelledError:
+            entry[1] -= 1
+            if entry[1] == 0 and not entry[0].done():
+                entry[0].cancel()
+            raise
+        return result if leader else share(result)
+
+    def metrics(self) -> dict:
+        return {"in_flight": self.in_flight, **self.stats}
+
+    def _forget(self, key: Any, task: asyncio.Future) -> None:
+        if self._calls.get(key, [None])[0] is task:
+            del self._calls[key]
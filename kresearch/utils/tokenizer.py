@@ -0,0 +1,150 @@
+"""Token counting with lazily loaded per-model tokenizers, and budget packing."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterable, Optional
+
+from kresearch.utils.text import count_tokens_approx
+
+logger = logging.getLogger(__name__)
+
+# Encoding for models tiktoken does not know (Claude, Gemini, Llama, ...):
+# not their own vocabulary, but far closer than a characters-per-token guess.
+_DEFAULT_ENCODING = "o200k_base"
+
+# A truncated item shorter than this is dropped rather than packed.
+_MIN_PARTIAL_TOKENS = 12
+
+# Longest a run waits for its tokenizers before counting approximately.
+_PRELOAD_TIMEOUT = 10.0
+
+# Encodings by name (``None`` when unavailable), and loads in progress.
+_encodings: dict[str, Optional[Any]] = {}
+_loads: dict[str, Future] = {}
+_loads_lock = threading.Lock()
+_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tokenizer")
+
+
+def _encoding_name(model: str) -> Optional[str]:
+    """Return *model*'s encoding name (no I/O); ``None`` without tiktoken."""
+    try:
+        from tiktoken.model import encoding_name_for_model
+    except ImportError:
+        return None
+    try:
+        return encoding_name_for_model(model)
+    except KeyError:
+        return _DEFAULT_ENCODING
+
+
+def _load(name: str) -> Optional[Any]:
+    """Load encoding *name*, reading (or first downloading) its vocabulary."""
+    try:
+        import tiktoken
+        _encodings[name] = tiktoken.get_encoding(name)
+    except Exception as exc:  # vocabulary download failed
+        logger.debug("No tokenizer %s: %s", name, exc)
+        _encodings[name] = None
+    return _encodings[name]
+
+
+def _start_load(name: str) -> Future:
+    with _loads_lock:  # one load per encoding, on the tokenizer thread
+        if name not in _loads:
+            _loads[name] = _loader.submit(_load, name)
+        return _loads[name]
+
+
+def _encoder(model: str) -> Optional[Any]:
+    """Return the encoding for *model*, or ``None`` to count approximately.
+
+    Inside an event loop an encoding that is not loaded yet is never
+    loaded in place -- that may download its vocabulary -- but on the
+    tokenizer thread, and callers fall back until it is ready.
+    """
+    name = _encoding_name(model)
+    if name is None:
+        return None
+    if name in _encodings:
+        return _encodings[name]
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _start_load(name).result()
+    _start_load(name)
+    return None
+
+
+async def preload_tokenizers(models: Iterable[str]) -> None:
+    """Load the encodings for *models* off the event loop, waiting at most
+    ``_PRELOAD_TIMEOUT`` seconds, so counts are exact from the first call."""
+    names = {_encoding_name(model or "") for model in models} - {None}
+    pending = [asyncio.wrap_future(_start_load(name)) for name in names
+               if name not in _encodings]
+    try:
+        await asyncio.wait_for(asyncio.shield(asyncio.gather(*pending)),
+                               _PRELOAD_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("Tokenizers not loaded after %.0fs; counting "
+                       "approximately until they are", _PRELOAD_TIMEOUT)
+
+
+def count_tokens(text: str, model: str = "") -> int:
+    """Return the number of tokens in *text* for *model*.
+
+    Uses the model's tiktoken encoding, loaded on first use and cached;
+    falls back to :func:`count_tokens_approx` without one (or while it
+    is still loading, see :func:`preload_tokenizers`).
+    """
+    encoder = _encoder(model or "")
+    if encoder is None:
+        return count_tokens_approx(text)
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = "") -> str:
+    """Return the longest prefix of *text* within *max_tokens* tokens."""
+    if max_tokens <= 0:
+        return ""
+    encoder = _encoder(model or "")
+    if encoder is None:
+        return text[:max_tokens * 4]
+    tokens = encoder.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoder.decode(tokens[:max_tokens])
+
+
+def pack_within_budget(
+    items: list[str],
+    max_tokens: int,
+    model: str = "",
+    separator: str = "\n---\n",
+    truncate: bool = True,
+) -> list[str]:
+    """Select items, in rank order, whose joined text fits *max_tokens*.
+
+    Each item costs its own tokens plus the *separator*'s.  With
+    *truncate*, the first item that does not fit is cut to the remaining
+    budget and packing stops; otherwise it is skipped and later (smaller)
+    items are still tried.
+    """
+    sep_tokens = count_tokens(separator, model) if separator else 0
+    packed: list[str] = []
+    remaining = max_tokens
+    for item in items:
+        cost = count_tokens(item, model) + (sep_tokens if packed else 0)
+        if cost <= remaining:
+            packed.append(item)
+            remaining -= cost
+            continue
+        if truncate:
+            room = remaining - (sep_tokens if packed else 0)
+            if room >= _MIN_PARTIAL_TOKENS:
+                packed.append(truncate_to_tokens(item, room, model))
+            break
+    return packed
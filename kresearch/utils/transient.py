@@ -0,0 +1,91 @@
+"""Classification of provider errors: transient or not, and requested waits."""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import re
+import time
+from typing import Optional
+
+# HTTP statuses that mean "slow down" rather than "bad request".
+_OVERLOAD_STATUS = {429, 503, 529}
+_OVERLOAD_NAMES = ("ratelimit", "timeout", "overloaded")
+_TRANSIENT_NAMES = ("connect", "timeout", "ratelimit", "unavailable", "overloaded")
+_RATE_LIMIT_NAMES = ("ratelimit", "toomanyrequests")
+_RESET_HEADERS = ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_UNIT = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def is_overload(exc: BaseException) -> bool:
+    """Return ``True`` if *exc* signals a rate limit, overload or timeout."""
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError)):
+        return True
+    status = getattr(exc, "status_code", None) or getattr(
+        getattr(exc, "response", None), "status_code", None)
+    if status in _OVERLOAD_STATUS:
+        return True
+    name = type(exc).__name__.lower()
+    return any(marker in name for marker in _OVERLOAD_NAMES)
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Return ``True`` for errors worth retrying: overloads, 5xx
+    responses and connection failures.  An explicit boolean
+    ``transient`` attribute (set on replayed errors) decides first."""
+    flag = getattr(exc, "transient", None)
+    if isinstance(flag, bool):
+        return flag
+    if is_overload(exc) or isinstance(exc, ConnectionError):
+        return True
+    status = getattr(exc, "status_code", None) or getattr(
+        getattr(exc, "response", None), "status_code", None)
+    if isinstance(status, int) and status >= 500:
+        return True
+    name = type(exc).__name__.lower()
+    return any(marker in name for marker in _TRANSIENT_NAMES)
+
+
+def is_rate_limited(exc: BaseException) -> bool:
+    """Return ``True`` when the backend asked callers to slow down (429,
+    a rate-limit error, or a requested wait) rather than failing.  An
+    explicit boolean ``rate_limited`` attribute decides first."""
+    flag = getattr(exc, "rate_limited", None)
+    if isinstance(flag, bool):
+        return flag
+    status = getattr(exc, "status_code", None) or getattr(
+        getattr(exc, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    name = type(exc).__name__.lower()
+    return (any(marker in name for marker in _RATE_LIMIT_NAMES)
+            or retry_after(exc) is not None)
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """Return the seconds a backend asked callers to wait, or ``None``.
+
+    Reads a ``retry_after`` attribute, then the response's
+    ``retry-after-ms`` / ``Retry-After`` (seconds or HTTP date) headers,
+    then OpenAI-style ``x-ratelimit-reset-*`` durations such as ``6m0s``.
+    """
+    value = getattr(exc, "retry_after", None)
+    if isinstance(value, (int, float)):
+        return max(0.0, float(value))
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        if headers.get("retry-after-ms"):
+            return max(0.0, float(headers["retry-after-ms"]) / 1000)
+        raw = headers.get("retry-after")
+        if raw:
+            try:
+                return max(0.0, float(raw))
+            except ValueError:
+                when = email.utils.parsedate_to_datetime(raw)
+                return max(0.0, when.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+    resets = [sum(float(n) * _UNIT[u] for n, u in _DURATION.findall(str(v)))
+              for v in (headers.get(h) for h in _RESET_HEADERS) if v]
+    return max(resets) if resets else None